@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+Copyright (C) S. Merkel, Universite de Lille, France
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+# Benchmarks for the different stages of maskTiff4Maud, on synthetic detector
+# images. Runs without graphical interface. Typical use:
+#   python benchmark.py -o today.json
+#   python benchmark.py -o tomorrow.json --compare today.json
+
+import sys
+import argparse
+from argparse import RawTextHelpFormatter
+import os.path
+import time
+import json
+import platform
+import tempfile
+import shutil
+import tracemalloc
+import subprocess
+
+import numpy
+import fabio
+
+import maskTiff4Maud
+
+# Detector sizes (rows, columns) and data types
+detectors = {
+	"pilatus1m": (1043, 981, "int32"),
+	"2048": (2048, 2048, "uint16"),
+	"4096": (4096, 4096, "uint16"),
+	"eiger16m": (4362, 4148, "uint32"),
+}
+
+#################################################################
+#
+# Synthetic data
+#
+#################################################################
+
+"""
+Diffraction-like image: noisy background and a few Debye rings around the center
+"""
+def syntheticImage(nrows, ncols, dtype, seed=0):
+	rng = numpy.random.default_rng(seed)
+	y = numpy.arange(nrows, dtype=numpy.float32)[:,None] - nrows/2.
+	x = numpy.arange(ncols, dtype=numpy.float32)[None,:] - ncols/2.
+	radius = numpy.sqrt(x*x + y*y)
+	image = 100. * numpy.exp(-radius/max(nrows,ncols))
+	for ring in (0.15, 0.22, 0.31, 0.38):
+		r0 = ring*max(nrows,ncols)
+		image += 500. * numpy.exp(-(radius-r0)**2/8.)
+	image += rng.normal(0., 5., image.shape).astype(numpy.float32)
+	numpy.clip(image, 0, None, out=image)
+	return image.astype(dtype)
+
+"""
+Dioptas-like mask: beam stop, its arm, and gaps between detector modules
+"""
+def syntheticMask(nrows, ncols):
+	mask = numpy.zeros((nrows, ncols), dtype=numpy.uint8)
+	y = numpy.arange(nrows)[:,None] - nrows//2
+	x = numpy.arange(ncols)[None,:] - ncols//2
+	mask[(x*x + y*y) < (nrows//20)**2] = 1
+	mask[nrows//2-5:nrows//2+5, ncols//2:] = 1
+	# Pilatus-like modules of 195 x 487 pixels, with gaps of 17 and 7 pixels
+	for row in range(195, nrows, 195+17):
+		mask[row:row+17,:] = 1
+	for col in range(487, ncols, 487+7):
+		mask[:,col:col+7] = 1
+	return mask
+
+#################################################################
+#
+# Stages
+#
+#################################################################
+
+"""
+Prepares everything for one detector, returns a dictionnary with files and data
+"""
+def prepare(name, tmpdir):
+	nrows, ncols, dtype = detectors[name]
+	image = syntheticImage(nrows, ncols, dtype)
+	# Masks are stored rotated, as it often happens with Dioptas
+	mask = numpy.ascontiguousarray(numpy.rot90(syntheticMask(nrows, ncols), -1))
+	datafile = os.path.join(tmpdir, "%s.tif" % name)
+	maskfile = os.path.join(tmpdir, "%s.mask" % name)
+	maskTiff4Maud.writeTiff(image, datafile)
+	maskTiff4Maud.writeTiff(mask, maskfile)
+	return {"datafile": datafile, "maskfile": maskfile, "outfile": os.path.join(tmpdir, "%s-masked.tif" % name), "data": image, "mask": mask}
+
+"""
+Functions for each stage, they only use what other stages would have prepared
+"""
+def stageLoad(env):
+	return fabio.open(env["datafile"]).data
+
+def stageOrient(env):
+	maskTiff4Maud._orientedMaskCache.clear()
+	return maskTiff4Maud.getOrientedMask(env["mask"], 1, False, False)
+
+def stageValidate(env):
+	return maskTiff4Maud.validateData(env["data"], env["omask"], 10.)
+
+def stageMask(env):
+	return maskTiff4Maud.applyMask(env["data"], env["omask"], 10.)
+
+def stagePreview(env):
+	pyramid = maskTiff4Maud.imagePyramid(env["data"])
+	statistics = maskTiff4Maud.imageStatistics(env["data"])
+	return pyramid.getLevel(pyramid.levelFor(max(pyramid.shape), 1500)), statistics.median()
+
+def stageAutoOrient(env):
+	return maskTiff4Maud.autoOrientMask(env["data"], env["mask"])
+
+def stageWrite(env):
+	maskTiff4Maud.writeTiff(env["masked"], env["outfile"])
+
+stages = [("load", stageLoad), ("orient", stageOrient), ("validate", stageValidate), ("mask", stageMask), ("preview", stagePreview), ("autoorient", stageAutoOrient), ("write", stageWrite)]
+
+"""
+Times one stage: best and median of repeat runs, and peak memory allocated
+during one extra run, measured with tracemalloc (not used while timing)
+"""
+def measure(function, env, repeat):
+	times = []
+	for i in range(repeat):
+		start = time.perf_counter()
+		function(env)
+		times.append(time.perf_counter() - start)
+	tracemalloc.start()
+	tracemalloc.reset_peak()
+	function(env)
+	current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return min(times), float(numpy.median(times)), peak
+
+"""
+Runs all stages for one detector, returns a list of results
+"""
+def benchmarkDetector(name, tmpdir, repeat):
+	env = prepare(name, tmpdir)
+	env["omask"] = stageOrient(env)
+	env["masked"] = stageMask(env)
+	nrows, ncols, dtype = detectors[name]
+	megapixels = nrows*ncols/1.e6
+	results = []
+	for stage, function in stages:
+		best, median, peak = measure(function, env, repeat)
+		results.append({"detector": name, "shape": [nrows, ncols], "dtype": dtype, "stage": stage, "best": best, "median": median, "peakmemory": peak, "mpixelspersecond": megapixels/best if (best > 0) else None})
+		print("%-10s %-11s %8.1f ms (median %8.1f ms) %8.1f Mpixels/s  peak memory %8.1f MB" % (name, stage, best*1000., median*1000., megapixels/best if (best > 0) else 0., peak/1.e6))
+	return results
+
+# Cold start of the different entry points, each in a new python process
+startupCommands = [
+	("import core", ["-c", "import maskTiff4Maud"]),
+	("command line", ["maskTiff4Maud.py", "--help"]),
+	("import gui", ["-c", "import maskTiff4MaudGui"]),
+	("gui window", ["-c", "import maskTiff4MaudGui, PyQt5.QtWidgets; app = PyQt5.QtWidgets.QApplication([]); form = maskTiff4MaudGui.clearMaskGui()"]),
+]
+
+"""
+Measures the cold start time of the entry points, returns a list of results
+The GUI is created with Qt offscreen platform, so that no display is needed
+Entry points that can not start (missing PyQt5 for instance) are skipped
+"""
+def benchmarkStartup(repeat):
+	path = os.path.dirname(os.path.abspath(maskTiff4Maud.__file__))
+	environment = dict(os.environ)
+	environment["QT_QPA_PLATFORM"] = "offscreen"
+	results = []
+	for stage, arguments in startupCommands:
+		times = []
+		for i in range(repeat):
+			start = time.perf_counter()
+			process = subprocess.run([sys.executable] + arguments, cwd=path, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+			times.append(time.perf_counter() - start)
+			if (process.returncode != 0):
+				break
+		if (process.returncode != 0):
+			lines = process.stderr.decode(errors="replace").strip().splitlines()
+			print("%-10s %-12s failed: %s" % ("startup", stage, lines[-1] if (len(lines) > 0) else "error %d" % process.returncode))
+			continue
+		results.append({"detector": "startup", "shape": None, "dtype": None, "stage": stage, "best": min(times), "median": float(numpy.median(times)), "peakmemory": 0, "mpixelspersecond": None})
+		print("%-10s %-12s %7.1f ms (median %8.1f ms)" % ("startup", stage, min(times)*1000., numpy.median(times)*1000.))
+	return results
+
+"""
+Compares results with those of a previous run
+Returns the number of stages slower by more than threshold (relative)
+"""
+def compare(results, previousfile, threshold):
+	with open(previousfile) as f:
+		previous = json.load(f)
+	reference = {}
+	for result in previous["results"]:
+		reference[(result["detector"], result["stage"])] = result
+	nslower = 0
+	print("\nComparison with %s" % previousfile)
+	for result in results:
+		old = reference.get((result["detector"], result["stage"]))
+		if (old is None):
+			continue
+		ratio = result["best"] / old["best"] if (old["best"] > 0) else 1.
+		memratio = 1.*result["peakmemory"] / old["peakmemory"] if (old["peakmemory"] > 0) else 1.
+		flag = ""
+		if (ratio > 1.+threshold):
+			flag = "  SLOWER"
+			nslower += 1
+		elif (ratio < 1./(1.+threshold)):
+			flag = "  faster"
+		print("%-10s %-11s time x%.2f  memory x%.2f%s" % (result["detector"], result["stage"], ratio, memratio, flag))
+	return nslower
+
+#################################################################
+#
+# Main subroutines
+#
+#################################################################
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Benchmarks for maskTiff4Maud, on synthetic detector images.\n\nDetectors: %s" % ", ".join(detectors), formatter_class=RawTextHelpFormatter)
+	parser.add_argument('detectors', nargs='*', default=list(detectors), help="detectors to test (default: all)")
+	parser.add_argument('-n', '--repeat', type=int, default=3, help="number of runs of each stage (default: 3)")
+	parser.add_argument('-o', '--output', default=None, help="save results in this JSON file")
+	parser.add_argument('--compare', default=None, help="compare with results saved in this JSON file")
+	parser.add_argument('--no-startup', action='store_true', dest='nostartup', help="do not measure start up times")
+	parser.add_argument('--threshold', type=float, default=0.2, help="relative slowdown reported as a regression (default: 0.2)")
+	args = parser.parse_args()
+	for name in args.detectors:
+		if (name not in detectors):
+			parser.error("unknown detector %s" % name)
+
+	tmpdir = tempfile.mkdtemp(prefix="maskTiff4Maud-benchmark-")
+	results = []
+	if (not args.nostartup):
+		results.extend(benchmarkStartup(args.repeat))
+	try:
+		for name in args.detectors:
+			results.extend(benchmarkDetector(name, tmpdir, args.repeat))
+	finally:
+		shutil.rmtree(tmpdir, ignore_errors=True)
+
+	if (args.output is not None):
+		info = {"date": time.strftime("%Y-%m-%d %H:%M:%S"), "python": platform.python_version(), "numpy": numpy.__version__, "fabio": fabio.version, "machine": platform.machine(), "processor": platform.processor(), "system": platform.system(), "ncpu": os.cpu_count(), "repeat": args.repeat}
+		with open(args.output, "w") as f:
+			json.dump({"info": info, "results": results}, f, indent=1)
+	if (args.compare is not None):
+		nslower = compare(results, args.compare, args.threshold)
+		sys.exit(1 if (nslower > 0) else 0)
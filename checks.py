@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+Copyright (C) S. Merkel, Universite de Lille, France
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+# Regression checks for maskTiff4Maud, on synthetic detector images. Runs
+# without graphical interface, exits with a non-zero status if a check fails.
+# Typical use:
+#   python checks.py
+#   python checks.py autoorient
+
+import sys
+import argparse
+from argparse import RawTextHelpFormatter
+import os.path
+import tempfile
+import shutil
+import time
+import threading
+import traceback
+import subprocess
+
+import numpy
+import fabio
+
+import maskTiff4Maud
+from benchmark import detectors, syntheticImage, syntheticMask
+
+#################################################################
+#
+# Checks
+#
+#################################################################
+
+"""
+Auto-orientation finds the orientation of masks stored in any of the 8
+orientations, for a detector whose shape is not a multiple of the binning
+factor (Pilatus 1M, 1043 x 981)
+"""
+def checkAutoOrient(tmpdir):
+	nrows, ncols, dtype = detectors["pilatus1m"]
+	data = syntheticImage(nrows, ncols, dtype)
+	mask = syntheticMask(nrows, ncols)
+	data[mask == 1] = 0
+	for nrot in range(4):
+		for flipud in (False, True):
+			stored = numpy.rot90(numpy.flipud(mask) if flipud else mask, -nrot)
+			found = maskTiff4Maud.autoOrientMask(data, stored)
+			oriented = maskTiff4Maud.orientMask(stored, found["nrotmask"], found["flipud"], found["fliplr"])
+			assert (oriented == mask).all(), "mask stored with nrotmask=%d, flipud=%s: found nrotmask=%d, flipud=%s, fliplr=%s" % (nrot, flipud, found["nrotmask"], found["flipud"], found["fliplr"])
+
+"""
+Small synthetic data set in tmpdir: nfiles images of shape (nrows, ncols), and a mask
+Returns the list of image files, the mask file, and the mask
+"""
+def writeDataSet(tmpdir, nfiles, nrows=64, ncols=48, dtype="uint16"):
+	indir = os.path.join(tmpdir, "in")
+	os.makedirs(indir, exist_ok=True)
+	files = []
+	for i in range(nfiles):
+		files.append(os.path.join(indir, "image%04d.tif" % i))
+		maskTiff4Maud.writeTiff(syntheticImage(nrows, ncols, dtype, seed=i), files[-1])
+	mask = syntheticMask(nrows, ncols)
+	mask[:nrows//8,:ncols//8] = 1
+	maskfile = os.path.join(tmpdir, "detector.mask")
+	maskTiff4Maud.writeTiff(mask, maskfile)
+	return files, maskfile, mask
+
+"""
+Checks that outfile is infile masked with mask in memory, see applyMask
+"""
+def checkMasked(infile, outfile, mask, intensityshift=0.):
+	expected = maskTiff4Maud.applyMask(fabio.open(infile).data, maskTiff4Maud.getOrientedMask(mask, 0, False, False), intensityshift)
+	masked = fabio.open(outfile).data
+	assert (masked.dtype == expected.dtype) and (masked == expected).all(), "%s is not %s correctly masked" % (outfile, infile)
+
+"""
+A folder watcher masks all files of a local folder, sends ready files to the
+workers as soon as they are done, not once per poll, and forgets removed files
+"""
+def checkWatch(tmpdir):
+	nfiles = 40
+	files, maskfile, mask = writeDataSet(tmpdir, nfiles)
+	outdir = os.path.join(tmpdir, "out")
+	poll = 0.5
+	watcher = maskTiff4Maud.folderWatcher(maskfile, os.path.dirname(files[0]), outdir, intensityshift=10., nproc=2, settle=0., poll=poll, maxinflight=2)
+	stop = threading.Event()
+	thread = threading.Thread(target=watcher.run, kwargs={"stop": stop, "statusinterval": None})
+	thread.start()
+	try:
+		while ((watcher.nprocessed + watcher.nerrors < nfiles) and (time.time() - (watcher.start or time.time()) < 60.)):
+			time.sleep(0.05)
+	finally:
+		stop.set()
+		thread.join()
+	assert (watcher.nprocessed == nfiles) and (watcher.nerrors == 0), "%d files masked, %d errors, for %d files" % (watcher.nprocessed, watcher.nerrors, nfiles)
+	for infile in files:
+		checkMasked(infile, maskTiff4Maud.batchOutputName(infile, outdir, "-masked"), mask, 10.)
+	# One batch of maxinflight files per poll would take nfiles/maxinflight*poll seconds
+	elapsed = watcher.metrics()["elapsed"]
+	assert (elapsed < 0.5*nfiles/2*poll), "%d files in %.1f s, not faster than one batch per poll" % (nfiles, elapsed)
+	# Files moved away once masked are forgotten
+	for infile in files:
+		os.remove(infile)
+	watcher.scan()
+	assert (len(watcher.done) == 0), "%d removed files still known to the folder watcher" % len(watcher.done)
+
+"""
+A job split in shards run by several command line processes at once is complete
+and correctly masked, a shard run again skips its files, and a changed output
+is found by verifyJob
+"""
+def checkJob(tmpdir):
+	nfiles, nshards = 30, 3
+	files, maskfile, mask = writeDataSet(tmpdir, nfiles)
+	outdir = os.path.join(tmpdir, "out")
+	jobfile = os.path.join(tmpdir, "job.json")
+	maskTiff4Maud.createJob(jobfile, maskfile, files, outdir=outdir, intensityshift=10.)
+	script = os.path.abspath(maskTiff4Maud.__file__)
+	processes = [subprocess.Popen([sys.executable, script, "--job", jobfile, "--shard", "%d/%d" % (shard, nshards), "-j", "1"], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) for shard in range(1, nshards+1)]
+	for shard, process in enumerate(processes):
+		errors = process.communicate()[1].decode(errors="replace")
+		assert (process.returncode == 0), "shard %d/%d failed: %s" % (shard+1, nshards, errors)
+	problems = maskTiff4Maud.verifyJob(jobfile, nproc=1, verbose=False)
+	assert (len(problems) == 0), "job not complete: %s" % "; ".join(problems)
+	outputs = [maskTiff4Maud.batchOutputName(infile, outdir, "-masked") for infile in files]
+	for infile, output in zip(files, outputs):
+		checkMasked(infile, output, mask, 10.)
+	states = [os.stat(output).st_mtime_ns for output in outputs]
+	maskTiff4Maud.runJob(jobfile, 0, nshards, nproc=1, verbose=False)
+	assert (states == [os.stat(output).st_mtime_ns for output in outputs]), "files of shard 1/%d processed again" % nshards
+	output = outputs[0]
+	data = fabio.open(output).data
+	data[mask == 1] = 0
+	maskTiff4Maud.writeTiff(data, output)
+	problems = maskTiff4Maud.verifyJob(jobfile, nproc=1, verbose=False)
+	assert any(output in problem for problem in problems), "changed output %s not found by verifyJob" % output
+
+"""
+Images masked by blocks of rows, read with tiffBlockReader and written with
+tiffBlockWriter, are the same as images masked in memory, for several data types,
+BigTIFF files, and combined mask files read by blocks of rows
+"""
+def checkTiles(tmpdir):
+	nrows, ncols = 301, 203
+	files, maskfile, mask = writeDataSet(tmpdir, 1, nrows, ncols)
+	rotated = os.path.join(tmpdir, "rotated.mask")
+	maskTiff4Maud.writeTiff(numpy.ascontiguousarray(numpy.rot90(syntheticMask(nrows, ncols)[::-1], -1)), rotated)
+	composition = maskTiff4Maud.maskComposition([maskTiff4Maud.maskLayer(maskfile), maskTiff4Maud.maskLayer(rotated, 1, True)], above=600.)
+	expected = (mask == 1) | (syntheticMask(nrows, ncols) == 1)
+	assert (composition.packed().unpack() == expected).all(), "combined mask files read by blocks of rows are wrong"
+	base = syntheticImage(nrows, ncols, "float32")
+	images = [("uint16", base, 0.), ("int32", base - 50., 10.), ("uint32", base + 2.**31, 0.), ("uint32", base, 0.5), ("float32", base, 0.5), ("float64", base, 1.5)]
+	for index, (dtype, values, shift) in enumerate(images):
+		data = values.astype(dtype)
+		infile = os.path.join(tmpdir, "image%d.tif" % index)
+		maskTiff4Maud.writeTiff(data, infile)
+		assert maskTiff4Maud.readableByBlocks(infile), "%s image can not be read by blocks of rows" % dtype
+		with maskTiff4Maud.tiffBlockReader(infile) as reader:
+			assert (reader.read(0, nrows) == data).all(), "%s image read by blocks of rows is wrong" % dtype
+		for omask in (maskTiff4Maud.getOrientedMask(mask), composition):
+			inmemory = os.path.join(tmpdir, "memory%d.tif" % index)
+			byblocks = os.path.join(tmpdir, "blocks%d.tif" % index)
+			results = maskTiff4Maud.maskFrames(infile, inmemory, omask, shift)
+			tiled = maskTiff4Maud.maskFrames(infile, byblocks, omask, shift, tilebytes=20000)
+			assert (tiled == results), "%s image: validation by blocks of rows %s, in memory %s" % (dtype, tiled, results)
+			expected = fabio.open(inmemory).data
+			masked = fabio.open(byblocks).data
+			assert (masked.dtype == expected.dtype) and (masked == expected).all(), "%s image masked by blocks of rows is wrong" % dtype
+	# uint32 intensities above int32 at masked pixels only still give int32
+	data = base.astype("uint32")
+	data[mask == 1] = 2**32-1
+	infile = os.path.join(tmpdir, "hot.tif")
+	maskTiff4Maud.writeTiff(data, infile)
+	for tilebytes in (None, 20000):
+		outfile = os.path.join(tmpdir, "hotmasked.tif")
+		maskTiff4Maud.maskFrames(infile, outfile, maskTiff4Maud.getOrientedMask(mask), 0., tilebytes=tilebytes)
+		masked = fabio.open(outfile).data
+		assert (masked.dtype == numpy.int32) and (masked[mask == 1] == -1).all() and (masked[mask != 1] == data[mask != 1]).all(), "uint32 image with masked hot pixels is not saved in int32"
+	# BigTIFF, written and read back by blocks
+	bigfile = os.path.join(tmpdir, "big.tif")
+	with maskTiff4Maud.tiffBlockWriter(bigfile, data.shape, data.dtype, bigtiff=True) as writer:
+		for start in range(0, nrows, 64):
+			writer.write(data[start:start+64])
+	with maskTiff4Maud.tiffBlockReader(bigfile) as reader:
+		assert (reader.read(0, nrows) == data).all() and (reader.read(100, 200) == data[100:200]).all(), "BigTIFF written and read by blocks of rows is wrong"
+
+"""
+The graphical interface, with Qt offscreen platform, steps through the frames
+of a multi-page tiff, with and without measuring processing stages, only
+builds the level of the pyramids that is plotted, and saves the frame shown
+without validating it again
+Skipped if PyQt5 can not be loaded
+"""
+def checkGuiFrames(tmpdir):
+	os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+	try:
+		import PyQt5.QtWidgets
+		import maskTiff4MaudGui
+	except ImportError as e:
+		return "skipped (%s)" % e
+	files, maskfile, mask = writeDataSet(tmpdir, 3)
+	frames = [fabio.open(f).data for f in files]
+	stackfile = os.path.join(tmpdir, "stack.tif")
+	writer = maskTiff4Maud.stackWriter(stackfile)
+	for frame in frames:
+		writer.write(frame)
+	writer.close()
+	app = PyQt5.QtWidgets.QApplication.instance() or PyQt5.QtWidgets.QApplication([])
+	form = maskTiff4MaudGui.clearMaskGui()
+	errors = []
+	form.showError = lambda title, error: errors.append("%s: %s" % (title, error))
+	# Runs the event loop until background tasks are done
+	def wait():
+		start = time.time()
+		while ((len(form.tasks.tasks) > 0) and (time.time() - start < 30.)):
+			app.processEvents()
+			time.sleep(0.01)
+		app.processEvents()
+	try:
+		for profile in (False, True):
+			if (profile):
+				maskTiff4Maud.profiler.enable()
+			form.cache.clear()
+			form.resolution = 16
+			form.loadFile(stackfile)
+			wait()
+			form.loadMask(maskfile, [])
+			wait()
+			assert form.frameBox.isEnabled() and (form.frameBox.maximum() == len(frames)-1), "frames of %s not found" % stackfile
+			for index in list(range(1, len(frames))) + [0]:
+				form.frameBox.setValue(index)
+				wait()
+				assert (len(errors) == 0), "frame %d: %s" % (index, "; ".join(errors))
+				assert (form.image.data == frames[index]).all(), "frame %d is not shown" % index
+				# Only the level plotted at this resolution is built
+				assert (sorted(form.pyramid.levels) == [0, 2]) and (form.pyramid.getLevel(2) == maskTiff4Maud.binImage(frames[index], "mean", 4)).all(), "frame %d: levels %s of the pyramid are built" % (index, sorted(form.pyramid.levels))
+			# Saving the frame shown uses its validation results, it is not validated again
+			omask = form.getOrientedMask()
+			validation = form.currentValidation(form.image.data, omask, form.intensityshift)
+			assert (validation is not None), "no validation results for the frame shown"
+			maskTiff4Maud.profiler.clear()
+			outfile = os.path.join(tmpdir, "saved.tif")
+			maskTiff4MaudGui.saveMasked(form.image.data, omask, form.intensityshift, form.outputtype, outfile, stackfile, None, validation)
+			stages = set(record["stage"] for record in maskTiff4Maud.profiler.records)
+			assert (not profile) or (stages == set(["mask", "write"])), "stages %s when saving, the frame is validated again" % ", ".join(sorted(stages))
+			checkMasked(files[0], outfile, mask)
+	finally:
+		maskTiff4Maud.profiler.disable()
+		maskTiff4Maud.profiler.clear()
+		form.tasks.shutdown()
+		form.hide()
+
+checks = [("autoorient", checkAutoOrient), ("watch", checkWatch), ("job", checkJob), ("tiles", checkTiles), ("gui", checkGuiFrames)]
+
+#################################################################
+#
+# Main subroutines
+#
+#################################################################
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Regression checks for maskTiff4Maud, on synthetic detector images.\n\nChecks: %s" % ", ".join(name for name, function in checks), formatter_class=RawTextHelpFormatter)
+	parser.add_argument('checks', nargs='*', default=[name for name, function in checks], help="checks to run (default: all)")
+	args = parser.parse_args()
+	known = dict(checks)
+	for name in args.checks:
+		if (name not in known):
+			parser.error("unknown check %s" % name)
+
+	nfailed = 0
+	for name in args.checks:
+		tmpdir = tempfile.mkdtemp(prefix="maskTiff4Maud-checks-")
+		start = time.perf_counter()
+		try:
+			skipped = known[name](tmpdir)
+			print("%-12s %-7s %8.1f s" % (name, skipped or "ok", time.perf_counter()-start))
+		except Exception:
+			nfailed += 1
+			print("%-12s FAILED  %8.1f s" % (name, time.perf_counter()-start))
+			traceback.print_exc()
+		finally:
+			shutil.rmtree(tmpdir, ignore_errors=True)
+	sys.exit(1 if (nfailed > 0) else 0)
@@ -23,505 +23,2994 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 # System functions, to manipulate command line arguments
 import sys
 import argparse
+import atexit
 from argparse import RawTextHelpFormatter
 import os.path
+import glob
+import time
+import multiprocessing
+import collections
+import json
+import csv
+import fnmatch
+import signal
+import threading
+import hashlib
+import struct
+import zlib
+import base64
+import concurrent.futures
+import tracemalloc
 
 # Fabio, from ESRF fable package
 import fabio
+import fabio.TiffIO
 
 # Maths stuff
 import numpy
-import scipy.misc
 
 
-# Plotting routines
-import matplotlib
-matplotlib.use("Qt5Agg")
-from matplotlib.figure import Figure
-from matplotlib.backend_bases import key_press_handler, Event
-from matplotlib.backends.backend_qt5agg import (
-    FigureCanvasQTAgg as FigureCanvas,
-    NavigationToolbar2QT as NavigationToolbar)
+#################################################################
+#
+# Masking routines, independent of the graphical interface
+#
+#################################################################
 
+"""
+Applies rotations and flips to the mask data, in the same order as in the GUI
+"""
+def orientMask(maskdata, nrotmask=0, flipud=False, fliplr=False):
+	if (nrotmask != 0):
+		maskdata = numpy.rot90(maskdata,nrotmask)
+	if (flipud):
+		maskdata = numpy.flipud(maskdata)
+	if (fliplr):
+		maskdata = numpy.fliplr(maskdata)
+	return maskdata
 
-# PyQT graphical interface
-import PyQt5.QtWidgets 
-import PyQt5.QtCore
-import PyQt5.QtGui
-import base64
+"""
+Mask after rotations and flips, with everything needed to apply it
+
+Attributes:
+- source: original mask data, before rotations and flips
+- nrotmask, flipud, fliplr: orientation
+- mask: boolean array, True at masked pixels
+- maskedIndices: flat indices of the masked pixels
+- nunmasked: number of pixels that are not masked
+"""
+class orientedMask:
+	def __init__(self, source, nrotmask=0, flipud=False, fliplr=False):
+		self.source = source
+		self.nrotmask = nrotmask % 4
+		self.flipud = flipud
+		self.fliplr = fliplr
+		self.mask = numpy.ascontiguousarray(orientMask(source, self.nrotmask, flipud, fliplr) == 1)
+		self.shape = self.mask.shape
+		self.maskedIndices = numpy.flatnonzero(self.mask)
+		self.nunmasked = self.mask.size - self.maskedIndices.size
+	
+	"""
+	Boolean array for rows start to stop, True at masked pixels
+	"""
+	def rows(self, start, stop):
+		return self.mask[start:stop]
+	
+	"""
+	Mask to use for one frame of data. This one does not depend on the data,
+	see maskComposition for masks that do.
+	"""
+	def forFrame(self, data):
+		return self
 
+# Cache of oriented masks, most recently used last
+_orientedMaskCache = collections.OrderedDict()
+_orientedMaskCacheSize = 8
+# The cache is used from background threads in the GUI
+_orientedMaskLock = threading.Lock()
 
-# Some text for the GUI. I put it on top so it is easier to upate
-bottomWindowLabel = "(c) 2020, S. Merkel, Univ. Lille"
-aboutWindowText = """
-<h3>MaskTiff4Maud</h3>
-(c) 2020, S. Merkel, Univ. Lille
-<P>Utility to prepare tiff files before loading data into the Rietveld refinement software MAUD.
-<P>How does this work? MAUD ignores pixels with a -1 intensity. Hence, this software sets a -1 intensity value at all points that should be masked</P>
-<P>How to proceed?<ul>
-<li>Create a mask, with Dioptas for instance, and save it,</li>
-<li>Load you data and your mask in MaskTiff4Maud,</li>
-<li>Check that the orientation of the mask is correct, otherwise, flip and rotate the mask until it works,</li>
-<li>Save your masked data in Tiff and proceed to process it with MAUD.</li>
-</ul>
-<P>Good luck with your data!</P>
-<P>This program is free software; you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation; either version 2 of the License, or (at your option) any later version.</P>
-<P>The source code is available at https://github.com/smerkel/maskTiff4Maud.</P>
-"""
-
-#################################################################
-#
-# Simple text window
-#
-#################################################################
-
-class textWindow(PyQt5.QtWidgets.QDialog):
-	def __init__(self, title, content, parent=None):
-		super(textWindow, self).__init__(parent)
-		
-		self.main_frame = PyQt5.QtWidgets.QWidget()
-		self.setWindowTitle(title) 
-
-		# Add text field
-		self.b = PyQt5.QtWidgets.QTextEdit(self)
-		self.b.setHtml(content)
-		
-		# connect button to function on_click
-		button = PyQt5.QtWidgets.QPushButton("Close window", self)
-		button.clicked.connect(self.on_click)
-		hlay = PyQt5.QtWidgets.QHBoxLayout()
-		hlay.addItem(PyQt5.QtWidgets.QSpacerItem(300, 10, PyQt5.QtWidgets.QSizePolicy.Expanding))
-		hlay.addWidget(button)
-		
-		# Vertical box layout in the window and setting it up
-		vbox = PyQt5.QtWidgets.QVBoxLayout()
-		vbox.addWidget(self.b)
-		#self.button.setAlignment(PyQt5.QtCore.Qt.AlignRight | PyQt5.QtCore.Qt.AlignVCenter)
-		vbox.addLayout(hlay)
-		
-		# We are done...
-		self.setLayout(vbox)
-		self.setGeometry(300, 200, 600, 400)
-		self.show()
-
-	def on_click(self):
-		self.close()
+"""
+Returns the oriented mask for this mask data and orientation
+Results are cached, so that changing options back and forth or saving
+does not recompute rotations, flips, and the list of masked pixels
+"""
+def getOrientedMask(maskdata, nrotmask=0, flipud=False, fliplr=False):
+	key = (id(maskdata), nrotmask % 4, bool(flipud), bool(fliplr))
+	with _orientedMaskLock:
+		omask = _orientedMaskCache.get(key)
+		# id() can be recycled once an array is gone, hence the identity check
+		if ((omask is not None) and (omask.source is maskdata)):
+			_orientedMaskCache.move_to_end(key)
+			return omask
+		omask = orientedMask(maskdata, nrotmask, bool(flipud), bool(fliplr))
+		_orientedMaskCache[key] = omask
+		while (len(_orientedMaskCache) > _orientedMaskCacheSize):
+			_orientedMaskCache.popitem(last=False)
+		return omask
+
+# Data types for masked data. MAUD needs signed values for the -1 of masked pixels.
+# auto: int32 for integer data with an integer intensity shift, if the shifted
+# intensities of un-masked pixels fit in int32, float32 otherwise
+outputTypes = ["auto", "int32", "float32", "float64"]
+
+"""
+Lowest and highest values of integer data (a frame or a stack of frames sharing
+omask) at pixels that are not masked, computed by blocks of rows
+Returns the limits of the data type, reversed, if all pixels are masked
+"""
+def _unmaskedRange(data, omask):
+	info = numpy.iinfo(data.dtype)
+	low, high = info.max, info.min
+	for frame in data.reshape((-1,) + data.shape[-2:]):
+		for row in range(0, frame.shape[0], _validationRows):
+			block = frame[row:row+_validationRows]
+			unmasked = ~omask.rows(row, row+_validationRows)
+			low = min(low, numpy.minimum.reduce(block, axis=None, where=unmasked, initial=info.max))
+			high = max(high, numpy.maximum.reduce(block, axis=None, where=unmasked, initial=info.min))
+	return int(low), int(high)
+
+"""
+True if integer data, after an integer intensity shift, fits in the integer type target
+The range of the data type is checked first, then the data itself if it is given,
+then its un-masked pixels if omask is given (masked pixels are set to -1 anyway)
+Returns (True or False, lowest intensity, highest intensity)
+"""
+def _fitsInteger(datadtype, intensityshift=0, data=None, target=numpy.int32, omask=None):
+	info = numpy.iinfo(datadtype)
+	low, high = int(info.min), int(info.max)
+	limits = numpy.iinfo(target)
+	fits = (low + intensityshift >= limits.min) and (high + intensityshift <= limits.max)
+	if ((not fits) and (data is not None) and (data.size > 0)):
+		low, high = int(data.min()), int(data.max())
+		fits = (low + intensityshift >= limits.min) and (high + intensityshift <= limits.max)
+		if ((not fits) and (omask is not None)):
+			low, high = _unmaskedRange(data, omask)
+			fits = (low + intensityshift >= limits.min) and (high + intensityshift <= limits.max)
+	return fits, low, high
+
+"""
+Data type of the masked data, for data of type datadtype, an intensity shift,
+and one of the outputTypes
+
+In auto mode, 32 and 64 bits integers (uint32 from Eiger detectors for
+instance) are only saved in int32 if the data itself fits after the shift, it
+is checked if data is given, on un-masked pixels if omask is given too. They
+are saved in float32 otherwise, rather than wrapping around.
+"""
+def outputDtype(datadtype, intensityshift=0., outputtype="auto", data=None, omask=None):
+	if (outputtype not in outputTypes):
+		raise ValueError("Unknown output type %s, should be one of %s" % (outputtype, ", ".join(outputTypes)))
+	if (outputtype == "auto"):
+		datadtype = numpy.dtype(datadtype)
+		if (numpy.issubdtype(datadtype, numpy.integer) and (float(intensityshift).is_integer()) and _fitsInteger(datadtype, int(intensityshift), data, omask=omask)[0]):
+			outputtype = "int32"
+		else:
+			outputtype = "float32"
+	return numpy.dtype(outputtype)
+
+"""
+Returns the data after intensity shift, with -1 at all masked pixels
+MAUD ignores pixels with a -1 intensity
+
+The result is computed in a single output array, without intermediate copies
+of the image, and in a compact data type.
+
+Parameters:
+- data: image data, or a stack of images (frames, rows, columns) sharing the same mask
+- maskdata: oriented mask, either an orientedMask or an array (pixels at 1 or True are masked)
+- intensityshift: shift to add to all intensities
+- outputtype: one of outputTypes
+- out: optional array to hold the result, with the same shape as data. Its data type
+  is used instead of outputtype. It can be data itself, to work in place.
+"""
+def applyMask(data, maskdata, intensityshift=0., outputtype="auto", out=None):
+	if (data.shape[-2:] != maskdata.shape):
+		raise ValueError("Mask shape %s does not match data shape %s" % (str(maskdata.shape), str(data.shape)))
+	omask = maskdata if isinstance(maskdata, orientedMask) else None
+	if (out is None):
+		out = numpy.empty(data.shape, outputDtype(data.dtype, intensityshift, outputtype, data, omask))
+	elif (out.shape != data.shape):
+		raise ValueError("Output shape %s does not match data shape %s" % (str(out.shape), str(data.shape)))
+	if (numpy.issubdtype(out.dtype, numpy.integer)):
+		if (not float(intensityshift).is_integer()):
+			raise ValueError("Intensity shift %g is not an integer, it can not be used with %s data" % (intensityshift, out.dtype))
+		intensityshift = int(intensityshift)
+		if (numpy.issubdtype(data.dtype, numpy.integer) and (out is not data)):
+			fits, low, high = _fitsInteger(data.dtype, intensityshift, data, out.dtype, omask)
+			if (not fits):
+				raise ValueError("Intensities from %d to %d, shifted by %d, do not fit in %s, use the auto or float32 output type" % (low, high, intensityshift, out.dtype))
+	# Shift computed directly in the output type, by chunks, without temporary arrays
+	numpy.add(data, intensityshift, out=out, dtype=out.dtype, casting="unsafe")
+	if (isinstance(maskdata, orientedMask)):
+		# Only touches the masked pixels
+		if (out.ndim == 2):
+			numpy.put(out, maskdata.maskedIndices, -1)
+		elif (out.flags.c_contiguous):
+			out.reshape(out.shape[0], -1)[:, maskdata.maskedIndices] = -1
+		else:
+			out[:, maskdata.mask] = -1
+	else:
+		out[..., maskdata == 1] = -1
+	return out
+
+"""
+Saves data in a tiff file
+The file is written under a temporary name and then renamed, so that other
+programs never see a partially written file
+Frames are written by strips with tiffBlockWriter, without a copy of the data
+(fabio's tifimage copies it, and saves float64 data in float32)
+"""
+def writeTiff(data, filename):
+	if ((data.ndim == 2) and (data.dtype.kind in "iuf")):
+		with tiffBlockWriter(filename, data.shape, data.dtype) as writer:
+			for start in range(0, data.shape[0], writer.rowsperstrip):
+				writer.write(data[start:start+writer.rowsperstrip])
+		return
+	path, name = os.path.split(filename)
+	tmpname = os.path.join(path, ".%s.%d.part" % (name, os.getpid()))
+	try:
+		fabio.tifimage.tifimage(data).write(tmpname)
+		os.replace(tmpname, filename)
+	finally:
+		if (os.path.exists(tmpname)):
+			os.remove(tmpname)
+
+#################################################################
+#
+# Composition of several masks and of automatic threshold masks
+#
+#################################################################
+
+# Ways to combine several mask files
+combineModes = ["union", "intersection"]
+
+"""
+Boolean mask stored with one bit per pixel, 8 times smaller than a boolean array
+"""
+class packedMask:
+	def __init__(self, mask):
+		self.shape = mask.shape
+		self.bits = numpy.packbits(mask, axis=None)
+		self.count = int(numpy.count_nonzero(mask))
+	
+	"""
+	Packed mask of this shape, built by blocks of nblock rows, without the whole
+	boolean mask in memory. rows(start, stop) returns the boolean rows start to stop.
+	"""
+	@staticmethod
+	def fromRows(shape, rows, nblock):
+		packed = packedMask(numpy.zeros((0, shape[1]), dtype=bool))
+		packed.shape = tuple(shape)
+		packed.bits = numpy.empty(-(-shape[0]*shape[1] // 8), dtype=numpy.uint8)
+		# Blocks of a multiple of 8 rows start on a byte
+		nblock = 8*max(1, nblock // 8)
+		for start in range(0, shape[0], nblock):
+			block = rows(start, min(shape[0], start+nblock))
+			bits = numpy.packbits(block, axis=None)
+			first = start*shape[1] // 8
+			packed.bits[first:first+bits.size] = bits
+			packed.count += int(numpy.count_nonzero(block))
+		return packed
+	
+	"""
+	Boolean array, True at masked pixels
+	"""
+	def unpack(self):
+		return numpy.unpackbits(self.bits, count=self.shape[0]*self.shape[1]).reshape(self.shape).view(bool)
+	
+	"""
+	Boolean array for rows start to stop, without unpacking the other rows
+	"""
+	def rows(self, start, stop):
+		first = start*self.shape[1]
+		last = stop*self.shape[1]
+		bits = numpy.unpackbits(self.bits[first//8:(last+7)//8])
+		return bits[first%8:first%8+last-first].reshape(stop-start, self.shape[1]).view(bool)
+	
+	def nbytes(self):
+		return self.bits.nbytes
+
+"""
+Oriented mask kept with one bit per pixel and the flat indices of the masked
+pixels, used as an orientedMask. Indices are in int32 when possible (4 bytes
+per masked pixel). Boolean arrays are unpacked for blocks of rows (see rows),
+the whole boolean mask only when it is asked for.
+"""
+class packedOrientedMask(orientedMask):
+	def __init__(self, packed):
+		self.source = None
+		self.nrotmask = 0
+		self.flipud = False
+		self.fliplr = False
+		self.packed = packed
+		self.shape = packed.shape
+		npixels = self.shape[0]*self.shape[1]
+		self.maskedIndices = numpy.empty(packed.count, dtype=numpy.int32 if (npixels < 2**31) else numpy.int64)
+		nmasked = 0
+		for row in range(0, self.shape[0], _validationRows):
+			indices = numpy.flatnonzero(packed.rows(row, min(self.shape[0], row+_validationRows)))
+			self.maskedIndices[nmasked:nmasked+indices.size] = indices + row*self.shape[1]
+			nmasked += indices.size
+		self.nunmasked = npixels - packed.count
+	
+	@property
+	def mask(self):
+		return self.packed.unpack()
+	
+	def rows(self, start, stop):
+		return self.packed.rows(start, min(self.shape[0], stop))
+
+"""
+Rows of a mask file after rotations and flips, True at masked pixels
+
+Uncompressed single-frame TIFF files are read by blocks of rows (see
+tiffBlockReader), so that the whole file is never in memory. Rows of the mask
+are columns of the file after a rotation by 90° or 270°, they are taken from
+all rows of the file, read by blocks. Other files are read at once.
+"""
+class maskFileRows:
+	def __init__(self, filename, nrotmask=0, flipud=False, fliplr=False):
+		self.nrotmask = nrotmask % 4
+		self.flipud = flipud
+		self.fliplr = fliplr
+		self.data = None
+		try:
+			self.reader = tiffBlockReader(filename)
+			fileshape = self.reader.shape
+		except (ValueError, struct.error):
+			self.reader = None
+			self.data = fabio.open(filename).data
+			fileshape = self.data.shape
+		# Row and column in the file of each pixel of the mask, as views without memory
+		self.filerows = orientMask(numpy.broadcast_to(numpy.arange(fileshape[0])[:,None], fileshape), self.nrotmask, flipud, fliplr)
+		self.filecols = orientMask(numpy.broadcast_to(numpy.arange(fileshape[1])[None,:], fileshape), self.nrotmask, flipud, fliplr)
+		self.shape = self.filerows.shape
+	
+	"""
+	Boolean array for rows start to stop of the mask
+	"""
+	def rows(self, start, stop):
+		# The rows are a rectangle of the file, given by its corners
+		filerows = self.filerows[start:stop][[0,0,-1,-1],[0,-1,0,-1]]
+		filecols = self.filecols[start:stop][[0,0,-1,-1],[0,-1,0,-1]]
+		row0, row1 = int(filerows.min()), int(filerows.max())+1
+		col0, col1 = int(filecols.min()), int(filecols.max())+1
+		block = numpy.empty((row1-row0, col1-col0), dtype=bool)
+		if (self.reader is None):
+			numpy.equal(self.data[row0:row1, col0:col1], 1, out=block)
+		else:
+			# Reads blocks of the file with about as many pixels as the rows
+			nread = max(1, min(row1-row0, (stop-start)*self.shape[1] // self.reader.shape[1]))
+			buffer = numpy.empty((nread, self.reader.shape[1]), self.reader.dtype)
+			for row in range(row0, row1, nread):
+				last = min(row1, row+nread)
+				data = self.reader.read(row, last, buffer[:last-row])
+				numpy.equal(data[:, col0:col1], 1, out=block[row-row0:last-row0])
+		return orientMask(block, self.nrotmask, self.flipud, self.fliplr)
+	
+	def close(self):
+		if (self.reader is not None):
+			self.reader.close()
+
+# Number of pixels in the blocks of rows used to combine mask files
+_maskBlockPixels = 2**22
+
+"""
+One mask file of a composition, with its orientation
+"""
+def maskLayer(filename, nrotmask=0, flipud=False, fliplr=False):
+	return {"file": os.path.abspath(filename), "nrotmask": nrotmask % 4, "flipud": bool(flipud), "fliplr": bool(fliplr)}
+
+"""
+Reads a mask layer from the command line: file[,rotate=N][,flipud][,fliplr]
+Options that are not in the string are taken from nrotmask, flipud and fliplr
+"""
+def parseMaskLayer(text, nrotmask=0, flipud=False, fliplr=False):
+	items = text.split(",")
+	for item in items[1:]:
+		if (item.startswith("rotate=")):
+			nrotmask = int(item[7:])
+		elif (item == "flipud"):
+			flipud = True
+		elif (item == "fliplr"):
+			fliplr = True
+		else:
+			raise ValueError("Unknown mask option %s in %s" % (item, text))
+	return maskLayer(items[0], nrotmask, flipud, fliplr)
+
+# Combined mask files, packed, most recently used last
+_compositionCache = collections.OrderedDict()
+_compositionCacheSize = 8
+_compositionLock = threading.Lock()
+
+"""
+Mask built from several mask files and from thresholds on the data
+
+Mask files are combined once, and kept packed in a cache shared by all
+compositions, so that changing options back and forth does not read the files
+again. The combined mask is kept packed, with the indices of its masked pixels
+(see packedOrientedMask), once per composition and reused for all frames. Thresholds are evaluated on each frame, on raw intensities (before
+the intensity shift).
+
+Parameters:
+- layers: list of mask files (names or dictionnaries from maskLayer)
+- mode: one of combineModes, a pixel is masked if it is masked in any layer
+  (union) or in all layers (intersection)
+- above: pixels with intensities above this value are masked (None: not used)
+- nonpositive: if True, pixels with intensities at or below zero are masked
+"""
+class maskComposition:
+	def __init__(self, layers, mode="union", above=None, nonpositive=False):
+		if (mode not in combineModes):
+			raise ValueError("Unknown mode %s, should be one of %s" % (mode, ", ".join(combineModes)))
+		if (len(layers) == 0):
+			raise ValueError("A mask composition needs at least one mask file")
+		self.layers = [maskLayer(layer) if isinstance(layer, str) else dict(layer) for layer in layers]
+		self.mode = mode
+		self.above = None if (above is None) else float(above)
+		self.nonpositive = bool(nonpositive)
+		self.fixed = None
+	
+	"""
+	Composition saved with describe
+	"""
+	@staticmethod
+	def fromDescription(description):
+		return maskComposition(description["layers"], description["mode"], description["above"], description["nonpositive"])
+	
+	"""
+	Dictionnary describing the composition, that can be saved in JSON
+	"""
+	def describe(self):
+		return {"layers": self.layers, "mode": self.mode, "above": self.above, "nonpositive": self.nonpositive}
+	
+	def __getstate__(self):
+		# Sent to worker processes without the unpacked mask
+		state = dict(self.__dict__)
+		state["fixed"] = None
+		return state
+	
+	"""
+	Key of the combined mask files in the cache. Changes if one of the files is modified
+	"""
+	def key(self):
+		files = []
+		for layer in self.layers:
+			info = os.stat(layer["file"])
+			files.append((layer["file"], info.st_mtime_ns, info.st_size, layer["nrotmask"], layer["flipud"], layer["fliplr"]))
+		return (self.mode, tuple(files))
+	
+	"""
+	Hash of the contents of the mask files and of the options, see parametersHash
+	"""
+	def hash(self):
+		description = [self.mode, self.above, self.nonpositive]
+		for layer in self.layers:
+			description.append([hashFile(layer["file"]), layer["nrotmask"], layer["flipud"], layer["fliplr"]])
+		return hashlib.blake2b(json.dumps(description).encode(), digest_size=16).hexdigest()
+	
+	"""
+	Mask files combined, as a packedMask, from the cache if possible
+	"""
+	def packed(self):
+		key = self.key()
+		with _compositionLock:
+			if (key in _compositionCache):
+				_compositionCache.move_to_end(key)
+				return _compositionCache[key]
+		# Files are read and combined by blocks of rows, never as a whole
+		files = []
+		try:
+			for layer in self.layers:
+				files.append(maskFileRows(layer["file"], layer["nrotmask"], layer["flipud"], layer["fliplr"]))
+				if (files[-1].shape != files[0].shape):
+					raise ValueError("Mask %s has shape %s, other masks have shape %s" % (layer["file"], str(files[-1].shape), str(files[0].shape)))
+			shape = files[0].shape
+			packed = packedMask.fromRows(shape, lambda start, stop: self.combineRows(files, start, stop), _maskBlockPixels // shape[1])
+		finally:
+			for maskfile in files:
+				maskfile.close()
+		with _compositionLock:
+			_compositionCache[key] = packed
+			while (len(_compositionCache) > _compositionCacheSize):
+				_compositionCache.popitem(last=False)
+		return packed
+	
+	"""
+	Rows start to stop of the combined mask files, see maskFileRows
+	"""
+	def combineRows(self, files, start, stop):
+		combined = files[0].rows(start, stop)
+		for maskfile in files[1:]:
+			if (self.mode == "union"):
+				combined |= maskfile.rows(start, stop)
+			else:
+				combined &= maskfile.rows(start, stop)
+		return combined
+	
+	"""
+	Combined mask files, as a packedOrientedMask, computed once
+	"""
+	def fixedMask(self):
+		if (self.fixed is None):
+			self.fixed = packedOrientedMask(self.packed())
+		return self.fixed
+	
+	def hasThresholds(self):
+		return ((self.above is not None) or self.nonpositive)
+	
+	"""
+	Rows start to stop of the mask for one frame of data: combined mask files,
+	and pixels above or below thresholds
+	"""
+	def frameRows(self, data, start, stop):
+		mask = self.fixedMask().rows(start, stop)
+		if (self.above is not None):
+			mask |= (data[start:stop] > self.above)
+		if (self.nonpositive):
+			mask |= (data[start:stop] <= 0)
+		return mask
+	
+	"""
+	Mask for one frame of data, as a packedOrientedMask: combined mask files, and
+	pixels above or below thresholds. The thresholds are combined with the packed
+	mask files by blocks of rows, the whole boolean mask is never built.
+	"""
+	def forFrame(self, data):
+		fixed = self.fixedMask()
+		if ((not self.hasThresholds()) or (data is None)):
+			return fixed
+		if (data.shape != fixed.shape):
+			raise ValueError("Mask shape %s does not match data shape %s" % (str(fixed.shape), str(data.shape)))
+		return packedOrientedMask(packedMask.fromRows(fixed.shape, lambda start, stop: self.frameRows(data, start, stop), _maskBlockPixels // fixed.shape[1]))
 	
+	@property
+	def shape(self):
+		return self.fixedMask().shape
+
+"""
+Mask for the command line: a file name if there is only one mask file without
+options (masks are then shared with the GUI cache, see getOrientedMask), a
+maskComposition otherwise
+
+Parameters:
+- layers: list of mask files with options, see parseMaskLayer
+- nrotmask, flipud, fliplr: orientation for files without options
+- mode, above, nonpositive: see maskComposition
+"""
+def maskFromArguments(layers, nrotmask=0, flipud=False, fliplr=False, mode="union", above=None, nonpositive=False):
+	if ((len(layers) == 1) and ("," not in layers[0]) and (above is None) and (not nonpositive)):
+		return layers[0]
+	return maskComposition([parseMaskLayer(layer, nrotmask, flipud, fliplr) for layer in layers], mode, above, nonpositive)
+
+#################################################################
+#
+# Validation of the data before sending it to MAUD
+#
 #################################################################
+
+# Fields of a validation report, in the order of CSV columns
+validationFields = ["file", "output", "error", "nframes", "minimum", "maximum", "nnegative", "recommendedshift", "nsaturated", "nnan", "nmasked", "nunmasked", "saturation", "intensityshift"]
+
+# Number of rows processed at once during validation, keeps temporary arrays small
+_validationRows = 256
+
+"""
+Statistics on un-masked pixels, after intensity shift
+Negative intensities in un-masked data are a problem later in MAUD
+
+Everything is computed in a single pass over blocks of rows, on the original
+data, without building a shifted or masked copy of the image.
+
+Parameters:
+- data: image data
+- omask: orientedMask
+- intensityshift: shift to add to all intensities
+- saturation: pixels at or above this value (before shift) are counted as saturated.
+  Default is the largest value for integer data, none for floating point data
+
+Returns a dictionnary with
+- minimum, maximum: extreme un-masked intensities, after shift (None if everything is masked)
+- nnegative: number of un-masked pixels with negative intensities
+- recommendedshift: minimum intensity shift to avoid negative intensities
+- nsaturated, nnan: number of un-masked saturated and NaN pixels
+- nmasked, nunmasked: number of masked and un-masked pixels
+"""
+def validateData(data, omask, intensityshift=0., saturation=None):
+	if (data.shape != omask.shape):
+		raise ValueError("Mask shape %s does not match data shape %s" % (str(omask.shape), str(data.shape)))
+	isfloat = numpy.issubdtype(data.dtype, numpy.floating)
+	if (isfloat):
+		low, high = numpy.inf, -numpy.inf
+	else:
+		info = numpy.iinfo(data.dtype)
+		low, high = info.max, info.min
+		if (saturation is None):
+			saturation = info.max
+	# Comparing the raw data to -intensityshift avoids shifting the data
+	threshold = -intensityshift
+	nnegative = nsaturated = nnan = 0
+	for row in range(0, data.shape[0], _validationRows):
+		block = data[row:row+_validationRows]
+		unmasked = ~omask.rows(row, row+_validationRows)
+		# fmin and fmax ignore NaN
+		bmin = numpy.fmin.reduce(block, axis=None, where=unmasked, initial=low)
+		bmax = numpy.fmax.reduce(block, axis=None, where=unmasked, initial=high)
+		low = min(low, bmin)
+		high = max(high, bmax)
+		if (bmin < threshold):
+			nnegative += numpy.count_nonzero((block < threshold) & unmasked)
+		if ((saturation is not None) and (bmax >= saturation)):
+			nsaturated += numpy.count_nonzero((block >= saturation) & unmasked)
+		if (isfloat):
+			nnan += numpy.count_nonzero(numpy.isnan(block) & unmasked)
+	if (omask.nunmasked - nnan > 0):
+		minimum = float(low) + intensityshift
+		maximum = float(high) + intensityshift
+	else:
+		minimum = maximum = None
+	recommended = intensityshift
+	if ((minimum is not None) and (minimum < 0)):
+		recommended = intensityshift - minimum
+	return {"minimum": minimum, "maximum": maximum, "nnegative": int(nnegative), "recommendedshift": recommended, "nsaturated": int(nsaturated), "nnan": int(nnan), "nmasked": int(omask.maskedIndices.size), "nunmasked": int(omask.nunmasked), "saturation": None if (saturation is None) else float(saturation), "intensityshift": intensityshift}
+
+"""
+Saves a list of validation results (dictionnaries), one per file
+Format depends on the extension: CSV for .csv, JSON otherwise
+"""
+def writeValidationReport(filename, results):
+	if (filename.lower().endswith(".csv")):
+		with open(filename, "w", newline="") as f:
+			writer = csv.DictWriter(f, fieldnames=validationFields, extrasaction="ignore")
+			writer.writeheader()
+			for result in results:
+				writer.writerow(result)
+	else:
+		with open(filename, "w") as f:
+			json.dump(results, f, indent=1)
+
+#################################################################
+#
+# Masking data already in memory
 #
-# Class to build the Graphical User Interface
-#
-#################################################################
-
-NavigationToolbar.toolitems = (
-	('Home', 'Reset original view', 'home', 'home'), 
-	#('Back', 'Previous spectrum', 'back', 'back'), 
-	#('Forward', 'Next spectrum', 'forward', 'forward'), 
-	#(None, None, None, None), 
-	('Pan', 'Pan axes with left mouse, zoom with right', 'move', 'pan'), 
-	('Zoom', 'Zoom to rectangle', 'zoom_to_rect', 'zoom'), 
-	#(None, None, None, None), 
-	('Save', 'Save the figure', 'filesave', 'save_figure'))
-	#(None, None, None, None))
-
-class clearMaskGui(PyQt5.QtWidgets.QMainWindow):
-	
-	"""
-	Constructor
-	
-	Parmeters:
-	
-	"""
-	def __init__(self, parent=None):
-		PyQt5.QtWidgets.QMainWindow.__init__(self, parent)
-		pm = PyQt5.QtGui.QPixmap()
-		pm.loadFromData(base64.b64decode(iconXPMbase64))
-		i = PyQt5.QtGui.QIcon()
-		i.addPixmap(pm)
-		self.setWindowIcon(PyQt5.QtGui.QIcon(i))
-		self.mask = None
-		self.image = None
-		self.plotimagedata = None		# temporary version, used for plotting (reduced resolution)
-		self.plotmaskdata = None		# temporary version, used for plotting (reduced resolution and rotated and flipped)
-		self.resolution = 1500			# Number of pixels for plotting
-		self.intensitycropfactorlow = 1. # for intensity scale in plotting (low intensity side)
-		self.intensitycropfactorhigh = 1. # for intensity scale in plotting (high intensity side)
-		self.nrotmask = 0     # Number of 90° rotations on mask
-		self.intensityshift = 0. # Shift to add to all intensities
-		self.flipud = False # Vertical flip on mask
-		self.fliplr = False # horizontal flip on mask
-		self.donewplot = True # Rescale a clear everything when you will plot
-		self.title = "Tiff mask removal tool" # Window title
-		self.defaultpath = None # default path with TIFF images
-		self.create_main_frame()
-		self.on_draw()
-		self.show()
-
-	"""
-	Builds up the GUI
-	"""
-	def create_main_frame(self):
-		
-		# Preparing a frame
-		self.main_frame = PyQt5.QtWidgets.QWidget()
-		self.setWindowTitle(self.title)
-		
-		# Building a menu bar
-		mainMenu = self.menuBar()
-		fileMenu = mainMenu.addMenu('File')
-		helpMenu = mainMenu.addMenu('Help')
-		
-		openButton = PyQt5.QtWidgets.QAction(PyQt5.QtGui.QIcon.fromTheme("document-open"), 'Load Tiff...', self)
-		openButton.setShortcut('Ctrl+O')
-		openButton.setStatusTip('Load diffraction data...')
-		openButton.triggered.connect(self.open_tif)
-		fileMenu.addAction(openButton)
-		
-		openButton = PyQt5.QtWidgets.QAction(PyQt5.QtGui.QIcon.fromTheme("document-open"), 'Load Mask...', self)
-		openButton.setStatusTip('Load mask...')
-		openButton.triggered.connect(self.open_mask)
-		fileMenu.addAction(openButton)
-		
-		saveButton = PyQt5.QtWidgets.QAction(PyQt5.QtGui.QIcon.fromTheme("document-save-as"), 'Save new Tiff...', self)
-		saveButton.setShortcut('Ctrl+S')
-		saveButton.setStatusTip('Save new masked data in Tiff...')
-		saveButton.triggered.connect(self.save_tif)
-		fileMenu.addAction(saveButton)
-		
-		fileMenu.addSeparator()
-		
-		exitButton = PyQt5.QtWidgets.QAction(PyQt5.QtGui.QIcon.fromTheme("application-exit"), 'Quit', self)
-		exitButton.setShortcut('Ctrl+Q')
-		exitButton.setStatusTip('I am done!')
-		exitButton.triggered.connect(self.closeEvent)
-		fileMenu.addAction(exitButton)
-		
-		aboutButton = PyQt5.QtWidgets.QAction(PyQt5.QtGui.QIcon.fromTheme("help-about"), 'About this program...', self)
-		aboutButton.setShortcut('Ctrl+H')
-		aboutButton.setStatusTip('What is this thing?!')
-		aboutButton.triggered.connect(self.about)
-		helpMenu.addAction(aboutButton)
-
-
-		# Horizontal
-		#hlay = PyQt5.QtWidgets.QHBoxLayout()
-		#button = PyQt5.QtWidgets.QPushButton(PyQt5.QtGui.QIcon.fromTheme("document-open"), 'Load data', self)
-		#button.setToolTip('Load diffraction data...')
-		#button.clicked.connect(self.open_tif)
-		#hlay.addWidget(button)
-		#button = PyQt5.QtWidgets.QPushButton(PyQt5.QtGui.QIcon.fromTheme("document-save"), 'Save data', self)
-		#button.setToolTip('Save diffraction data...')
-		#button.clicked.connect(self.save_tif)
-		#hlay.addWidget(button)
-		#hlay.addStretch(1)
-
-		
-		# Vertical layout with all options
-		cropLabel1 = PyQt5.QtWidgets.QLabel("Color shift (low intensities)", self)
-		self.colorScalingLow = PyQt5.QtWidgets.QSlider(PyQt5.QtCore.Qt.Horizontal)
-		self.colorScalingLow.setMinimum(-20)
-		self.colorScalingLow.setMaximum(20)
-		self.colorScalingLow.setSingleStep(1)
-		self.colorScalingLow.setValue(numpy.log(self.intensitycropfactorlow))
-		self.colorScalingLow.setTickPosition(PyQt5.QtWidgets.QSlider.NoTicks)
-		self.colorScalingLow.valueChanged.connect(self.changeColorScaleValue)
-		
-		cropLabel2 = PyQt5.QtWidgets.QLabel("Color shift (high intensities)", self)
-		self.colorScalingHigh = PyQt5.QtWidgets.QSlider(PyQt5.QtCore.Qt.Horizontal)
-		self.colorScalingHigh.setMinimum(-20)
-		self.colorScalingHigh.setMaximum(20)
-		self.colorScalingHigh.setSingleStep(1)
-		self.colorScalingHigh.setValue(numpy.log(self.intensitycropfactorhigh))
-		self.colorScalingHigh.setTickPosition(PyQt5.QtWidgets.QSlider.NoTicks)
-		self.colorScalingHigh.valueChanged.connect(self.changeColorScaleValue)
-		
-		intLabel = PyQt5.QtWidgets.QLabel("Intensity shift on data", self)
-		self.intShiftBox = PyQt5.QtWidgets.QLineEdit("%.1f" % (self.intensityshift ), self)
-		self.intShiftBox.returnPressed.connect(self.changeIntensityShiftValue)
-		
-		rotLabel = PyQt5.QtWidgets.QLabel("N. 90° rotation on mask", self)
-		self.rotBox = PyQt5.QtWidgets.QLineEdit("%d" % (self.nrotmask), self)
-		self.rotBox.returnPressed.connect(self.change_mask)
-		self.flipV = PyQt5.QtWidgets.QCheckBox("Flip mask vertically",self)
-		self.flipV.stateChanged.connect(self.change_mask)
-		self.flipH = PyQt5.QtWidgets.QCheckBox("Flip mask horizontally",self)
-		self.flipH.stateChanged.connect(self.change_mask)
-
-		resLabel = PyQt5.QtWidgets.QLabel("Plot resolution (pixels)", self)
-		self.resBox = PyQt5.QtWidgets.QLineEdit("%d" % (self.resolution), self)
-		self.resBox.setValidator(PyQt5.QtGui.QIntValidator(0,10000))
-		self.resBox.returnPressed.connect(self.changeResolutionValue)
-
-		vlay = PyQt5.QtWidgets.QVBoxLayout()
-		vlay.addWidget(cropLabel1)
-		vlay.addWidget(self.colorScalingLow)
-		vlay.addWidget(cropLabel2)
-		vlay.addWidget(self.colorScalingHigh)
-		vlay.addWidget(intLabel)
-		vlay.addWidget(self.intShiftBox)
-		vlay.addWidget(rotLabel)
-		vlay.addWidget(self.rotBox)
-		vlay.addWidget(self.flipV)
-		vlay.addWidget(self.flipH)
-		label = PyQt5.QtWidgets.QLabel("Data file", self)
-		vlay.addWidget(label)
-		self.dataBox = PyQt5.QtWidgets.QLineEdit("Not set", self)
-		self.dataBox.setReadOnly(True)
-		palette = PyQt5.QtGui.QPalette()
-		palette.setColor(PyQt5.QtGui.QPalette.Text, PyQt5.QtCore.Qt.lightGray)
-		self.dataBox.setPalette(palette)
-		self.dataBox.setStyleSheet('font:italic;')
-		vlay.addWidget(self.dataBox)
-		label = PyQt5.QtWidgets.QLabel("Mask file", self)
-		vlay.addWidget(label)
-		self.maskBox = PyQt5.QtWidgets.QLineEdit("Not set", self)
-		self.maskBox.setReadOnly(True)
-		self.maskBox.setPalette(palette)
-		self.maskBox.setStyleSheet('font:italic;')
-		vlay.addWidget(self.maskBox)
-		vlay.addWidget(resLabel)
-		vlay.addWidget(self.resBox)
-		vlay.addItem(PyQt5.QtWidgets.QSpacerItem(10, 200, PyQt5.QtWidgets.QSizePolicy.Expanding))
-		
-		# Adding a canvas for the plot
-		self.fig = Figure((8.0, 8.0), dpi=100,tight_layout=True,edgecolor='w',facecolor='w')
-		self.canvas = FigureCanvas(self.fig)
-		self.canvas.setParent(self.main_frame)
-		self.canvas.setFocusPolicy(PyQt5.QtCore.Qt.StrongFocus)
-		self.canvas.setFocus()
-
-		# Adding a toolbar and trying to deal with the events
-		self.mpl_toolbar = NavigationToolbar(self.canvas, self.main_frame)
-
-		# Horizontal box at the center, with the options and the plot
-		hlay2 = PyQt5.QtWidgets.QHBoxLayout()
-		hlay2.addLayout(vlay)
-		hlay2.addWidget(self.canvas)  # the matplotlib canvas
-
-		# Vertical box layout in the window and setting it up
-		vbox = PyQt5.QtWidgets.QVBoxLayout()
-		#vbox.addLayout(hlay)
-		vbox.addLayout(hlay2)
-		vbox.addWidget(self.mpl_toolbar)
-		
-		# Adding labels at the bottom
-		windowLabel = PyQt5.QtWidgets.QLabel(bottomWindowLabel, self)
-		windowLabel.setAlignment(PyQt5.QtCore.Qt.AlignRight | PyQt5.QtCore.Qt.AlignVCenter)
-		vbox.addWidget(windowLabel)
-
-		# We are done...
-		self.main_frame.setLayout(vbox)
-		self.setCentralWidget(self.main_frame)
-	
-	"""
-	Draws or redraws the plot
-	"""
-	def on_draw(self):
-		# If not instructed to do a new plot, keep a memory of the zoom
-		if (not self.donewplot):
-			# Clear plot content
-			for artist in self.axes.get_images():
-				artist.remove()
+#################################################################
+
+"""
+Validates and masks frames start to stop of a stack, in one thread
+Data is validated before it is masked, as out can be data itself
+"""
+def _maskStackChunk(stack, out, mask, intensityshift, saturation, start, stop):
+	results = []
+	fixed = (isinstance(mask, orientedMask) or (not mask.hasThresholds()))
+	for index in range(start, stop):
+		framemask = mask.forFrame(stack[index])
+		results.append(validateData(stack[index], framemask, intensityshift, saturation))
+		if (not fixed):
+			applyMask(stack[index], framemask, intensityshift, out=out[index])
+	if (fixed):
+		# Same mask for all frames, applied to all of them at once
+		applyMask(stack[start:stop], mask.forFrame(None), intensityshift, out=out[start:stop])
+	return results
+
+"""
+Masks data already in memory, as the GUI does before saving, and validates it
+
+numpy releases the GIL for most of the work, so frames are split between
+threads. Functions can also be called from several threads on different data.
+
+Parameters:
+- data: one frame (rows, columns) or a stack of frames (frames, rows, columns)
+- mask: orientedMask, maskComposition, or mask data (pixels at 1 are masked) to
+  orient with nrotmask, flipud and fliplr
+- intensityshift, outputtype: see applyMask
+- inplace: if True, the result is written in data, which must be signed
+- saturation: see validateData
+- nthreads: number of threads (default: number of cores, at most one per frame)
+
+Returns the masked data, and the validation results (see validateData): a
+dictionnary for one frame, a list of dictionnaries for a stack
+"""
+def maskArray(data, mask, intensityshift=0., outputtype="auto", inplace=False, saturation=None, nthreads=None, nrotmask=0, flipud=False, fliplr=False):
+	if (data.ndim not in (2, 3)):
+		raise ValueError("Data should be a frame or a stack of frames, not an array with %d dimensions" % data.ndim)
+	if (not isinstance(mask, (orientedMask, maskComposition))):
+		mask = getOrientedMask(numpy.asarray(mask), nrotmask, flipud, fliplr)
+	stack = data if (data.ndim == 3) else data[numpy.newaxis]
+	if (stack.shape[1:] != mask.shape):
+		raise ValueError("Mask shape %s does not match data shape %s" % (str(mask.shape), str(data.shape)))
+	if (inplace):
+		if (stack.dtype.kind not in "if"):
+			raise ValueError("Data of type %s can not hold -1 for masked pixels, it can not be masked in place" % stack.dtype)
+		out = stack
+	else:
+		# Range of the pixels un-masked by the fixed mask, a superset of those of each frame
+		fixed = mask.forFrame(None) if isinstance(mask, maskComposition) else mask
+		out = numpy.empty(stack.shape, outputDtype(stack.dtype, intensityshift, outputtype, stack, fixed))
+	nframes = stack.shape[0]
+	nthreads = max(1, min(nthreads or os.cpu_count() or 1, nframes))
+	with profiler.stage("maskarray", None, stack.nbytes):
+		if (nthreads == 1):
+			results = _maskStackChunk(stack, out, mask, intensityshift, saturation, 0, nframes)
 		else:
-			# Clear plot
-			self.fig.clear()
-			rect = 0, 0, 1., 1.
-			self.axes = self.fig.add_axes(rect)
-			self.axes.tick_params(axis='both', labelbottom=False, labeltop=False, labelleft=False, labelright=False)
-		if (self.image != None):
-			median = numpy.median(self.plotimagedata) + self.intensityshift
-			mindata = self.plotimagedata.min() + self.intensityshift
-			maxdata = self.plotimagedata.max() + self.intensityshift
-			minI = median-(median-mindata)*0.1*self.intensitycropfactorlow
-			maxI = median+(maxdata-median)*0.1*self.intensitycropfactorhigh
-			self.axes.imshow(self.plotimagedata + self.intensityshift,cmap = 'gnuplot2', vmin=minI, vmax=maxI)
-			self.donewplot = False
-		if (self.mask != None):
-			self.axes.imshow(self.plotmaskdata, origin='lower', cmap='OrRd', alpha=0.2)
-		self.canvas.draw()
-	
-	"""
-	Deals with changes in mask flipping and rotation options
-	"""
-	def change_mask(self,evt=None):
-		self.fliplr = False
-		self.flipud = False
-		if (self.flipV.checkState() == PyQt5.QtCore.Qt.Checked):
-			self.flipud = True
-		if (self.flipH.checkState() == PyQt5.QtCore.Qt.Checked):
-			self.fliplr = True
-		self.nrotmask = int(self.rotBox.text())
-		if (self.mask != None):
-			maskdata = self.mask.data
-			if (self.nrotmask > 0):
-				maskdata = numpy.rot90(maskdata,self.nrotmask)
-			if (self.flipud):
-				maskdata = numpy.flipud(maskdata)
-			if (self.fliplr):
-				maskdata = numpy.fliplr(maskdata)
-			# Generating reduced resolution version for plotting
-			ratio = 1.0* self.resolution / max(self.mask.dim1,self.mask.dim2)
-			self.plotmaskdata =  scipy.misc.imresize(maskdata,ratio)
-			self.on_draw()
-	
-	"""
-	Deals with changes in input boxes for intensity shift
-	"""
-	def changeIntensityShiftValue(self,evt=None):
-		self.intensityshift = float(self.intShiftBox.text())
-		self.checkForNegativeValues()
-		self.on_draw()
-
-	"""
-	Deals with changes in color scale
-	"""
-	def changeColorScaleValue(self,evt=None):
-		self.intensitycropfactorlow = numpy.power(10.,self.colorScalingLow.value()/10.)
-		self.intensitycropfactorhigh = numpy.power(10.,self.colorScalingHigh.value()/10.)
-		self.on_draw()
-		
-	"""
-	Deals with changes in plot resolution
-	"""
-	def changeResolutionValue(self,evt=None):
-		self.resolution = int(self.resBox.text())
-		if (self.image != None):
-			ratio = 1.0* self.resolution / max(self.image.dim1,self.image.dim2)
-			self.plotimagedata =  scipy.misc.imresize(self.image.data,ratio)
-		if (self.mask != None):
-			ratio = 1.0* self.resolution / max(self.mask.dim1,self.mask.dim2)
-			self.plotmaskdata =  scipy.misc.imresize(self.mask.data,ratio)
-		self.on_draw()
-		
-	"""
-	Open the diffraction image file
-	"""
-	def open_tif(self,evt=None):
-		options = PyQt5.QtWidgets.QFileDialog.Options()
-		filename, _ = PyQt5.QtWidgets.QFileDialog.getOpenFileName(self,"Select an tiff file...", self.defaultpath,"Tiff Files (*.tif *.tiff);;All Files (*)", options=options)
-		if filename:
-			self.image = fabio.open(filename)
-			path, name = os.path.split(filename)
-			self.imagefilename = name
-			self.defaultpath = path
-			self.title = "Tiff mask removal tool: %s" % name
-			self.setWindowTitle(self.title)
-			self.dataBox.setText(name)
-			self.checkForNegativeValues()
-			# Generating reduced resolution version for plotting
-			ratio = 1.0* self.resolution / max(self.image.dim1,self.image.dim2)
-			self.plotimagedata =  scipy.misc.imresize(self.image.data,ratio)
-			self.donewplot = True
-			self.on_draw()
-	
-	"""
-	Open the mask file
-	"""
-	def open_mask(self,evt=None):
-		options = PyQt5.QtWidgets.QFileDialog.Options()
-		filename, _ = PyQt5.QtWidgets.QFileDialog.getOpenFileName(self,"Select your mask...", self.defaultpath,"Mask Files (*.mask);;All Files (*)", options=options)
-		if filename:
-			self.mask = fabio.open(filename)
-			path, name = os.path.split(filename)
-			# self.title = "MAUD ESG edit: " + name
-			self.maskfilename = name
-			self.maskBox.setText(name)
-			self.checkForNegativeValues()
-			# Generating reduced resolution version for plotting
-			ratio = 1.0* self.resolution / max(self.mask.dim1,self.mask.dim2)
-			self.plotmaskdata =  scipy.misc.imresize(self.mask.data,ratio)
-			self.on_draw()
-
-	"""
-	Check if there are negative intensities where there is no mask
-	This is a problem later in MAUD
-	"""
-	def checkForNegativeValues(self):
-		if ((self.mask == None) or (self.image == None)):
-			return False
-		thisdata = self.image.data + self.intensityshift
-		maskdata = self.mask.data
-		if (self.nrotmask > 0):
-			maskdata = numpy.rot90(maskdata,self.nrotmask)
-		if (self.flipud):
-			maskdata = numpy.flipud(maskdata)
-		if (self.fliplr):
-			maskdata = numpy.fliplr(maskdata)
-		idx=(maskdata != 1)
-		minval = min(thisdata[idx])
-		if (minval < 0):
-			recommended = self.intensityshift - minval
-			buttonReply = PyQt5.QtWidgets.QMessageBox.warning(self, 'Negative intensities', "Negative intensites in un-masked data. Minimum intensity shift to avoid this: %.1f" % recommended, PyQt5.QtWidgets.QMessageBox.Ok)
-			
-	"""
-	Returns the data after all corrections
-	"""
-	def correctedData(self):
-		if ((self.mask == None) or (self.image == None)):
-			return False
-		thisdata = self.image.data + self.intensityshift
-		maskdata = self.mask.data 
-		maskdata = numpy.rot90(maskdata,self.nrotmask)
-		if (self.flipud):
-			maskdata = numpy.flipud(maskdata)
-		if (self.fliplr):
-			maskdata = numpy.fliplr(maskdata)
-		idx=(maskdata == 1)
-		thisdata[idx]=-1
-		return thisdata
-	
-	
-	"""
-	Save the new image with the mask remove
-	"""
-	def save_tif(self,evt=None):
-		if ((self.mask == None) or (self.image == None)):
-			buttonReply = PyQt5.QtWidgets.QMessageBox.warning(self, 'No data', "Data or mask is missing. Nothing to save.", PyQt5.QtWidgets.QMessageBox.Ok)
-			return
-		options = PyQt5.QtWidgets.QFileDialog.Options()
-		fileName, _ = PyQt5.QtWidgets.QFileDialog.getSaveFileName(self,"Save new data as...", self.defaultpath,"Tiff Files (*.tif *.tiff);;All Files (*)", options=options)
-		if fileName:
-			# Saving into a new file
-			imtiff = fabio.tifimage.tifimage(self.correctedData())
-			imtiff.write(fileName)
-			path, name = os.path.split(fileName)
-			self.defaultpath = path
-			self.title = "Tiff mask removal tool: %s" % name
-			self.setWindowTitle(self.title)
-		return
+			bounds = numpy.linspace(0, nframes, nthreads+1).astype(int)
+			with concurrent.futures.ThreadPoolExecutor(max_workers=nthreads) as pool:
+				chunks = pool.map(_maskStackChunk, [stack]*nthreads, [out]*nthreads, [mask]*nthreads, [intensityshift]*nthreads, [saturation]*nthreads, bounds[:-1], bounds[1:])
+				results = [result for chunk in chunks for result in chunk]
+	if (data.ndim == 2):
+		return out[0], results[0]
+	return out, results
+
+#################################################################
+#
+# Automatic orientation of the mask
+#
+#################################################################
+
+"""
+Finds the rotation and flip of the mask that best matches the data
+
+Masked areas (beam stop, gaps between detector modules...) usually have
+intensities very different from the rest of the image. For each of the 8
+possible orientations, the score is the difference between the mean
+intensity in masked and un-masked areas, relative to the standard deviation
+of the data. All orientations are evaluated at once, on reduced resolution
+versions of the data and the mask. The mask is oriented before it is binned,
+so that binned pixels of the data and of the mask cover the same area, even
+when the shape is not a multiple of the binning factor.
+
+Parameters:
+- data: image data
+- maskdata: mask data, before rotations and flips
+- size: approximate number of pixels of reduced resolution versions
+
+Returns a dictionnary with
+- nrotmask, flipud, fliplr: best orientation
+- score: score of the best orientation
+- confidence: between 0 (several orientations are as good) and 1
+- scores: list of (nrotmask, flipud, fliplr, score) for all orientations
+  matching the shape of the data, best first
+"""
+def autoOrientMask(data, maskdata, size=256):
+	factor = max(1, int(max(data.shape) // size))
+	image = binImage(data, "mean", factor).astype(numpy.float64)
+	image = numpy.nan_to_num(image)
+	masked = (maskdata == 1).view(numpy.uint8)
+	# The 8 different orientations: 4 rotations, with or without vertical flip
+	# (horizontal flips are the same as a vertical flip and a rotation by 180°)
+	candidates = []
+	masks = []
+	for nrot in range(4):
+		for flipud in (False, True):
+			oriented = orientMask(masked, nrot, flipud, False)
+			if (oriented.shape == data.shape):
+				candidates.append((nrot, flipud, False))
+				masks.append(binImage(oriented, "mean", factor).ravel())
+	if (len(candidates) == 0):
+		raise ValueError("Mask shape %s does not match data shape %s in any orientation" % (str(maskdata.shape), str(data.shape)))
+	masks = numpy.array(masks, dtype=numpy.float64)
+	values = image.ravel()
+	# Sums and number of masked pixels, for all orientations at once
+	maskedsum = masks @ values
+	nmasked = masks.sum(axis=1)
+	nunmasked = values.size - nmasked
+	std = values.std()
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		contrast = maskedsum/nmasked - (values.sum()-maskedsum)/nunmasked
+		scores = numpy.abs(contrast) / std if (std > 0) else numpy.zeros(len(candidates))
+	scores = numpy.nan_to_num(scores)
+	order = numpy.argsort(-scores, kind="stable")
+	best = scores[order[0]]
+	second = scores[order[1]] if (len(order) > 1) else 0.
+	confidence = (best - second) / best if (best > 0) else 0.
+	nrot, flipud, fliplr = candidates[order[0]]
+	return {"nrotmask": nrot, "flipud": flipud, "fliplr": fliplr, "score": float(best), "confidence": float(confidence), "scores": [candidates[i] + (float(scores[i]),) for i in order]}
+
+#################################################################
+#
+# Multi-resolution version of images, for plotting
+#
+#################################################################
+
+"""
+Reduces the resolution of an image by factor in each direction
+- mean: average of each block, in float32, preserves intensities
+- max: maximum of each block, for masks (a block is masked if any pixel is)
+Dimensions are padded by repeating the last rows or columns if needed
+"""
+def binImage(data, method="mean", factor=2):
+	padrows = (-data.shape[0]) % factor
+	padcols = (-data.shape[1]) % factor
+	if ((padrows > 0) or (padcols > 0)):
+		data = numpy.pad(data, ((0,padrows),(0,padcols)), mode="edge")
+	blocks = data.reshape(data.shape[0]//factor, factor, data.shape[1]//factor, factor)
+	if (method == "max"):
+		return blocks.max(axis=(1,3))
+	return blocks.mean(axis=(1,3), dtype=numpy.float32)
+
+"""
+Image pyramid: level 0 is the data, level n is binned by 2**n
+Each level is built on the first request for it, from the closest level already
+built, and kept: only the levels that are plotted use memory
 
+Parameters:
+- data: image or mask data
+- method: binning method, see binImage
+"""
+class imagePyramid:
+	def __init__(self, data, method="mean"):
+		self.shape = data.shape
+		self.method = method
+		self.levels = {0: data}
+		self.itemsize = data.itemsize if (method == "max") else numpy.dtype(numpy.float32).itemsize
+		self.maxlevel = max(0, int(numpy.ceil(numpy.log2(max(data.shape)))))
+	
 	"""
-	Called when the window is closed or when the user decides to "Quit"
+	Returns one level of the pyramid, built now if it was not requested before
 	"""
-	def closeEvent(self,evt=None):
-		if (isinstance(evt,PyQt5.QtGui.QCloseEvent)):
-			evt.accept()
-		sys.exit(2)
+	def getLevel(self, level):
+		level = min(level, self.maxlevel)
+		if (level not in self.levels):
+			closest = max(built for built in self.levels if (built < level))
+			self.levels[level] = binImage(self.levels[closest], self.method, 2**(level-closest))
+		return self.levels[level]
 	
 	"""
-	About window
+	Lowest resolution level with at most resolution pixels over npixels of original data
 	"""
-	def about(self,evt=None):
-		dialog = textWindow("About maskTiff4Maud...", aboutWindowText, self)
-		dialog.exec_()
-		return
+	def levelFor(self, npixels, resolution):
+		if ((resolution <= 0) or (npixels <= resolution)):
+			return 0
+		return min(self.maxlevel, int(numpy.ceil(numpy.log2(1.0*npixels/resolution))))
+	
+	"""
+	Range of rows and columns of a level covering x0 < x < x1 and y0 < y < y1,
+	in pixels of the original data, with a margin as a fraction of the range
+	"""
+	def tileBounds(self, level, x0, x1, y0, y1, margin=0.):
+		factor = 2**level
+		dx = (x1-x0)*margin
+		dy = (y1-y0)*margin
+		nrows = -(-self.shape[0] // factor)
+		ncols = -(-self.shape[1] // factor)
+		i0 = min(nrows, max(0, int(numpy.floor((y0-dy+0.5)/factor))))
+		i1 = min(nrows, max(i0, int(numpy.ceil((y1+dy+0.5)/factor))))
+		j0 = min(ncols, max(0, int(numpy.floor((x0-dx+0.5)/factor))))
+		j1 = min(ncols, max(j0, int(numpy.ceil((x1+dx+0.5)/factor))))
+		return (i0, i1, j0, j1)
+	
+	"""
+	Part of a level to plot, and its extent in pixels of the original data,
+	as used by matplotlib imshow
+	"""
+	def getTile(self, level, bounds):
+		factor = 2**level
+		i0, i1, j0, j1 = bounds
+		tile = self.getLevel(level)[i0:i1,j0:j1]
+		extent = (j0*factor-0.5, j1*factor-0.5, i1*factor-0.5, i0*factor-0.5)
+		return tile, extent
+	
+	"""
+	Memory used by the reduced levels built so far (level 0 is the data itself)
+	With planned, memory used once all levels are built
+	"""
+	def nbytes(self, planned=False):
+		if (planned):
+			return sum(-(-self.shape[0] // 2**level) * -(-self.shape[1] // 2**level) * self.itemsize for level in range(1, self.maxlevel+1))
+		return sum(data.nbytes for level, data in self.levels.items() if (level > 0))
+
+"""
+Intensity statistics of an image, from a histogram computed once
+Percentiles are then obtained without going through the data again
+
+Parameters:
+- data: image data
+- nbins: number of bins in the histogram, for data other than 8 or 16 bits unsigned
+  integers (for which the histogram is exact, with one bin per intensity)
+"""
+class imageStatistics:
+	def __init__(self, data, nbins=4096):
+		if (numpy.issubdtype(data.dtype, numpy.floating)):
+			self.minimum = float(numpy.nanmin(data))
+			self.maximum = float(numpy.nanmax(data))
+		else:
+			self.minimum = float(data.min())
+			self.maximum = float(data.max())
+		self.exact = ((data.dtype.kind in "ub") and (data.dtype.itemsize <= 2))
+		if (self.exact):
+			counts = numpy.bincount(data.ravel())[int(self.minimum):]
+			self.edges = self.minimum + numpy.arange(counts.size+1, dtype=numpy.float64)
+		elif (self.maximum > self.minimum):
+			counts, self.edges = numpy.histogram(data, bins=nbins, range=(self.minimum, self.maximum))
+		else:
+			counts = numpy.array([numpy.count_nonzero(data == self.minimum)])
+			self.edges = numpy.array([self.minimum, self.maximum])
+		self.counts = counts
+		self.cumulative = numpy.cumsum(counts)
+	
+	"""
+	Intensity below which lies q percent of the pixels
+	"""
+	def percentile(self, q):
+		total = self.cumulative[-1]
+		if (total == 0):
+			return self.minimum
+		target = min(max(q, 0.), 100.) * total / 100.
+		k = min(int(numpy.searchsorted(self.cumulative, target)), self.counts.size-1)
+		if (self.exact):
+			return float(self.edges[k])
+		before = self.cumulative[k-1] if (k > 0) else 0
+		fraction = (target - before) / self.counts[k] if (self.counts[k] > 0) else 0.
+		return float(self.edges[k] + fraction*(self.edges[k+1]-self.edges[k]))
+	
+	"""
+	Median intensity
+	"""
+	def median(self):
+		return self.percentile(50.)
+	
+	"""
+	Memory used by the histogram
+	"""
+	def nbytes(self):
+		return self.counts.nbytes + self.cumulative.nbytes + self.edges.nbytes
 
 #################################################################
 #
-# Application icon in XPM format, encoded in base64
+# Cache of decoded images, bounded by memory
 #
 #################################################################
 
-iconXPMbase64 = "LyogWFBNICovCnN0YXRpYyBjaGFyICogbWFza1RpZmY0TWF1ZF94cG1bXSA9IHsKIjg4IDgyIDE5ODggMiIsCiIgIAljIE5vbmUiLAoiLiAJYyAjMDAwMENGIiwKIisgCWMgIzAwMDBDRSIsCiJAIAljICMxQTFBRDMiLAoiIyAJYyAjNUM1Q0RGIiwKIiQgCWMgI0EzQTNFRSIsCiIlIAljICNDNkM2RjQiLAoiJiAJYyAjRTRFNEY5IiwKIiogCWMgI0U3RTdGQiIsCiI9IAljICNDRUNFRjUiLAoiLSAJYyAjQUVBRUVGIiwKIjsgCWMgIzZFNkVFMyIsCiI+IAljICMyOTI5RDYiLAoiLCAJYyAjMDEwMUNFIiwKIicgCWMgIzAwMDBDRCIsCiIpIAljICMxRDFERDQiLAoiISAJYyAjOTk5OUVDIiwKIn4gCWMgI0ZGRkZGRiIsCiJ7IAljICNCQ0JDRjMiLAoiXSAJYyAjMzIzMkQ4IiwKIl4gCWMgIzU0NTRERSIsCiIvIAljICNGOUY5RkUiLAoiKCAJYyAjODI4MkU3IiwKIl8gCWMgIzA0MDRDRiIsCiI6IAljICM3Nzc3RTUiLAoiPCAJYyAjQUNBQ0VGIiwKIlsgCWMgIzA3MDdDRiIsCiJ9IAljICM1QTVBREYiLAoifCAJYyAjOTU5NUVBIiwKIjEgCWMgIzI3MjdENSIsCiIyIAljICNGQkZCRkUiLAoiMyAJYyAjQUFBQUVGIiwKIjQgCWMgI0ZGRkVGRSIsCiI1IAljICNGRUZCRkIiLAoiNiAJYyAjRjhGNEY0IiwKIjcgCWMgI0YxRUZFRCIsCiI4IAljICNFOUU5RTYiLAoiOSAJYyAjRTRFNkUzIiwKIjAgCWMgI0UxRTVFMCIsCiJhIAljICNERUUxREIiLAoiYiAJYyAjRDlEREQ3IiwKImMgCWMgI0Q3RDlENSIsCiJkIAljICNENkQ4RDQiLAoiZSAJYyAjRDdEOUQ2IiwKImYgCWMgI0RBREJEOCIsCiJnIAljICNERURGREUiLAoiaCAJYyAjRTJFMkUxIiwKImkgCWMgI0U2RTRFMyIsCiJqIAljICNFRkVCRUEiLAoiayAJYyAjRjdGMEYwIiwKImwgCWMgI0ZDRjVGNyIsCiJtIAljICNGQ0ZBRkEiLAoibiAJYyAjRkVGRUZFIiwKIm8gCWMgI0UyRTJGOSIsCiJwIAljICMwQTBBRDAiLAoicSAJYyAjMkIyQkQ2IiwKInIgCWMgI0ZFRkNGQyIsCiJzIAljICNGNEVFRUUiLAoidCAJYyAjRUFEQ0RDIiwKInUgCWMgI0UxQ0ZEMCIsCiJ2IAljICNEMkMxQkYiLAoidyAJYyAjQkVCNkIzIiwKInggCWMgI0JCQkRCMyIsCiJ5IAljICNCQ0M1QjciLAoieiAJYyAjQkFDOEI2IiwKIkEgCWMgI0JEQ0NCOSIsCiJCIAljICNCQUM3QjYiLAoiQyAJYyAjQjZDM0IyIiwKIkQgCWMgI0I0QkZCMSIsCiJFIAljICNCMkJDQjAiLAoiRiAJYyAjQjBCN0FFIiwKIkcgCWMgI0FGQjRBRSIsCiJIIAljICNCMUIzQUYiLAoiSSAJYyAjQjRCMEFEIiwKIkogCWMgI0JGQjFCMCIsCiJLIAljICNENUI4QjkiLAoiTCAJYyAjRTNDNEM2IiwKIk0gCWMgI0U2RDBEMCIsCiJOIAljICNFRkUxRTEiLAoiTyAJYyAjRjZFREVEIiwKIlAgCWMgI0Y5RjJGMyIsCiJRIAljICM1RDVERTAiLAoiUiAJYyAjNzE3MUU0IiwKIlMgCWMgI0Y2RjVGNSIsCiJUIAljICNFNUUwRTAiLAoiVSAJYyAjRERDRkQwIiwKIlYgCWMgI0Q5QzBDMyIsCiJXIAljICNENEI1QjgiLAoiWCAJYyAjRDRCMUIyIiwKIlkgCWMgI0QyQUVBRSIsCiJaIAljICNDOEFEQUMiLAoiYCAJYyAjQjZBQkFCIiwKIiAuCWMgI0I1QjVCMCIsCiIuLgljICNCREM2QjkiLAoiKy4JYyAjQkZDRUJCIiwKIkAuCWMgI0MzRDJCQyIsCiIjLgljICNDMUNFQjkiLAoiJC4JYyAjQkRDQUI3IiwKIiUuCWMgI0JBQzdCNyIsCiImLgljICNCOEMyQjUiLAoiKi4JYyAjQjRCQUIyIiwKIj0uCWMgI0FGQUZBRCIsCiItLgljICNCMEFDQUIiLAoiOy4JYyAjQkNBQkFCIiwKIj4uCWMgI0QzQURBRSIsCiIsLgljICNFMEFEQUUiLAoiJy4JYyAjRTFCMEFGIiwKIikuCWMgI0UxQjRCMyIsCiIhLgljICNFMkJCQkEiLAoifi4JYyAjRUVEMUQwIiwKInsuCWMgI0YxRTBERSIsCiJdLgljICNGQUYzRjIiLAoiXi4JYyAjQjNCM0YwIiwKIi8uCWMgI0MyQzJGNCIsCiIoLgljICNFREU3RTciLAoiXy4JYyAjRTRENkQ2IiwKIjouCWMgI0QzQjhCOSIsCiI8LgljICNEMkIwQjEiLAoiWy4JYyAjRDVBQ0FFIiwKIn0uCWMgI0Q4QUJBRCIsCiJ8LgljICNEOUFCQUMiLAoiMS4JYyAjREFBQkFCIiwKIjIuCWMgI0Q2QURBRCIsCiIzLgljICNDQkFEQUQiLAoiNC4JYyAjQkZBQ0FCIiwKIjUuCWMgI0I4QUNBQiIsCiI2LgljICNCNkIxQUIiLAoiNy4JYyAjQjdCNEFDIiwKIjguCWMgI0I4QjVBQyIsCiI5LgljICNCNUIyQUIiLAoiMC4JYyAjQjNBRkFCIiwKImEuCWMgI0I0QURBQiIsCiJiLgljICNCN0FDQUIiLAoiYy4JYyAjQkFBQkFCIiwKImQuCWMgI0MwQUJBQiIsCiJlLgljICNDN0FEQUQiLAoiZi4JYyAjRDVBREFEIiwKImcuCWMgI0UzQURBRSIsCiJoLgljICNFOUFDQUMiLAoiaS4JYyAjRUFBQ0FCIiwKImouCWMgI0U5QUNBQiIsCiJrLgljICNFN0FEQUQiLAoibC4JYyAjRTNBRkFFIiwKIm0uCWMgI0UyQjhCNiIsCiJuLgljICNFQUM5QzciLAoiby4JYyAjRjZFMkUwIiwKInAuCWMgI0ZCRjRGNCIsCiJxLgljICNGQ0ZDRkYiLAoici4JYyAjMEIwQkQwIiwKInMuCWMgI0VFRUVGQyIsCiJ0LgljICM2NzY3QzciLAoidS4JYyAjMDcwN0E0IiwKInYuCWMgIzAwMDBBMSIsCiJ3LgljICMwODA2QTEiLAoieC4JYyAjNjI0REE1IiwKInkuCWMgI0RDQUJBQiIsCiJ6LgljICNEREFCQUMiLAoiQS4JYyAjREZBQkFDIiwKIkIuCWMgI0QxQTJBQyIsCiJDLgljICMzNDI5QTMiLAoiRC4JYyAjMTAwREEyIiwKIkUuCWMgIzMyMjRBMyIsCiJGLgljICNFNEE0QUIiLAoiRy4JYyAjRUVBQkFDIiwKIkguCWMgI0VEQUNBQyIsCiJJLgljICNFQkFEQUUiLAoiSi4JYyAjRTZCNUI2IiwKIksuCWMgIzQyM0FBRCIsCiJMLgljICMwMTAxQTEiLAoiTS4JYyAjMDkwOUE0IiwKIk4uCWMgIzg0ODREMiIsCiJPLgljICMyMjIyRDQiLAoiUC4JYyAjMDkwOUNGIiwKIlEuCWMgIzExMTFBNyIsCiJSLgljICMwNzA1QTEiLAoiUy4JYyAjREFBQ0FCIiwKIlQuCWMgI0RDQUNBQiIsCiJVLgljICNFMUFCQUMiLAoiVi4JYyAjQjM4OEFBIiwKIlcuCWMgI0I1ODFBQSIsCiJYLgljICNGMUFCQUMiLAoiWS4JYyAjRjJBQkFDIiwKIlouCWMgI0YxQUNBQyIsCiJgLgljICNEQTlFQUIiLAoiICsJYyAjMjkyOUIwIiwKIi4rCWMgIzM3MzdEOCIsCiIrKwljICMwRjBGRDEiLAoiQCsJYyAjMDQwNEEyIiwKIiMrCWMgIzIyMjJBRSIsCiIkKwljICMwRjBGQTciLAoiJSsJYyAjMjkyNkE5IiwKIiYrCWMgIzI5MjNBNiIsCiIqKwljICMyOTIxQTQiLAoiPSsJYyAjMjkyMEEzIiwKIi0rCWMgIzJBMjBBMyIsCiI7KwljICMwNjA1QTIiLAoiPisJYyAjRDhBOUFCIiwKIiwrCWMgI0RDQUNBQyIsCiInKwljICNERUFCQUIiLAoiKSsJYyAjRTBBQkFCIiwKIiErCWMgI0UyQUJBQiIsCiJ+KwljICNEREE3QUIiLAoieysJYyAjNjM0QkE1IiwKIl0rCWMgIzNEMkVBNCIsCiJeKwljICMyQjIwQTMiLAoiLysJYyAjMTQwRkEyIiwKIigrCWMgIzEzMEVBMiIsCiJfKwljICMyQzIwQTMiLAoiOisJYyAjMkQyMEEzIiwKIjwrCWMgIzNFMkNBNCIsCiJbKwljICM2NDQ3QTUiLAoifSsJYyAjRTdBNUFEIiwKInwrCWMgI0YyQUNBRCIsCiIxKwljICNGM0FDQUMiLAoiMisJYyAjRjRBQ0FDIiwKIjMrCWMgIzc1NTVBNyIsCiI0KwljICMyRDI1QTUiLAoiNSsJYyAjMjUyMkE1IiwKIjYrCWMgIzBGMEZBNiIsCiI3KwljICMxMjEyQTciLAoiOCsJYyAjMDIwMkEyIiwKIjkrCWMgIzIwMjBBQyIsCiIwKwljICMzRjNGREEiLAoiYSsJYyAjMDEwMUEyIiwKImIrCWMgIzFBMUFBQiIsCiJjKwljICM1RjVGQzQiLAoiZCsJYyAjNjI1OUIzIiwKImUrCWMgI0Q3QjJCMyIsCiJmKwljICNEQ0FEQUUiLAoiZysJYyAjREVBQ0FCIiwKImgrCWMgI0RGQUNBQiIsCiJpKwljICMyODFGQTMiLAoiaisJYyAjRDRBM0FDIiwKImsrCWMgI0UxQUJBQiIsCiJsKwljICNFM0FCQUIiLAoibSsJYyAjRTRBQkFCIiwKIm4rCWMgI0U0QUJBQyIsCiJvKwljICNFNUFDQUMiLAoicCsJYyAjRTVBQkFCIiwKInErCWMgI0U2QUJBQiIsCiJyKwljICNFN0FCQUIiLAoicysJYyAjRThBQkFCIiwKInQrCWMgIzZFNTBBNiIsCiJ1KwljICM2QjRFQTYiLAoidisJYyAjRURBQkFDIiwKIncrCWMgI0VDQUNBQiIsCiJ4KwljICNFRUFDQUIiLAoieSsJYyAjRjFBQ0FCIiwKInorCWMgI0YyQUNBQyIsCiJBKwljICNGMkFEQUMiLAoiQisJYyAjRjJBREFEIiwKIkMrCWMgI0YzQUVBRCIsCiJEKwljICNGNUFFQUUiLAoiRSsJYyAjRjZBRUFGIiwKIkYrCWMgI0Y2QURBRiIsCiJHKwljICNGN0FEQUQiLAoiSCsJYyAjRjRBRUFDIiwKIkkrCWMgI0U2QUZBRSIsCiJKKwljICNCRkFDQUMiLAoiSysJYyAjNDU0NUE3IiwKIkwrCWMgIzZGNkZDQSIsCiJNKwljICMwQjBCQTUiLAoiTisJYyAjRjhGOEZDIiwKIk8rCWMgIzIxMjFBRCIsCiJQKwljICM2MDYwQzMiLAoiUSsJYyAjNjM1MEE5IiwKIlIrCWMgI0RFQUNBRSIsCiJTKwljICNFMEFDQUIiLAoiVCsJYyAjMzAyNUEzIiwKIlUrCWMgI0NFOUVBQyIsCiJWKwljICNFNUFCQUMiLAoiVysJYyAjRTZBQkFDIiwKIlgrCWMgI0U4QUNBQiIsCiJZKwljICNFOUFCQUIiLAoiWisJYyAjNkU1MEE1IiwKImArCWMgIzZDNEVBNiIsCiIgQAljICNFRkFDQUMiLAoiLkAJYyAjRjFBREFDIiwKIitACWMgI0YzQUVBQyIsCiJAQAljICNGNEFGQUQiLAoiI0AJYyAjRjZBRkFFIiwKIiRACWMgI0Y4QUZBRiIsCiIlQAljICNGOUFGQjAiLAoiJkAJYyAjRkFCMEIyIiwKIipACWMgI0ZBQjBCMCIsCiI9QAljICNGOEIwQUUiLAoiLUAJYyAjRjFCMUIwIiwKIjtACWMgI0M1QURBRCIsCiI+QAljICM0NDQzQTUiLAoiLEAJYyAjNzA3MEM1IiwKIidACWMgI0VDRUNGOCIsCiIpQAljICMyNzI3QUYiLAoiIUAJYyAjNjk2NUJFIiwKIn5ACWMgIzY2NEVBNyIsCiJ7QAljICNFMkFDQUMiLAoiXUAJYyAjMzkyQ0E0IiwKIl5ACWMgI0M4OThBQSIsCiIvQAljICNFMUFDQUIiLAoiKEAJYyAjRTdBQkFDIiwKIl9ACWMgI0VBQUJBQyIsCiI6QAljICM2RjUwQTYiLAoiPEAJYyAjRUZBQkFDIiwKIltACWMgI0VGQUNBRCIsCiJ9QAljICNGMEFDQUUiLAoifEAJYyAjRjJBREFFIiwKIjFACWMgI0Y0QUVBRSIsCiIyQAljICNGNUFGQUYiLAoiM0AJYyAjRjdCMUIwIiwKIjRACWMgI0ZBQjFCMSIsCiI1QAljICNGQkIyQjIiLAoiNkAJYyAjRkRCM0I0IiwKIjdACWMgI0ZEQjRCNCIsCiI4QAljICNGN0I0QjUiLAoiOUAJYyAjQ0NBRkFFIiwKIjBACWMgIzQ1NDRBNSIsCiJhQAljICM2NTY1QjEiLAoiYkAJYyAjRjFFRkVGIiwKImNACWMgI0UxRTFGNCIsCiJkQAljICMyRTJFQjIiLAoiZUAJYyAjRkNGQ0ZDIiwKImZACWMgI0U2RENEQyIsCiJnQAljICM2ODVCQUYiLAoiaEAJYyAjNjc0RUE2IiwKImlACWMgI0UyQUNBQiIsCiJqQAljICM0MjMyQTQiLAoia0AJYyAjQzE5NEFCIiwKImxACWMgI0UzQUJBQyIsCiJtQAljICNFNkFDQUMiLAoibkAJYyAjRTVBQ0FCIiwKIm9ACWMgI0U4QUJBQyIsCiJwQAljICNFOUFCQUMiLAoicUAJYyAjRUJBQkFCIiwKInJACWMgIzZGNTBBNSIsCiJzQAljICNGMEFEQUQiLAoidEAJYyAjRjFBREFFIiwKInVACWMgI0YzQUVBRiIsCiJ2QAljICNGN0IxQjEiLAoid0AJYyAjRjlCM0IyIiwKInhACWMgI0ZDQjRCNCIsCiJ5QAljICNGREI2QjUiLAoiekAJYyAjRkZCN0I3IiwKIkFACWMgI0ZGQjhCOCIsCiJCQAljICNGRkI5QjgiLAoiQ0AJYyAjRkFCOUJBIiwKIkRACWMgI0Q1QjVCNSIsCiJFQAljICM0NzQ1QTciLAoiRkAJYyAjNUM1Q0E3IiwKIkdACWMgI0MyQzJDMSIsCiJIQAljICNFRUVFRUUiLAoiSUAJYyAjRkNGQ0ZFIiwKIkpACWMgIzc3NzdDRCIsCiJLQAljICNBNkE2REUiLAoiTEAJYyAjMTgxOEFBIiwKIk1ACWMgIzI0MjRBRiIsCiJOQAljICNENkQ2RjAiLAoiT0AJYyAjMzQzNEI0IiwKIlBACWMgI0VBRTJFMyIsCiJRQAljICNEREJFQkYiLAoiUkAJYyAjNjk1MkE2IiwKIlNACWMgIzY4NEVBNiIsCiJUQAljICNFNUFCQUQiLAoiVUAJYyAjNEIzOEE0IiwKIlZACWMgI0JBOERBQSIsCiJXQAljICNFNEFCQUQiLAoiWEAJYyAjRTRBQ0FDIiwKIllACWMgI0U2QUNBQiIsCiJaQAljICNFQkFCQUMiLAoiYEAJYyAjRUNBQkFCIiwKIiAjCWMgI0YyQUVBRiIsCiIuIwljICNGNUFGQjAiLAoiKyMJYyAjRkNCNUI0IiwKIkAjCWMgI0ZEQjdCNyIsCiIjIwljICNGRUI5QjkiLAoiJCMJYyAjRkZCQkJCIiwKIiUjCWMgI0ZGQkNCQyIsCiImIwljICNGRkJFQkUiLAoiKiMJYyAjRkZCRUJGIiwKIj0jCWMgI0ZDQkZDMCIsCiItIwljICNFMUJGQkYiLAoiOyMJYyAjNEE0N0E5IiwKIj4jCWMgIzVENUNBNyIsCiIsIwljICNBQkFDQUIiLAoiJyMJYyAjQzBDMUMxIiwKIikjCWMgI0ZBRkFGQSIsCiIhIwljICNCOEI4RTUiLAoifiMJYyAjNkE2QUM4IiwKInsjCWMgIzE5MTlBQSIsCiJdIwljICM4NTg1RDIiLAoiXiMJYyAjQ0JDQkVCIiwKIi8jCWMgIzRDNENCQyIsCiIoIwljICNERUM5Q0EiLAoiXyMJYyAjREFCMkIyIiwKIjojCWMgIzY5NTFBNiIsCiI8IwljICM2OTRFQTYiLAoiWyMJYyAjNjU0Q0E1IiwKIn0jCWMgI0I1ODdBOSIsCiJ8IwljICNFNEFDQUQiLAoiMSMJYyAjRTVBREFDIiwKIjIjCWMgI0VBQUJBQiIsCiIzIwljICNFQ0FCQUMiLAoiNCMJYyAjRUZBREFDIiwKIjUjCWMgI0Y1QjBCMSIsCiI2IwljICNGOEIyQjIiLAoiNyMJYyAjRkJCNEI0IiwKIjgjCWMgI0ZGQzFDMSIsCiI5IwljICNGRkM0QzMiLAoiMCMJYyAjRkZDNUM1IiwKImEjCWMgI0ZEQzZDNiIsCiJiIwljICNFQkM4QzkiLAoiYyMJYyAjNEU0OUFDIiwKImQjCWMgIzVGNUVBOSIsCiJlIwljICNBQ0FEQUQiLAoiZiMJYyAjQUJBREFDIiwKImcjCWMgI0NDQ0RDQyIsCiJoIwljICNGQkZCRkIiLAoiaSMJYyAjOTM5M0Q3IiwKImojCWMgI0U5RTlGNiIsCiJrIwljICNGOEY2RjYiLAoibCMJYyAjREVDRUQwIiwKIm0jCWMgI0QxQjNCNSIsCiJuIwljICNDN0FGQUYiLAoibyMJYyAjNTk1MEE1IiwKInAjCWMgIzlBNzVBOCIsCiJxIwljICMxOTEzQTIiLAoiciMJYyAjRENBNkFCIiwKInMjCWMgI0U0QUNBQiIsCiJ0IwljICNFMkFEQUMiLAoidSMJYyAjREVBQ0FDIiwKInYjCWMgI0Q3QUNBRCIsCiJ3IwljICNENUFEQUUiLAoieCMJYyAjRDlBREFEIiwKInkjCWMgI0UyQURBRSIsCiJ6IwljICNFNkFEQUQiLAoiQSMJYyAjNkQ0RUE3IiwKIkIjCWMgI0YxQUVBRSIsCiJDIwljICNGNEFGQUYiLAoiRCMJYyAjRjlCMkIzIiwKIkUjCWMgI0ZDQjVCNSIsCiJGIwljICNGRkJGQkYiLAoiRyMJYyAjRkZDMkMyIiwKIkgjCWMgI0ZGQzVDNiIsCiJJIwljICNGRkM5QzkiLAoiSiMJYyAjRkVDQ0NCIiwKIksjCWMgI0ZEQ0VDRSIsCiJMIwljICNGM0QxRDMiLAoiTSMJYyAjNTM0REIwIiwKIk4jCWMgIzIxMjFBNSIsCiJPIwljICMzRDNEQTYiLAoiUCMJYyAjM0MzQ0E1IiwKIlEjCWMgIzQyNDJCMCIsCiJSIwljICMyODI4QUYiLAoiUyMJYyAjREJEQkYyIiwKIlQjCWMgI0VDRTFFMyIsCiJVIwljICNDRkJCQkUiLAoiViMJYyAjQkRCMUIzIiwKIlcjCWMgI0I5QjNCNCIsCiJYIwljICM1MzUxQTYiLAoiWSMJYyAjREFBNEFCIiwKIlojCWMgI0UyQUJBRCIsCiJgIwljICNEREFFQUMiLAoiICQJYyAjRDZCMkFEIiwKIi4kCWMgI0NBQjBBQyIsCiIrJAljICNDNEIxQUMiLAoiQCQJYyAjQkZCMUFDIiwKIiMkCWMgI0JFQjBBRCIsCiIkJAljICNCQkFDQUMiLAoiJSQJYyAjQzBBQ0FDIiwKIiYkCWMgI0NCQUNBRCIsCiIqJAljICNEOUFGQUYiLAoiPSQJYyAjRTVBRUFEIiwKIi0kCWMgIzZDNEZBNiIsCiI7JAljICNGMkFFQUUiLAoiPiQJYyAjRjRCMEIwIiwKIiwkCWMgI0ZBQjNCNCIsCiInJAljICNGRkI5QkEiLAoiKSQJYyAjRkZCREJEIiwKIiEkCWMgI0ZGQzZDNiIsCiJ+JAljICNGRkM5Q0EiLAoieyQJYyAjRkVDRENFIiwKIl0kCWMgI0ZFRDFEMSIsCiJeJAljICNGRUQ0RDQiLAoiLyQJYyAjRjZEN0Q4IiwKIigkCWMgIzU2NTFCMyIsCiJfJAljICNGMUVERUQiLAoiOiQJYyAjRDdDQ0NCIiwKIjwkCWMgI0JDQjJCMSIsCiJbJAljICNCMkI1QjMiLAoifSQJYyAjQjNCN0I3IiwKInwkCWMgIzUxNTFBOCIsCiIxJAljICM2QTRFQTYiLAoiMiQJYyAjRTJBQ0FGIiwKIjMkCWMgI0Q2QURBRSIsCiI0JAljICNDOUIyQUYiLAoiNSQJYyAjQkVCMkFEIiwKIjYkCWMgI0I5QjZCMCIsCiI3JAljICNCMUIyQUQiLAoiOCQJYyAjQURBRkFEIiwKIjkkCWMgI0IwQjJBRiIsCiIwJAljICNCMEIwQjAiLAoiYSQJYyAjQjNCMUIyIiwKImIkCWMgI0I3QjBCMSIsCiJjJAljICNEMEFGQUQiLAoiZCQJYyAjRTJBRUFEIiwKImUkCWMgIzZGNTFBNiIsCiJmJAljICM2RDRFQTYiLAoiZyQJYyAjRjJBRkFFIiwKImgkCWMgI0Y3QjJCMiIsCiJpJAljICNGRUI3QjgiLAoiaiQJYyAjRkZCQUJCIiwKImskCWMgI0ZGQzNDMyIsCiJsJAljICNGRkM4QzgiLAoibSQJYyAjRkZDQ0NEIiwKIm4kCWMgI0ZGRDJEMyIsCiJvJAljICNGRkQ3RDciLAoicCQJYyAjRkVEQURCIiwKInEkCWMgI0Y5REVERiIsCiJyJAljICM1OTU1QjciLAoicyQJYyAjMjIyMUE3IiwKInQkCWMgIzNEM0RBQiIsCiJ1JAljICMzQTNBQTgiLAoidiQJYyAjMzczN0E1IiwKInckCWMgIzM2MzZBNCIsCiJ4JAljICMyMzIzQTYiLAoieSQJYyAjREVEMkQyIiwKInokCWMgI0MyQjhCNSIsCiJBJAljICNCOUI4QjEiLAoiQiQJYyAjQjlCOUIyIiwKIkMkCWMgI0I3QjhCNCIsCiJEJAljICM1MTUxQTciLAoiRSQJYyAjRTRBREFGIiwKIkYkCWMgI0Q2QURBRiIsCiJHJAljICNDNUIwQUYiLAoiSCQJYyAjQjhCNUIyIiwKIkkkCWMgI0IyQjJCMSIsCiJKJAljICNCMkIzQjIiLAoiSyQJYyAjQjNCNEIzIiwKIkwkCWMgI0I0QjRCNCIsCiJNJAljICNCNUI1QjUiLAoiTiQJYyAjQjlCOUI5IiwKIk8kCWMgI0JBQjlCQSIsCiJQJAljICNCQ0JCQkQiLAoiUSQJYyAjQUVBQ0FDIiwKIlIkCWMgI0QxQUVBRSIsCiJTJAljICM2RDUxQTYiLAoiVCQJYyAjNkU0RUE2IiwKIlUkCWMgI0YxQURBRCIsCiJWJAljICNGQkI1QjUiLAoiVyQJYyAjRkVCOEI4IiwKIlgkCWMgI0ZGQkJCQyIsCiJZJAljICNGRkMwQzAiLAoiWiQJYyAjRkZDQUNBIiwKImAkCWMgI0ZGQ0VDRiIsCiIgJQljICNGRkQ1RDUiLAoiLiUJYyAjRkVEQURBIiwKIislCWMgI0ZFREZERiIsCiJAJQljICNGQkU0RTQiLAoiIyUJYyAjNUM1OEJBIiwKIiQlCWMgIzcyNzJCRCIsCiIlJQljICNDQ0NBQ0MiLAoiJiUJYyAjQzJDMEMwIiwKIiolCWMgI0I2QjVCNiIsCiI9JQljICNBRUFFQUUiLAoiLSUJYyAjNzM3M0E5IiwKIjslCWMgI0U5RTRFNCIsCiI+JQljICNDQ0MwQkUiLAoiLCUJYyAjQkNCNUFEIiwKIiclCWMgI0MwQjlBRiIsCiIpJQljICNDNEI3QjEiLAoiISUJYyAjQkNCNkFGIiwKIn4lCWMgIzUyNTBBNSIsCiJ7JQljICNEOEFFQUYiLAoiXSUJYyAjQzJCNUIxIiwKIl4lCWMgI0I0QjBBRSIsCiIvJQljICNBRkFGQUYiLAoiKCUJYyAjQjFCMkI0IiwKIl8lCWMgI0IzQjNCNSIsCiI6JQljICNCMkIyQjQiLAoiPCUJYyAjQjJCMkIyIiwKIlslCWMgI0FGQUVBRSIsCiJ9JQljICNBQ0FCQUIiLAoifCUJYyAjQUNBQ0FCIiwKIjElCWMgI0FFQUJBQiIsCiIyJQljICNCQkFCQUIiLAoiMyUJYyAjNjg1MkE5IiwKIjQlCWMgI0YyQUZBRiIsCiI1JQljICNGRkMwQzEiLAoiNiUJYyAjRkZDQkNDIiwKIjclCWMgI0ZGRDFEMiIsCiI4JQljICNGRkQ4RDgiLAoiOSUJYyAjRkZERERFIiwKIjAlCWMgI0ZGRTNFNCIsCiJhJQljICNGREU4RTgiLAoiYiUJYyAjNUY1QkJEIiwKImMlCWMgIzc3NzdDMiIsCiJkJQljICNENUQ1RDYiLAoiZSUJYyAjQ0JDQUNBIiwKImYlCWMgI0JEQkRCRCIsCiJnJQljICM4Nzg3QUEiLAoiaCUJYyAjRkVGRUZGIiwKImklCWMgI0Y2RjNGNCIsCiJqJQljICNEOUQyRDIiLAoiayUJYyAjQkJCOEI2IiwKImwlCWMgI0JFQkNCMSIsCiJtJQljICNDNUMwQjMiLAoibiUJYyAjQzJCQUI1IiwKIm8lCWMgIzU0NTBBNSIsCiJwJQljICNERkFEQUYiLAoicSUJYyAjQjdCMUFEIiwKInIlCWMgI0IzQjNCMiIsCiJzJQljICNBQ0FCQUMiLAoidCUJYyAjQUJBQ0FDIiwKInUlCWMgI0FCQUJBQiIsCiJ2JQljICNCMUIxQjAiLAoidyUJYyAjQURBQ0FCIiwKInglCWMgI0IzQUNBQiIsCiJ5JQljICM2MDUxQTciLAoieiUJYyAjNkQ0RkE2IiwKIkElCWMgI0Y2QjJCMiIsCiJCJQljICNGQUI1QjUiLAoiQyUJYyAjRkZDQ0NDIiwKIkQlCWMgI0ZGRDJEMiIsCiJFJQljICNGRkRFREYiLAoiRiUJYyAjRkZFNUU2IiwKIkclCWMgI0ZFRTlFQSIsCiJIJQljICM2MDVEQkYiLAoiSSUJYyAjN0I3QkM3IiwKIkolCWMgI0REREVERiIsCiJLJQljICNENEQ0RDMiLAoiTCUJYyAjQzRDNEM0IiwKIk0lCWMgI0FDQUNBRiIsCiJOJQljICM1MzUzQTYiLAoiTyUJYyAjNzk3OUJDIiwKIlAlCWMgI0U3RTNFMiIsCiJRJQljICNDOUMxQzAiLAoiUiUJYyAjQjdCOUIyIiwKIlMlCWMgI0M4Q0FCNSIsCiJUJQljICNEOUQ3QkYiLAoiVSUJYyAjQkZDMUI3IiwKIlYlCWMgI0IwQUZBRSIsCiJXJQljICM1ODUwQTUiLAoiWCUJYyAjRDhCMEIxIiwKIlklCWMgI0JDQUVBRSIsCiJaJQljICNCQkI3QjUiLAoiYCUJYyAjQjZCNkIzIiwKIiAmCWMgI0I3QjdCNCIsCiIuJgljICNCMkIwQjAiLAoiKyYJYyAjQUVCMEFGIiwKIkAmCWMgI0IwQjJCMSIsCiIjJgljICNBRUFFQUQiLAoiJCYJYyAjQjdCNkFGIiwKIiUmCWMgIzVCNTFBNiIsCiImJgljICNGMUFGQUYiLAoiKiYJYyAjRjNCMEIwIiwKIj0mCWMgI0ZEQjhCOCIsCiItJgljICNGRkQ5RDgiLAoiOyYJYyAjRkZERkRGIiwKIj4mCWMgI0ZGRTZFNyIsCiIsJgljICNGRUVDRUMiLAoiJyYJYyAjNjI1RUMwIiwKIikmCWMgIzdFN0ZDQSIsCiIhJgljICNFNEU2RTYiLAoifiYJYyAjREJEQ0RDIiwKInsmCWMgI0NFQ0VDRSIsCiJdJgljICNDMUMxQzEiLAoiXiYJYyAjQURBREFEIiwKIi8mCWMgI0JCQkJCQiIsCiIoJgljICNGMUYxRjEiLAoiXyYJYyAjRTBEQUQ5IiwKIjomCWMgI0MyQjlCNiIsCiI8JgljICNDMkMxQjIiLAoiWyYJYyAjRTJERUMwIiwKIn0mCWMgI0UzREJCQyIsCiJ8JgljICNDOUM3QjkiLAoiMSYJYyAjQjFBRUFDIiwKIjImCWMgIzVENTFBNiIsCiIzJgljICNEMUIwQjEiLAoiNCYJYyAjQjdCMEIwIiwKIjUmCWMgI0JGQkRCQyIsCiI2JgljICNDMEMwQkIiLAoiNyYJYyAjQjVCNkIyIiwKIjgmCWMgI0IyQjJCMyIsCiI5JgljICNCNEIyQjMiLAoiMCYJYyAjQUNBQ0FDIiwKImEmCWMgI0I1QjZCNiIsCiJiJgljICNCNEI2QjUiLAoiYyYJYyAjQjFCMkIxIiwKImQmCWMgI0FFQUVBQyIsCiJlJgljICM1QTUxQTYiLAoiZiYJYyAjRjlCNEI0IiwKImcmCWMgI0ZEQjdCOCIsCiJoJgljICNGRkNCQ0IiLAoiaSYJYyAjRkZEMUQxIiwKImomCWMgIzYyNUZDMSIsCiJrJgljICM4MTgxQ0MiLAoibCYJYyAjRUFFQkVBIiwKIm0mCWMgI0UwRTJFMiIsCiJuJgljICNEM0Q0RDQiLAoibyYJYyAjQzZDNkM2IiwKInAmCWMgI0I4QjhCOCIsCiJxJgljICNEQkRCREIiLAoiciYJYyAjRURFN0U2IiwKInMmCWMgI0QzQzhDOCIsCiJ0JgljICNCRUI2QjUiLAoidSYJYyAjRERENUMwIiwKInYmCWMgI0VEREFCRiIsCiJ3JgljICNFNUNBQjciLAoieCYJYyAjQ0NCOEIyIiwKInkmCWMgIzY1NTJBNyIsCiJ6JgljICNFN0FEQUIiLAoiQSYJYyAjRTFBRUFEIiwKIkImCWMgI0NBQjBCMSIsCiJDJgljICNCOUI0QjQiLAoiRCYJYyAjQjRCM0FGIiwKIkUmCWMgI0I1QjVCMiIsCiJGJgljICNCMEIxQjAiLAoiRyYJYyAjQkRCREJBIiwKIkgmCWMgI0IxQjFBRSIsCiJJJgljICNCMEFGQUQiLAoiSiYJYyAjQjFBRkFGIiwKIksmCWMgI0JCQjlCQiIsCiJMJgljICNCOUI2QjciLAoiTSYJYyAjQjlCN0I2IiwKIk4mCWMgI0FGQUVBRCIsCiJPJgljICNBRUFGQUQiLAoiUCYJYyAjQjhCOUIzIiwKIlEmCWMgIzU5NTFBNiIsCiJSJgljICNGMEFDQUQiLAoiUyYJYyAjRjJBRkIwIiwKIlQmCWMgI0Y1QjFCMSIsCiJVJgljICNGOUIzQjQiLAoiViYJYyAjRkRCNkI3IiwKIlcmCWMgI0ZGQzNDNCIsCiJYJgljICNGRkQwQ0YiLAoiWSYJYyAjRkZEN0Q2IiwKIlomCWMgI0ZFRUJFQiIsCiJgJgljICM4MzgzQ0QiLAoiICoJYyAjRUZFRkVGIiwKIi4qCWMgI0U2RTdFNyIsCiIrKgljICNEOURBREEiLAoiQCoJYyAjQ0RDRENEIiwKIiMqCWMgI0JFQkVCRSIsCiIkKgljICNCM0IzQjMiLAoiJSoJYyAjRjlGOUY5IiwKIiYqCWMgI0VERTFFMSIsCiIqKgljICNDQ0JFQkYiLAoiPSoJYyAjQjVCQUI5IiwKIi0qCWMgI0M5RDBDNCIsCiI7KgljICNFMEQ3QzciLAoiPioJYyAjREJDNUI5IiwKIiwqCWMgI0NBQjRCMCIsCiInKgljICNDQkFDQUIiLAoiKSoJYyAjNkI1MkE3IiwKIiEqCWMgI0UyQUVBRSIsCiJ+KgljICNCNkIzQjIiLAoieyoJYyAjQjNCM0IxIiwKIl0qCWMgI0JEQkRCNyIsCiJeKgljICNCRUJEQjYiLAoiLyoJYyAjQjhCN0IzIiwKIigqCWMgI0IyQjFCMSIsCiJfKgljICNCOEI3QjciLAoiOioJYyAjQkRCQUJBIiwKIjwqCWMgI0IwQUVBRCIsCiJbKgljICNCNUI3QjEiLAoifSoJYyAjRjhCMkIzIiwKInwqCWMgI0ZDQjVCNiIsCiIxKgljICNGRUI5QkEiLAoiMioJYyAjRkZCREJFIiwKIjMqCWMgI0ZGQzJDMyIsCiI0KgljICNGRkM3QzgiLAoiNSoJYyAjRkZDRUNEIiwKIjYqCWMgI0ZGRDVENCIsCiI3KgljICNGRURCREIiLAoiOCoJYyAjRkVFM0UzIiwKIjkqCWMgI0ZFRTlFOSIsCiIwKgljICM4MzgzQ0UiLAoiYSoJYyAjRjFGMEYwIiwKImIqCWMgI0U5RUFFQSIsCiJjKgljICNEREREREQiLAoiZCoJYyAjRDFEMUQxIiwKImUqCWMgI0I2QjZCNiIsCiJmKgljICNFOEU4RTgiLAoiZyoJYyAjQzhDOEM4IiwKImgqCWMgI0M3QzdDNyIsCiJpKgljICNGNEY0RjQiLAoiaioJYyAjRkFGOEY4IiwKImsqCWMgI0U3RDNENCIsCiJsKgljICNDQ0I3QjgiLAoibSoJYyAjQjhDNUMzIiwKIm4qCWMgI0M1REFDRiIsCiJvKgljICNENERCQ0YiLAoicCoJYyAjQkVCMkIxIiwKInEqCWMgI0M0QUJBQyIsCiJyKgljICM3MDUxQTYiLAoicyoJYyAjRTVBREFEIiwKInQqCWMgI0M5QUZBRSIsCiJ1KgljICNBREFEQUMiLAoidioJYyAjQjJCMUFGIiwKIncqCWMgI0JDQkJCNiIsCiJ4KgljICNCN0I3QjMiLAoieSoJYyAjQkFCQUI4IiwKInoqCWMgI0I5QkFCOCIsCiJBKgljICNCOUI5QjgiLAoiQioJYyAjQkNCN0IxIiwKIkMqCWMgIzVGNTJBNiIsCiJEKgljICNGQUI0QjUiLAoiRSoJYyAjRkRCOEI5IiwKIkYqCWMgI0ZFQkNCQyIsCiJHKgljICNGRkQyRDEiLAoiSCoJYyAjRkVEOEQ3IiwKIkkqCWMgI0ZGRTVFNSIsCiJKKgljICM2MTVEQkYiLAoiSyoJYyAjODI4MUNDIiwKIkwqCWMgI0YwRUZGMCIsCiJNKgljICNFQUVBRUEiLAoiTioJYyAjREZERkRGIiwKIk8qCWMgI0Q0RDRENCIsCiJQKgljICNDNUM1QzUiLAoiUSoJYyAjREVERURFIiwKIlIqCWMgI0Q2RDZENiIsCiJTKgljICNEOEQ4RDgiLAoiVCoJYyAjQ0FDQUNBIiwKIlUqCWMgI0UyQzVDNiIsCiJWKgljICNEMEIwQjAiLAoiVyoJYyAjQzRDQ0M2IiwKIlgqCWMgIzlCQTdDOCIsCiJZKgljICM0NDQ2QUMiLAoiWioJYyAjMkUyQkE0IiwKImAqCWMgIzM2MkJBNSIsCiIgPQljICMzQjJCQTUiLAoiLj0JYyAjMUMxNEEyIiwKIis9CWMgIzFCMTNBMiIsCiJAPQljICMzQjJCQTQiLAoiIz0JYyAjNDgzNkE0IiwKIiQ9CWMgIzk2ODBBQiIsCiIlPQljICNCN0I0QjEiLAoiJj0JYyAjQUJBQkFDIiwKIio9CWMgI0FEQURBRiIsCiI9PQljICNBRUFFQjAiLAoiLT0JYyAjQUZCMUIyIiwKIjs9CWMgIzVBNUFBQyIsCiI+PQljICMzRTNFQTkiLAoiLD0JYyAjMkUyRUE3IiwKIic9CWMgIzJCMkJBNCIsCiIpPQljICMyQzJCQTQiLAoiIT0JYyAjMzAyQ0E0IiwKIn49CWMgIzFBMTVBMiIsCiJ7PQljICMxQjE0QTMiLAoiXT0JYyAjM0MyQkE0IiwKIl49CWMgIzNDMkNBNSIsCiIvPQljICMzRDJDQTUiLAoiKD0JYyAjNEUzOEE2IiwKIl89CWMgIzczNTNBOSIsCiI6PQljICNGM0IxQjciLAoiPD0JYyAjRkRCQkJCIiwKIls9CWMgI0ZFQkZCRiIsCiJ9PQljICNGRkM4QzkiLAoifD0JYyAjRkRDRENFIiwKIjE9CWMgIzgxNkNCQyIsCiIyPQljICM0NzNEQjEiLAoiMz0JYyAjNDAzOUIxIiwKIjQ9CWMgIzE4MTdBOCIsCiI1PQljICMzQzNDQjUiLAoiNj0JYyAjM0EzQUIzIiwKIjc9CWMgIzM4MzhCMSIsCiI4PQljICMzOTM5QUYiLAoiOT0JYyAjNjk2OUI1IiwKIjA9CWMgI0MwQzBDMCIsCiJhPQljICNEQURBREEiLAoiYj0JYyAjRUZFQUVBIiwKImM9CWMgI0U0QkZCRiIsCiJkPQljICNEQkFGQUQiLAoiZT0JYyAjQkVCN0IzIiwKImY9CWMgIzMzMzJBQSIsCiJnPQljICMzMTI3QTQiLAoiaD0JYyAjQzJBRkFFIiwKImk9CWMgI0FEQUJBQyIsCiJqPQljICNBQkFDQUQiLAoiaz0JYyAjQUVBREFFIiwKImw9CWMgIzkyOTNBRCIsCiJtPQljICNCOTg2QjAiLAoibj0JYyAjRkNCOUI5IiwKIm89CWMgI0ZFQkRCRCIsCiJwPQljICNFMEIyQzciLAoicT0JYyAjQUFBQUI5IiwKInI9CWMgI0IxQjFCMSIsCiJzPQljICNGM0YzRjMiLAoidD0JYyAjRDNEM0QzIiwKInU9CWMgI0U0REFEQiIsCiJ2PQljICNFN0JCQkMiLAoidz0JYyAjRUJBRkFFIiwKIng9CWMgI0Q0QUNBQyIsCiJ5PQljICM3QzY1QTciLAoiej0JYyAjMEIwOUEyIiwKIkE9CWMgIzA5MDdBMiIsCiJCPQljICM3QjVFQTgiLAoiQz0JYyAjRDBBQ0FEIiwKIkQ9CWMgI0IxQUJBQiIsCiJFPQljICNBRkFGQUUiLAoiRj0JYyAjQjNCMkIwIiwKIkc9CWMgI0IxQjBCMiIsCiJIPQljICMyODI4QTMiLAoiST0JYyAjMEUwQUEyIiwKIko9CWMgIzMyMjRBNCIsCiJLPQljICNFMkE0QjIiLAoiTD0JYyAjRkFCN0I3IiwKIk09CWMgI0ZDQkFCQSIsCiJOPQljICNGRUJFQkUiLAoiTz0JYyAjRkZDN0M5IiwKIlA9CWMgIzQ3MzlBRCIsCiJRPQljICMzNTM1QUIiLAoiUj0JYyAjQkJCQkJDIiwKIlM9CWMgI0JBQkFCQSIsCiJUPQljICNGOEY4RjgiLAoiVT0JYyAjRTREM0QzIiwKIlY9CWMgI0VBQjhCOCIsCiJXPQljICNGNkFDQUMiLAoiWD0JYyAjRjVBREFFIiwKIlk9CWMgI0Y0QUNBRCIsCiJaPQljICNGNUFCQUQiLAoiYD0JYyAjRjRBQkFDIiwKIiAtCWMgI0YyQUJBQiIsCiIuLQljICNGMUFCQUQiLAoiKy0JYyAjRjBBQkFDIiwKIkAtCWMgI0VBQUNBQyIsCiIjLQljICNDN0FDQUMiLAoiJC0JYyAjQjVCMkIxIiwKIiUtCWMgI0IyQjNCMSIsCiImLQljICNBRkFEQUUiLAoiKi0JYyAjQjBBQ0FEIiwKIj0tCWMgI0JEQjFCMiIsCiItLQljICNDM0FDQUMiLAoiOy0JYyAjRENBRUFFIiwKIj4tCWMgI0U4QUNBQyIsCiIsLQljICNFQkFDQUQiLAoiJy0JYyAjRUNBQ0FFIiwKIiktCWMgI0VEQUVBRiIsCiIhLQljICNFRkFGQUYiLAoifi0JYyAjRjFCMEIxIiwKInstCWMgI0YzQjNCMiIsCiJdLQljICNGNkI1QjUiLAoiXi0JYyAjRjlCOEI4IiwKIi8tCWMgI0ZCQkJCQyIsCiIoLQljICNGQkJGQzAiLAoiXy0JYyAjRkJDM0M0IiwKIjotCWMgI0ZCQzhDOCIsCiI8LQljICNGQkNEQ0QiLAoiWy0JYyAjRkJEMkQzIiwKIn0tCWMgI0VERDZENiIsCiJ8LQljICNEQ0Q5RDgiLAoiMS0JYyAjRENEQ0RDIiwKIjItCWMgI0Q5REFEOSIsCiIzLQljICNENUQ1RDUiLAoiNC0JYyAjQ0ZDRkNGIiwKIjUtCWMgI0JDQkNCQyIsCiI2LQljICNFNEU0RTQiLAoiNy0JYyAjRTlEMEQxIiwKIjgtCWMgI0VBQjNCNCIsCiI5LQljICNGN0FCQUMiLAoiMC0JYyAjRkFBQkFCIiwKImEtCWMgI0Y5QUJBQyIsCiJiLQljICNGOEFCQUQiLAoiYy0JYyAjRjZBQkFDIiwKImQtCWMgI0Y1QUJBQiIsCiJlLQljICNGNEFCQUIiLAoiZi0JYyAjRjBBQkFCIiwKImctCWMgI0VGQUJBQiIsCiJoLQljICNFRUFCQUIiLAoiaS0JYyAjRURBQkFCIiwKImotCWMgI0UxQURCMCIsCiJrLQljICNDRkFFQUYiLAoibC0JYyAjQjlBQkFCIiwKIm0tCWMgI0IxQUNBQiIsCiJuLQljICNCMUFDQUQiLAoiby0JYyAjQjJBQ0FEIiwKInAtCWMgI0IxQURBRCIsCiJxLQljICNCNEFEQUQiLAoici0JYyAjQkJBREFEIiwKInMtCWMgI0NGQjBBRiIsCiJ0LQljICNEQkFEQUMiLAoidS0JYyAjRTZBQkFEIiwKInYtCWMgI0U3QUNBRCIsCiJ3LQljICNFOUFEQUUiLAoieC0JYyAjRUFBRUFGIiwKInktCWMgI0VDQjBCMCIsCiJ6LQljICNFRUIyQjEiLAoiQS0JYyAjRjFCNEIzIiwKIkItCWMgI0Y0QjZCNiIsCiJDLQljICNGNkI5QkEiLAoiRC0JYyAjRjZCQ0JEIiwKIkUtCWMgI0Y2QzBDMCIsCiJGLQljICNGN0M0QzQiLAoiRy0JYyAjRjdDOEM4IiwKIkgtCWMgI0Y3Q0NDRCIsCiJJLQljICNFN0QwRDAiLAoiSi0JYyAjRDREMUQwIiwKIkstCWMgI0Q0RDNENCIsCiJMLQljICNEMkQyRDIiLAoiTS0JYyAjQzJDMkMyIiwKIk4tCWMgI0VEQ0VDRSIsCiJPLQljICNFREIxQjMiLAoiUC0JYyAjRjhBQ0FFIiwKIlEtCWMgI0Y5QUJBQiIsCiJSLQljICNGOEFCQUMiLAoiUy0JYyAjRjdBQ0FCIiwKIlQtCWMgI0Y2QUNBQiIsCiJVLQljICNGM0FCQUMiLAoiVi0JYyAjRjBBQkFEIiwKIlctCWMgI0VEQUNBQiIsCiJYLQljICNFN0FDQUMiLAoiWS0JYyAjRTRBREFEIiwKIlotCWMgI0REQUZBRSIsCiJgLQljICNEM0FDQUMiLAoiIDsJYyAjQzlBQ0FEIiwKIi47CWMgI0M3QURBQyIsCiIrOwljICNDQ0FDQUMiLAoiQDsJYyAjREFBRkFFIiwKIiM7CWMgI0REQURBQyIsCiIkOwljICNEREFDQUMiLAoiJTsJYyAjRENBQkFDIiwKIiY7CWMgI0REQUJBQiIsCiIqOwljICNERkFCQUIiLAoiPTsJYyAjRTBBQ0FDIiwKIi07CWMgI0UxQUNBQyIsCiI7OwljICNFMkFEQUQiLAoiPjsJYyAjRTNBRUFFIiwKIiw7CWMgI0U1QUZBRiIsCiInOwljICNFN0IwQjAiLAoiKTsJYyAjRTlCMkIxIiwKIiE7CWMgI0VCQjNCMyIsCiJ+OwljICNFRUI2QjYiLAoiezsJYyAjRUZCOUI5IiwKIl07CWMgI0YwQkNCQyIsCiJeOwljICNGMEJGQkYiLAoiLzsJYyAjRjBDMkMyIiwKIig7CWMgI0YwQzVDNiIsCiJfOwljICNERkM4QzgiLAoiOjsJYyAjQ0FDN0M3IiwKIjw7CWMgI0M5QzhDOSIsCiJbOwljICNCN0I3QjciLAoifTsJYyAjRDlEOUQ5IiwKInw7CWMgI0VEQ0NDRCIsCiIxOwljICNGOEFDQUYiLAoiMjsJYyAjRjhBQ0FEIiwKIjM7CWMgI0Y3QUJBQiIsCiI0OwljICNGM0FDQUIiLAoiNTsJYyAjRUJBQ0FDIiwKIjY7CWMgI0RGQUVCMCIsCiI3OwljICNEREFGQUYiLAoiODsJYyAjREVBRkFFIiwKIjk7CWMgI0UwQUVBRCIsCiIwOwljICNFMEFEQUQiLAoiYTsJYyAjREZBREFEIiwKImI7CWMgI0REQUNBRCIsCiJjOwljICNEQUFDQUMiLAoiZDsJYyAjRDhBQkFDIiwKImU7CWMgI0Q2QUJBQyIsCiJmOwljICNEN0FDQUIiLAoiZzsJYyAjRDhBQ0FCIiwKImg7CWMgI0Q5QUNBQyIsCiJpOwljICNEOUFDQUQiLAoiajsJYyAjREJBREFFIiwKIms7CWMgI0RGQUZCMCIsCiJsOwljICNFMUIxQjEiLAoibTsJYyAjRTJCM0IyIiwKIm47CWMgI0U1QjVCNSIsCiJvOwljICNFNkI3QjciLAoicDsJYyAjRTdCOUJBIiwKInE7CWMgI0U3QkNCQyIsCiJyOwljICNFN0JGQkYiLAoiczsJYyAjRTdDMEMwIiwKInQ7CWMgI0Q4QzJDMiIsCiJ1OwljICNDM0JGQzAiLAoidjsJYyAjQzFDMEMxIiwKInc7CWMgI0MxQzBDMCIsCiJ4OwljICNCRkJGQkYiLAoieTsJYyAjRUJDQ0NDIiwKIno7CWMgI0U4QUZCMCIsCiJBOwljICNEQkFCQUIiLAoiQjsJYyAjRDlBQkFCIiwKIkM7CWMgI0Q1QUJBQyIsCiJEOwljICNEMkFCQUMiLAoiRTsJYyAjQ0ZBQkFCIiwKIkY7CWMgI0NEQUJBQiIsCiJHOwljICNDQ0FCQUIiLAoiSDsJYyAjQ0VBQkFCIiwKIkk7CWMgI0QwQUJBQiIsCiJKOwljICNEMkFCQUIiLAoiSzsJYyAjRDNBQkFCIiwKIkw7CWMgI0QyQUNBQiIsCiJNOwljICNENUFCQUQiLAoiTjsJYyAjRDVBQ0FEIiwKIk87CWMgI0Q2QUVBRCIsCiJQOwljICNEOEFGQjAiLAoiUTsJYyAjRDlCMEIxIiwKIlI7CWMgI0RBQjFCMiIsCiJTOwljICNEQUIzQjQiLAoiVDsJYyAjREFCNUI0IiwKIlU7CWMgI0RBQjZCNSIsCiJWOwljICNDRUI5QjkiLAoiVzsJYyAjQkVCOUJBIiwKIlg7CWMgI0JCQjlCQSIsCiJZOwljICNCQkI5QjkiLAoiWjsJYyAjQkFCQkJCIiwKImA7CWMgI0VBQ0RDQyIsCiIgPgljICNFNkIyQjEiLAoiLj4JYyAjRURBRUFEIiwKIis+CWMgI0VCQUVBRSIsCiJAPgljICNFOUFFQUUiLAoiIz4JYyAjRUFBRUFFIiwKIiQ+CWMgI0VBQURBRCIsCiIlPgljICNFOEFFQUUiLAoiJj4JYyAjRTdBRUFEIiwKIio+CWMgI0U2QUVBRCIsCiI9PgljICNFNUFEQUUiLAoiLT4JYyAjRTZBREFGIiwKIjs+CWMgI0U1QURBRiIsCiI+PgljICNFM0FEQUMiLAoiLD4JYyAjRTFBREFDIiwKIic+CWMgI0RGQURBQyIsCiIpPgljICNERUFEQUMiLAoiIT4JYyAjRENBREFDIiwKIn4+CWMgI0RCQURBRCIsCiJ7PgljICNEQkFDQUMiLAoiXT4JYyAjRDVBQ0FDIiwKIl4+CWMgI0QxQUNBQyIsCiIvPgljICNDQ0FDQUIiLAoiKD4JYyAjQ0FBQ0FCIiwKIl8+CWMgI0NBQUNBQyIsCiI6PgljICNDREFDQUMiLAoiPD4JYyAjQ0VBQ0FDIiwKIls+CWMgI0NGQUNBQiIsCiJ9PgljICNDRkFDQUMiLAoifD4JYyAjRDFBQkFDIiwKIjE+CWMgI0QyQUNBQyIsCiIyPgljICNEM0FDQUQiLAoiMz4JYyAjRDRBREFCIiwKIjQ+CWMgI0Q1QUVBRiIsCiI1PgljICNEQUIzQjIiLAoiNj4JYyAjQ0RCNkI2IiwKIjc+CWMgI0JBQjZCNyIsCiI4PgljICNCOEI3QjYiLAoiOT4JYyAjQjdCN0I4IiwKIjA+CWMgI0VEQ0RDRCIsCiJhPgljICNFRUIyQjIiLAoiYj4JYyAjRkFBREFEIiwKImM+CWMgI0Y5QURBQyIsCiJkPgljICNGN0FDQUUiLAoiZT4JYyAjRjZBREFDIiwKImY+CWMgI0Y1QUNBQiIsCiJnPgljICNGNUFDQUMiLAoiaD4JYyAjRjFBQ0FEIiwKImk+CWMgI0YwQUJBRSIsCiJqPgljICNFREFDQUQiLAoiaz4JYyAjRUNBQ0FDIiwKImw+CWMgI0U2QUNBRCIsCiJtPgljICNFNUFDQUQiLAoibj4JYyAjRTNBQ0FDIiwKIm8+CWMgI0Q2QUNBQiIsCiJwPgljICNEMEFDQUMiLAoicT4JYyAjRDBBQkFDIiwKInI+CWMgI0Q0QUJBQiIsCiJzPgljICNENEFCQUMiLAoidD4JYyAjRDVBQkFCIiwKInU+CWMgI0Q2QUJBQiIsCiJ2PgljICNEN0FCQUQiLAoidz4JYyAjRDhBREFCIiwKIng+CWMgI0Q4QUVBRCIsCiJ5PgljICNEQ0IwQjAiLAoiej4JYyAjRERCMEIwIiwKIkE+CWMgI0RFQjFCMSIsCiJCPgljICNERUIyQjIiLAoiQz4JYyAjQ0ZCNUI1IiwKIkQ+CWMgI0I1QjRCNCIsCiJFPgljICNCNUI1QjQiLAoiRj4JYyAjRDdEN0Q3IiwKIkc+CWMgI0YwQjFCMSIsCiJIPgljICNGQ0FCQUIiLAoiST4JYyAjRkNBQkFDIiwKIko+CWMgI0ZCQUJBQyIsCiJLPgljICNGNUFCQUMiLAoiTD4JYyAjRjFBQkFCIiwKIk0+CWMgI0REQUNBQiIsCiJOPgljICNEN0FCQUIiLAoiTz4JYyAjRDhBQkFCIiwKIlA+CWMgI0RBQUJBQyIsCiJRPgljICNEOUFDQUIiLAoiUj4JYyAjREFBREFCIiwKIlM+CWMgI0RDQURBQiIsCiJUPgljICNEREFEQUQiLAoiVT4JYyAjREZBRUFGIiwKIlY+CWMgI0UwQUZBRiIsCiJXPgljICNFMkIwQjAiLAoiWD4JYyAjRTNCMUIxIiwKIlk+CWMgI0QxQjRCNCIsCiJaPgljICNCOEIyQjMiLAoiYD4JYyAjQjRCM0IzIiwKIiAsCWMgI0I0QjRCMyIsCiIuLAljICNCNEIzQjQiLAoiKywJYyAjRUFEMUQwIiwKIkAsCWMgI0VFQjVCMyIsCiIjLAljICNGQ0FDQUMiLAoiJCwJYyAjRkJBQkFCIiwKIiUsCWMgI0Y4QUJBQiIsCiImLAljICNGM0FCQUIiLAoiKiwJYyAjREJBQkFDIiwKIj0sCWMgI0REQUJBRCIsCiItLAljICNERUFCQUQiLAoiOywJYyAjREVBQkFDIiwKIj4sCWMgI0UwQUJBQyIsCiIsLAljICNERUFEQUIiLAoiJywJYyAjRTBBREFCIiwKIiksCWMgI0UyQUNBRCIsCiIhLAljICNFM0FDQUUiLAoifiwJYyAjRTRBRUFGIiwKInssCWMgI0U2QUVBRiIsCiJdLAljICNFOEIxQjEiLAoiXiwJYyAjRDRCNEI0IiwKIi8sCWMgI0I4QjFCMiIsCiIoLAljICNCM0IyQjMiLAoiXywJYyAjQjNCMkIyIiwKIjosCWMgI0U2RDREMiIsCiI8LAljICNFQ0I5QjciLAoiWywJYyAjRkFBQ0FDIiwKIn0sCWMgI0ZDQUJBRiIsCiJ8LAljICNGOEFEQjAiLAoiMSwJYyAjRjVBREFGIiwKIjIsCWMgI0Y0QURBRCIsCiIzLAljICNFMkFCQUUiLAoiNCwJYyAjRTFBQkFEIiwKIjUsCWMgI0RFQURBRCIsCiI2LAljICNERkFEQUIiLAoiNywJYyAjRTFBREFCIiwKIjgsCWMgI0U4QUNBRiIsCiI5LAljICNFN0FEQUYiLAoiMCwJYyAjRThBREFFIiwKImEsCWMgI0VDQjBCMSIsCiJiLAljICNENUIzQjMiLAoiYywJYyAjRjJGMkYyIiwKImQsCWMgI0UwRTBFMCIsCiJlLAljICNGNkY2RjYiLAoiZiwJYyAjRjVFREVCIiwKImcsCWMgI0VDQkRCQiIsCiJoLAljICNGQUFDQUYiLAoiaSwJYyAjRjRBRkI1IiwKImosCWMgI0Q5QUZCNCIsCiJrLAljICNENEI3QjkiLAoibCwJYyAjRTZCM0IyIiwKIm0sCWMgI0Y2QUJBQiIsCiJuLAljICNGM0FCQUQiLAoibywJYyAjRTNBQkFEIiwKInAsCWMgI0UzQUNBQiIsCiJxLAljICNFMUFEQUQiLAoiciwJYyAjREFBRUFFIiwKInMsCWMgI0Q0QUZBRiIsCiJ0LAljICNEMUFGQUUiLAoidSwJYyAjRDFBRkFEIiwKInYsCWMgI0QyQUZBRCIsCiJ3LAljICNEOUFFQjEiLAoieCwJYyAjRTJBQ0FFIiwKInksCWMgI0U5QUNBRCIsCiJ6LAljICNFOUFDQUUiLAoiQSwJYyAjRUFBREFFIiwKIkIsCWMgI0VDQURBRSIsCiJDLAljICNFRUFEQUUiLAoiRCwJYyAjRUVBRUFGIiwKIkUsCWMgI0Q1QjFCMSIsCiJGLAljICNCNUFGQUUiLAoiRywJYyAjQjBCMEFGIiwKIkgsCWMgI0Y4RjNGMyIsCiJJLAljICNFQUJGQkYiLAoiSiwJYyAjRjZBRUIyIiwKIkssCWMgI0U5QjJCOSIsCiJMLAljICNDQkIxQkIiLAoiTSwJYyAjQkRCMUI5IiwKIk4sCWMgI0M0QjNCNiIsCiJPLAljICNENEI1QjUiLAoiUCwJYyAjRERBRkIwIiwKIlEsCWMgI0VFQUZBRSIsCiJSLAljICNFM0FDQUQiLAoiUywJYyAjRDhCMkFFIiwKIlQsCWMgI0NCQjNCMyIsCiJVLAljICNCREFDQUUiLAoiViwJYyAjQjhBQkFCIiwKIlcsCWMgI0I2QUJBQyIsCiJYLAljICNCNkFDQUQiLAoiWSwJYyAjQzNCNkI5IiwKIlosCWMgI0Q4QkJCQSIsCiJgLAljICNERUIzQjAiLAoiICcJYyAjRThBREFEIiwKIi4nCWMgI0VBQUNBRCIsCiIrJwljICNFQ0FDQUQiLAoiQCcJYyAjRUVBREFEIiwKIiMnCWMgI0VEQUVBRSIsCiIkJwljICNENEIwQjEiLAoiJScJYyAjQjJBREFEIiwKIiYnCWMgI0FFQUVBRiIsCiIqJwljICNBRUFGQUYiLAoiPScJYyAjRjBGMEYwIiwKIi0nCWMgI0ZBRjRGNCIsCiI7JwljICNFOEM0QzQiLAoiPicJYyAjRUVCMkI1IiwKIiwnCWMgI0RFQjNCQiIsCiInJwljICNDQ0I2Q0EiLAoiKScJYyAjQ0RCQkNEIiwKIiEnCWMgI0NGQjdCQyIsCiJ+JwljICNENEI5QjUiLAoieycJYyAjQzhBRkFEIiwKIl0nCWMgI0RFQjJBRSIsCiJeJwljICNGMkFEQUIiLAoiLycJYyAjREVBREFGIiwKIignCWMgI0RDQjZCNyIsCiJfJwljICNERUM3QzAiLAoiOicJYyAjRDFDRkNDIiwKIjwnCWMgI0I5QkNCRCIsCiJbJwljICNBQ0FCQUUiLAoifScJYyAjQUNBQkFEIiwKInwnCWMgI0FGQjBCNSIsCiIxJwljICNDNkNFRDEiLAoiMicJYyAjQ0VDNUJFIiwKIjMnCWMgI0RCQzZDMSIsCiI0JwljICNENUI1QjciLAoiNScJYyAjRTNBREFEIiwKIjYnCWMgI0VCQURBRCIsCiI3JwljICNEMkIwQjAiLAoiOCcJYyAjQjBBQ0FDIiwKIjknCWMgI0FEQURBRSIsCiIwJwljICM4Nzg3QUIiLAoiYScJYyAjMEUwRUEyIiwKImInCWMgIzA1MDVBMSIsCiJjJwljICM4MDdGQTkiLAoiZCcJYyAjRjVGNUY1IiwKImUnCWMgI0Y4RjRGNSIsCiJmJwljICNFOENEQ0QiLAoiZycJYyAjRTZCOEI5IiwKImgnCWMgI0Q2QjJCQiIsCiJpJwljICNDM0IzQ0UiLAoiaicJYyAjQ0JCN0NGIiwKImsnCWMgI0RFQkFCRCIsCiJsJwljICNFQUMzQjYiLAoibScJYyAjRTFDMkI2IiwKIm4nCWMgI0YxQ0JCQyIsCiJvJwljICNGMUJBQUUiLAoicCcJYyAjRjJBQ0FCIiwKInEnCWMgI0RGQURBRSIsCiJyJwljICNDREIwQjQiLAoicycJYyAjRDdDOEM3IiwKInQnCWMgI0QwQkRCMyIsCiJ1JwljICNDRUNBQzQiLAoidicJYyAjQjhCQUJBIiwKIncnCWMgI0FCQUNBRSIsCiJ4JwljICNBQkFCQUQiLAoieScJYyAjQUNBRUIxIiwKInonCWMgI0JFQzVDNyIsCiJBJwljICNEM0M5QzAiLAoiQicJYyAjRDZDREM4IiwKIkMnCWMgI0JEQjRCOCIsCiJEJwljICNEOEFFQUUiLAoiRScJYyAjRDBBRkFGIiwKIkYnCWMgI0FGQUNBQiIsCiJHJwljICNBQ0FDQUQiLAoiSCcJYyAjNzk3OUE5IiwKIkknCWMgIzAzMDNBMSIsCiJKJwljICM2RjZFQTciLAoiSycJYyAjRjBERkRGIiwKIkwnCWMgI0UyQkVCRSIsCiJNJwljICNEOEIzQjgiLAoiTicJYyAjQzhCNkNFIiwKIk8nCWMgI0M5QjVDQiIsCiJQJwljICNEQUI1QkIiLAoiUScJYyAjRTdCQkI0IiwKIlInCWMgI0U2QzFCNSIsCiJTJwljICNGNUQ1QkUiLAoiVCcJYyAjRkFEMUI4IiwKIlUnCWMgI0YxQjFBQyIsCiJWJwljICNFMkFCQUMiLAoiVycJYyAjRDVBRUFFIiwKIlgnCWMgI0I4QUNCMCIsCiJZJwljICNDNUNGQ0MiLAoiWicJYyAjQ0NEOEM4IiwKImAnCWMgI0I5QzNDOCIsCiIgKQljICNCNUI5QzAiLAoiLikJYyAjQkRDMUMyIiwKIispCWMgI0IxQjdCRCIsCiJAKQljICNBREIxQjgiLAoiIykJYyAjQkZDMkMyIiwKIiQpCWMgI0M2QzlDNyIsCiIlKQljICNCNkJGQzUiLAoiJikJYyAjQzlEMEM4IiwKIiopCWMgI0NERDVEMCIsCiI9KQljICNCM0I1QjkiLAoiLSkJYyAjQzRBQ0FDIiwKIjspCWMgI0U3QUNBQiIsCiI+KQljICNDRUFFQUYiLAoiLCkJYyAjQUZBQkFCIiwKIicpCWMgI0E5QUFBQyIsCiIpKQljICM5QzlCQUEiLAoiISkJYyAjMTMxM0EyIiwKIn4pCWMgIzZFNkVBNyIsCiJ7KQljICNGNEVGRUYiLAoiXSkJYyAjRTRDOEM4IiwKIl4pCWMgI0REQjBCNSIsCiIvKQljICNDQ0I1Q0EiLAoiKCkJYyAjQ0NCOENDIiwKIl8pCWMgI0RBQjZCQyIsCiI6KQljICNFOEJBQjUiLAoiPCkJYyAjRTdCRkIxIiwKIlspCWMgI0YzRDNCNiIsCiJ9KQljICNGOUQ1QjIiLAoifCkJYyAjRjZDMEIwIiwKIjEpCWMgI0YyQUVBQiIsCiIyKQljICNDMkFDQUQiLAoiMykJYyAjQjJBRkIxIiwKIjQpCWMgI0M3Q0RDNyIsCiI1KQljICNDREQ1QzQiLAoiNikJYyAjQkNDQ0NGIiwKIjcpCWMgI0M4Q0NDRCIsCiI4KQljICNDOUM1QzEiLAoiOSkJYyAjQzJDQkNGIiwKIjApCWMgI0I0QkVDOCIsCiJhKQljICNDQ0NEQ0QiLAoiYikJYyAjQzRDNEJGIiwKImMpCWMgI0M5RDZEQSIsCiJkKQljICNDQkQ1Q0QiLAoiZSkJYyAjQzJDQUMxIiwKImYpCWMgI0JGQzRDNCIsCiJnKQljICNEN0FFQUUiLAoiaCkJYyAjQ0RBRUFFIiwKImkpCWMgIzE1MTVBMiIsCiJqKQljICNFOEQ1RDQiLAoiaykJYyAjRTVCNkJDIiwKImwpCWMgI0NDQjFDMyIsCiJtKQljICNDQ0I3Q0EiLAoibikJYyAjRENCOEMwIiwKIm8pCWMgI0U3QkFCMiIsCiJwKQljICNFN0JFQUYiLAoicSkJYyAjRjNEMUIyIiwKInIpCWMgI0Y5RDdBRSIsCiJzKQljICNGOENEQUYiLAoidCkJYyAjRjBCM0FCIiwKInUpCWMgI0RBQURBRSIsCiJ2KQljICNCQ0JDQkUiLAoidykJYyAjQzZDMkJFIiwKIngpCWMgI0NFQzZCRCIsCiJ5KQljICNDMUNEQ0IiLAoieikJYyAjQ0JDRUNBIiwKIkEpCWMgI0QxQzhDMiIsCiJCKQljICNCREMwQzEiLAoiQykJYyAjQUZCM0I5IiwKIkQpCWMgI0M3QzZDNyIsCiJFKQljICNDQkNBQzciLAoiRikJYyAjQjhDMUMyIiwKIkcpCWMgI0M2Q0FDNCIsCiJIKQljICNDQ0NEQzciLAoiSSkJYyAjQkZDMkMwIiwKIkopCWMgI0QyQURBRCIsCiJLKQljICNDQUFEQUUiLAoiTCkJYyAjMTYxNUEyIiwKIk0pCWMgIzM5MzlCNiIsCiJOKQljICMwRDBCQTQiLAoiTykJYyAjQUU5N0I5IiwKIlApCWMgIzRFNDVBRCIsCiJRKQljICMxODE1QTUiLAoiUikJYyAjMEQwQUEyIiwKIlMpCWMgIzUzNDVBOCIsCiJUKQljICNFM0M0QjQiLAoiVSkJYyAjRTJDNkFFIiwKIlYpCWMgIzVFNTFBNiIsCiJXKQljICMxRTE3QTMiLAoiWCkJYyAjMTcxMUEyIiwKIlkpCWMgIzRFMzhBNSIsCiJaKQljICNEQjlDQUIiLAoiYCkJYyAjRDg5RUFCIiwKIiAhCWMgIzdENUNBNyIsCiIuIQljICMzRDJEQTQiLAoiKyEJYyAjMUQxNUEyIiwKIkAhCWMgIzBBMDdBMSIsCiIjIQljICMwRTBCQTIiLAoiJCEJYyAjMkMyMUEzIiwKIiUhCWMgIzU2NDJBNSIsCiImIQljICNCNzk2QUMiLAoiKiEJYyAjQjNBQkFDIiwKIj0hCWMgI0IzQjZCQiIsCiItIQljICNDNEM5Q0QiLAoiOyEJYyAjQzNDNUM2IiwKIj4hCWMgI0FFQjJCOSIsCiIsIQljICNCMEI0QkEiLAoiJyEJYyAjQjNCNkI5IiwKIikhCWMgI0FEQURCMCIsCiIhIQljICNBQ0FCQUYiLAoifiEJYyAjOUY5RUIwIiwKInshCWMgIzU0NTRBQSIsCiJdIQljICMyNzI3QTMiLAoiXiEJYyAjMTIxMkEzIiwKIi8hCWMgIzA3MDdBMyIsCiIoIQljICMxQzFEQTQiLAoiXyEJYyAjMzQzM0E1IiwKIjohCWMgIzZFNUJBNyIsCiI8IQljICMyQzIyQTMiLAoiWyEJYyAjQjc4QUE5IiwKIn0hCWMgI0UxQUNBRCIsCiJ8IQljICNDOEFDQUMiLAoiMSEJYyAjQzRDNEU1IiwKIjIhCWMgIzMzMzNCMyIsCiIzIQljICMzMDMwQjIiLAoiNCEJYyAjNTM0OUFBIiwKIjUhCWMgIzI4MjNBNCIsCiI2IQljICMyODFDQTIiLAoiNyEJYyAjRUZBQUFCIiwKIjghCWMgI0M4OTJBQSIsCiI5IQljICMxMTBDQTIiLAoiMCEJYyAjN0U3OEE5IiwKImEhCWMgI0FGQjJCNCIsCiJiIQljICNBREFGQjEiLAoiYyEJYyAjQUJBQkFGIiwKImQhCWMgI0FCQUJCMCIsCiJlIQljICNBQkFDQjAiLAoiZiEJYyAjODU4NUFBIiwKImchCWMgIzA3MDdBMSIsCiJoIQljICMwQjBCQTIiLAoiaSEJYyAjMDgwOEEyIiwKImohCWMgIzc2NTlBNiIsCiJrIQljICNERkFDQUQiLAoibCEJYyAjQzVBQ0FCIiwKIm0hCWMgI0FEQUJBQiIsCiJuIQljICNEQURBRjEiLAoibyEJYyAjMkIyQkIxIiwKInAhCWMgIzA1MDVBMyIsCiJxIQljICMwNzA2QTIiLAoiciEJYyAjNkE1OUFCIiwKInMhCWMgIzg2NzdBQSIsCiJ0IQljICM0MDM3QTciLAoidSEJYyAjM0QzNUE0IiwKInYhCWMgI0E0ODlBQyIsCiJ3IQljICM2RDUyQTYiLAoieCEJYyAjQjU4MUE5IiwKInkhCWMgI0E2NzlBOCIsCiJ6IQljICMwNTAzQTEiLAoiQSEJYyAjNEYzQUE0IiwKIkIhCWMgIzlGNzVBOSIsCiJDIQljICNDNjkzQUIiLAoiRCEJYyAjQzM5MUFBIiwKIkUhCWMgIzkxNkRBOCIsCiJGIQljICMxQTE0QTIiLAoiRyEJYyAjMTQxM0EyIiwKIkghCWMgI0EzQTRBRCIsCiJJIQljICNCMEIzQjYiLAoiSiEJYyAjQUVCMEIyIiwKIkshCWMgI0E3QTdBRiIsCiJMIQljICMzMzM0QTYiLAoiTSEJYyAjOTQ5N0FFIiwKIk4hCWMgI0JDQkFCOSIsCiJPIQljICNDOEM3QzciLAoiUCEJYyAjQTlBQUJDIiwKIlEhCWMgIzYxNUJBNyIsCiJSIQljICMwQTA4QTEiLAoiUyEJYyAjNkQ1M0E3IiwKIlQhCWMgI0RDQURBRCIsCiJVIQljICNDM0FCQUIiLAoiViEJYyAjNkY2RkE4IiwKIlchCWMgI0JGQkZFOCIsCiJYIQljICMxMzEzQTgiLAoiWSEJYyAjOTU5NUQ4IiwKIlohCWMgI0YyRjJGQiIsCiJgIQljICM5QjhBQzIiLAoiIH4JYyAjRERCOUI3IiwKIi5+CWMgI0NDQUZBRCIsCiIrfgljICNCREFDQjAiLAoiQH4JYyAjMTExMEEzIiwKIiN+CWMgIzE5MTZBMyIsCiIkfgljICNFRUQwQUYiLAoiJX4JYyAjRjVDREI0IiwKIiZ+CWMgI0U5QUVBQiIsCiIqfgljICMxRjE2QTIiLAoiPX4JYyAjODE1QkE2IiwKIi1+CWMgI0JCODhBOSIsCiI7fgljICNENzlFQUIiLAoiPn4JYyAjQjg4Q0FCIiwKIix+CWMgIzAyMDFBMSIsCiInfgljICM4Mjg0QjEiLAoiKX4JYyAjQzZDQkNDIiwKIiF+CWMgI0M1QzhDNiIsCiJ+fgljICNCMkI3QkIiLAoie34JYyAjQjlCQUJFIiwKIl1+CWMgIzhDOERCMyIsCiJefgljICNCQ0JFQzgiLAoiL34JYyAjQkZDOEQwIiwKIih+CWMgI0NCQ0JDNCIsCiJffgljICNDNEMzQkIiLAoiOn4JYyAjQkY5QUFEIiwKIjx+CWMgIzdCNUZBNyIsCiJbfgljICNEQUFEQUQiLAoifX4JYyAjNzM3M0FDIiwKInx+CWMgI0UxRTFFMSIsCiIxfgljICM1MTUxQkYiLAoiMn4JYyAjRjVGNUZCIiwKIjN+CWMgI0I2QjNERiIsCiI0fgljICNFOUNCQ0EiLAoiNX4JYyAjREZCMkIxIiwKIjZ+CWMgI0M2QURBRSIsCiI3fgljICMzMzMwQTciLAoiOH4JYyAjNUU1N0E5IiwKIjl+CWMgI0VERDVCNiIsCiIwfgljICNGM0NCQjQiLAoiYX4JYyAjRURCMEFCIiwKImJ+CWMgIzM5MjhBNCIsCiJjfgljICMxRjE4QTMiLAoiZH4JYyAjNjk2QUFEIiwKImV+CWMgI0M3QzdDMCIsCiJmfgljICNDQ0M5QjkiLAoiZ34JYyAjQzNEMUNEIiwKImh+CWMgI0NEQkRCOCIsCiJpfgljICM5Njk4QkQiLAoian4JYyAjQjFBOUJDIiwKImt+CWMgI0JGQzdDRCIsCiJsfgljICNDOEQzQzkiLAoibX4JYyAjQzdDRkM2IiwKIm5+CWMgI0I0QjFCMiIsCiJvfgljICNDRkFFQUUiLAoicH4JYyAjQ0E5QkFBIiwKInF+CWMgIzcwNTZBNiIsCiJyfgljICNDNzlBQUIiLAoic34JYyAjRDdBREFFIiwKInR+CWMgI0JFQUJBQiIsCiJ1fgljICM4MzgzQzAiLAoidn4JYyAjODg4OEQzIiwKInd+CWMgIzAzMDNBMiIsCiJ4fgljICM2RDZEQzkiLAoieX4JYyAjQjZCNkU0IiwKInp+CWMgI0Y2RUFFQSIsCiJBfgljICNFNEJGQkUiLAoiQn4JYyAjRDhBRkFGIiwKIkN+CWMgIzNBMzRBNiIsCiJEfgljICM2NDYxQTciLAoiRX4JYyAjQzNCN0FFIiwKIkZ+CWMgI0UyQkVCMyIsCiJHfgljICNFQ0IwQUMiLAoiSH4JYyAjNEYzOEE1IiwKIkl+CWMgIzVGNDNBNSIsCiJKfgljICNEQTlGQUEiLAoiS34JYyAjNzk1OUE3IiwKIkx+CWMgIzNGMkVBMyIsCiJNfgljICMyMzFBQTIiLAoiTn4JYyAjMTYxMEEyIiwKIk9+CWMgIzMzMjZBMyIsCiJQfgljICM1MjNEQTUiLAoiUX4JYyAjMTgxMkEyIiwKIlJ+CWMgIzU3NTRBOCIsCiJTfgljICNDMkM3QzMiLAoiVH4JYyAjRDBENUM2IiwKIlV+CWMgI0I2QzNDNSIsCiJWfgljICNCRkMyQzYiLAoiV34JYyAjQzhDM0MyIiwKIlh+CWMgI0I0QjRCQyIsCiJZfgljICMwQTBBQTIiLAoiWn4JYyAjMEMwQkEzIiwKImB+CWMgIzQzNDRBQyIsCiIgewljICM1RDVDQUQiLAoiLnsJYyAjNzI2REIxIiwKIit7CWMgIzgxNzNBRCIsCiJAewljICNBNDgzQUIiLAoiI3sJYyAjQzA5NUFCIiwKIiR7CWMgI0RDQUFBQiIsCiIlewljICNEQ0FCQUQiLAoiJnsJYyAjMkMyQ0IwIiwKIip7CWMgIzVFNUVDNCIsCiI9ewljICNCNUI1RTQiLAoiLXsJYyAjRjJFMkUyIiwKIjt7CWMgI0U2QjlCOSIsCiI+ewljICM0MTM0QTYiLAoiLHsJYyAjNzQ2N0FDIiwKIid7CWMgI0MzQUNBRiIsCiIpewljICNEQkFFQUQiLAoiIXsJYyAjRUZBRUFDIiwKIn57CWMgIzU3M0VBNSIsCiJ7ewljICM4NTYxQTciLAoiXXsJYyAjMTIwREExIiwKIl57CWMgIzYxNTVBOSIsCiIvewljICNDQ0M2QzUiLAoiKHsJYyAjQ0JDQ0MwIiwKIl97CWMgI0M1Q0FDOSIsCiI6ewljICNCM0I3QkEiLAoiPHsJYyAjQUJBQ0FGIiwKIlt7CWMgIzgwODBBQiIsCiJ9ewljICMwNjA2QTEiLAoifHsJYyAjMUIxNUEyIiwKIjF7CWMgIzcwNTdBNyIsCiIyewljICNEN0E5QUQiLAoiM3sJYyAjRDNBRUFGIiwKIjR7CWMgIzE3MTdBNCIsCiI1ewljICNEMUQxRUUiLAoiNnsJYyAjRkNGQkZCIiwKIjd7CWMgI0VGRDdENiIsCiI4ewljICM0NjM1QTYiLAoiOXsJYyAjODg2OEFDIiwKIjB7CWMgI0UzQjBCNCIsCiJhewljICNBMjc1QTgiLAoiYnsJYyAjMzgyOUEzIiwKImN7CWMgI0EwNzVBOCIsCiJkewljICNEQUEzQUIiLAoiZXsJYyAjRTFBOUFDIiwKImZ7CWMgI0I2ODhBQiIsCiJnewljICMyNjFEQTMiLAoiaHsJYyAjNkE1NUE4IiwKIml7CWMgI0Q2QjdCNiIsCiJqewljICNEOEMyQkIiLAoia3sJYyAjRDFDOEMwIiwKImx7CWMgI0JFQkFCOSIsCiJtewljICNBRkFCQUUiLAoibnsJYyAjQUZBQkFDIiwKIm97CWMgI0FFQUJBQyIsCiJwewljICM5RjlCQUIiLAoicXsJYyAjNUQ1OUE4IiwKInJ7CWMgIzJDMjlBNSIsCiJzewljICMxQTE2QTMiLAoidHsJYyAjNTA0MEE1IiwKInV7CWMgI0QxQUVBRiIsCiJ2ewljICNCN0FCQUIiLAoid3sJYyAjQURBQ0FDIiwKInh7CWMgIzE4MThBNyIsCiJ5ewljICMwRTBFQTciLAoiensJYyAjQUZBRkUyIiwKIkF7CWMgIzIzMjNBRSIsCiJCewljICMxQjFCQUIiLAoiQ3sJYyAjRTVFNUY1IiwKIkR7CWMgI0ZDRjhGOCIsCiJFewljICM0NjNCQUQiLAoiRnsJYyAjOTA2N0E5IiwKIkd7CWMgI0YwQURBRSIsCiJIewljICM1ODNFQTUiLAoiSXsJYyAjNUU0M0E1IiwKIkp7CWMgIzQ4MzRBNCIsCiJLewljICMzQzJDQTMiLAoiTHsJYyAjRTVBOEFCIiwKIk17CWMgIzNDMkRBNCIsCiJOewljICM2RDU0QTYiLAoiT3sJYyAjRDNBRUIwIiwKIlB7CWMgI0MxQURBRSIsCiJRewljICNDMUFEQUQiLAoiUnsJYyAjQkNBN0FEIiwKIlN7CWMgI0NBQUNBRCIsCiJUewljICNEMUFEQUUiLAoiVXsJYyAjRDdBQ0FDIiwKIlZ7CWMgI0NFQTJBQSIsCiJXewljICNBQTg2QUEiLAoiWHsJYyAjMzcyQ0E0IiwKIll7CWMgI0I3OUNBRSIsCiJaewljICNCNEFCQUIiLAoiYHsJYyAjQzdDNUM2IiwKIiBdCWMgIzE2MTZBOSIsCiIuXQljICMxNTE1QTkiLAoiK10JYyAjM0UzQ0I1IiwKIkBdCWMgIzhENjlBQiIsCiIjXQljICNGNEFDQUIiLAoiJF0JYyAjOEE2NUE3IiwKIiVdCWMgI0Q3QTJBQiIsCiImXQljICMwQzA5QTEiLAoiKl0JYyAjQTc4N0FBIiwKIj1dCWMgIzA1MDRBMSIsCiItXQljICM2QjU1QTYiLAoiO10JYyAjRDhBQ0FDIiwKIj5dCWMgI0Q3QUJBQyIsCiIsXQljICNCMzhFQTkiLAoiJ10JYyAjOEQ3QUFBIiwKIildCWMgI0MwQzFDMCIsCiIhXQljICM4QzhDRDQiLAoifl0JYyAjQzRDNEU5IiwKIntdCWMgIzBBMEFBNSIsCiJdXQljICM0MDQwQjgiLAoiXl0JYyAjODk3QUJGIiwKIi9dCWMgI0VFQjRCMyIsCiIoXQljICM1NjNFQTUiLAoiX10JYyAjNTEzQkE0IiwKIjpdCWMgI0M5OTZBQSIsCiI8XQljICMyRTIzQTMiLAoiW10JYyAjNkQ1M0E2IiwKIn1dCWMgIzg4NjlBOCIsCiJ8XQljICNBRTg5QTkiLAoiMV0JYyAjOUU3RkE5IiwKIjJdCWMgIzlFOEVBQSIsCiIzXQljICNBOEE4REYiLAoiNF0JYyAjNUM1Q0MzIiwKIjVdCWMgI0EyQTJERCIsCiI2XQljICM3ODc2Q0MiLAoiN10JYyAjRjVERURFIiwKIjhdCWMgI0VCQjdCNyIsCiI5XQljICNFREFEQUUiLAoiMF0JYyAjNTgzRkE1IiwKImFdCWMgI0VFQUFBQiIsCiJiXQljICM1RDQ0QTUiLAoiY10JYyAjNDkzNkE0IiwKImRdCWMgIzlCNzJBOSIsCiJlXQljICNBNzdCQTkiLAoiZl0JYyAjODg2NUE4IiwKImddCWMgIzREMzlBNCIsCiJoXQljICMwNDAzQTEiLAoiaV0JYyAjREFBNkFBIiwKImpdCWMgIzg3NjlBOCIsCiJrXQljICMwOTA3QTEiLAoibF0JYyAjNjg1MkE1IiwKIm1dCWMgI0I3OTFBQSIsCiJuXQljICNEMkE5QUIiLAoib10JYyAjOTU3OEE4IiwKInBdCWMgIzE3MTNBMiIsCiJxXQljICMyMDFCQTMiLAoicl0JYyAjQjhBQUFDIiwKInNdCWMgI0VFRUVGOSIsCiJ0XQljICM4Nzg3RDMiLAoidV0JYyAjNzQ3NENDIiwKInZdCWMgI0RFREVGNCIsCiJ3XQljICMyQTJBQjAiLAoieF0JYyAjMDgwOEE0IiwKInldCWMgIzNDM0NCNyIsCiJ6XQljICMxMjEyQTgiLAoiQV0JYyAjRTlFMkVDIiwKIkJdCWMgI0VBQzNDMyIsCiJDXQljICM1QjQ0QTYiLAoiRF0JYyAjMEIwOEExIiwKIkVdCWMgI0JEODhBQiIsCiJGXQljICNEQ0ExQUEiLAoiR10JYyAjMjUxQkEzIiwKIkhdCWMgIzgwNjBBNyIsCiJJXQljICM2QzUyQTYiLAoiSl0JYyAjMkUyNEE0IiwKIktdCWMgIzg5NkNBOCIsCiJMXQljICMwODA3QTIiLAoiTV0JYyAjMTUxMUEyIiwKIk5dCWMgIzEzMEZBMSIsCiJPXQljICNBRTkyQUIiLAoiUF0JYyAjQjdBQkFDIiwKIlFdCWMgI0QwRDBEMSIsCiJSXQljICM4RThFRDUiLAoiU10JYyAjMkMyQ0IxIiwKIlRdCWMgIzNBM0FCNyIsCiJVXQljICNERERERjIiLAoiVl0JYyAjNjg2OEM4IiwKIlddCWMgI0VCRUJGOCIsCiJYXQljICNGQUYyRjIiLAoiWV0JYyAjQTg5NEMyIiwKIlpdCWMgIzEwMENBMiIsCiJgXQljICMxMDBCQTIiLAoiIF4JYyAjQkQ4OUFBIiwKIi5eCWMgI0UyQTVBQiIsCiIrXgljICMzMTI0QTMiLAoiQF4JYyAjMEQwOUExIiwKIiNeCWMgIzJEMjJBMyIsCiIkXgljICM3MTU0QTYiLAoiJV4JYyAjQ0Y5QkFBIiwKIiZeCWMgI0I2ODlBOSIsCiIqXgljICM0NDM0QTQiLAoiPV4JYyAjQkI5M0FBIiwKIi1eCWMgIzE0MTBBMiIsCiI7XgljICM0QTNBQTUiLAoiPl4JYyAjN0Q2M0E3IiwKIixeCWMgIzUzNDFBNSIsCiInXgljICMyODIwQTMiLAoiKV4JYyAjMTIwRkEyIiwKIiFeCWMgIzE4MTNBMyIsCiJ+XgljICMzNDJBQTMiLAoie14JYyAjNzI1REE3IiwKIl1eCWMgI0M3QTRBQyIsCiJeXgljICNDN0FDQUQiLAoiL14JYyAjQzBCNkI2IiwKIiheCWMgI0UzRTNFMyIsCiJfXgljICNCQ0JDRTYiLAoiOl4JYyAjRjZGNkZDIiwKIjxeCWMgIzA2MDZDRiIsCiJbXgljICNGOEVFRUUiLAoifV4JYyAjRUNDOEM4IiwKInxeCWMgI0U3QjBCMiIsCiIxXgljICNFNkFEQUUiLAoiMl4JYyAjREFBRUFEIiwKIjNeCWMgI0RDQUZBRCIsCiI0XgljICNEREFGQUQiLAoiNV4JYyAjRTBBRUFDIiwKIjZeCWMgI0Q0QUNBQiIsCiI3XgljICNDRkFDQUUiLAoiOF4JYyAjQ0NCMkIzIiwKIjleCWMgI0RFRDFEMSIsCiIwXgljICNGOEY3RjciLAoiYV4JYyAjMzMzM0Q3IiwKImJeCWMgI0U4RThGQiIsCiJjXgljICNGQkY3RjgiLAoiZF4JYyAjRUZEOEQ5IiwKImVeCWMgI0RBQjdCOCIsCiJmXgljICNCRkFEQUMiLAoiZ14JYyAjQkVBQ0FDIiwKImheCWMgI0MyQURBRCIsCiJpXgljICNENkFFQUYiLAoial4JYyAjRERBRUFGIiwKImteCWMgI0UwQUNBRSIsCiJsXgljICNEMUFDQUIiLAoibV4JYyAjQ0VBQ0FFIiwKIm5eCWMgI0QyQkJCRCIsCiJvXgljICNFN0RFREUiLAoicF4JYyAjMUUxRUQ0IiwKInFeCWMgI0I4QjhGMSIsCiJyXgljICNGQUY5RjkiLAoic14JYyAjRDdEMENGIiwKInReCWMgI0MyQkZCRSIsCiJ1XgljICNCNkI4QjgiLAoidl4JYyAjQjlCOEJCIiwKIndeCWMgI0JCQjRCNyIsCiJ4XgljICNCOEIyQjIiLAoieV4JYyAjQjRCMUFGIiwKInpeCWMgI0I0QjBBRiIsCiJBXgljICNCQkFFQUUiLAoiQl4JYyAjQ0RCMUIxIiwKIkNeCWMgI0Q2QUZCMCIsCiJEXgljICNEOEFDQUQiLAoiRV4JYyAjRENBQ0FEIiwKIkZeCWMgI0QxQURBRCIsCiJHXgljICNDRUFFQUUiLAoiSF4JYyAjRDJCOUI5IiwKIkleCWMgI0UxRDRENCIsCiJKXgljICNGQkZBRkEiLAoiS14JYyAjRjZGNkZFIiwKIkxeCWMgIzA4MDhDRiIsCiJNXgljICM2NzY3RTIiLAoiTl4JYyAjREZFMkUyIiwKIk9eCWMgI0M5Q0JDRSIsCiJQXgljICNCOUJBQkQiLAoiUV4JYyAjQjlCREJFIiwKIlJeCWMgI0I0QjhCOCIsCiJTXgljICNCOEI5QjkiLAoiVF4JYyAjQkNCQkJDIiwKIlVeCWMgI0JFQjhCQSIsCiJWXgljICNCQ0FGQjIiLAoiV14JYyAjQkJBQkFDIiwKIlheCWMgI0NGQURBRCIsCiJZXgljICNDQ0IxQjEiLAoiWl4JYyAjRDZDM0M0IiwKImBeCWMgI0U0RDlEOSIsCiIgLwljICNGMUVCRUIiLAoiLi8JYyAjQTRBNEVFIiwKIisvCWMgIzIwMjBENSIsCiJALwljICNGMEYyRjIiLAoiIy8JYyAjRDREOEQ5IiwKIiQvCWMgI0NBQ0NDRSIsCiIlLwljICNDQUM5Q0IiLAoiJi8JYyAjQzNDN0M4IiwKIiovCWMgI0JGQzNDNiIsCiI9LwljICNCQUJEQzAiLAoiLS8JYyAjQjRCM0I1IiwKIjsvCWMgI0I5QUVBRiIsCiI+LwljICNENUFGQjAiLAoiLC8JYyAjRDZCNUI1IiwKIicvCWMgI0Q5QkNCQyIsCiIpLwljICNEQkMxQzEiLAoiIS8JYyAjREZDOUM5IiwKIn4vCWMgI0U5RENEQyIsCiJ7LwljICNGNEVERUQiLAoiXS8JYyAjRkJGOUY5IiwKIl4vCWMgIzUwNTBERSIsCiIvLwljICM5MjkyRUEiLAoiKC8JYyAjRUZGMEYwIiwKIl8vCWMgI0U3RThFOCIsCiI6LwljICNFMUUwRTEiLAoiPC8JYyAjREVEQ0REIiwKIlsvCWMgI0UxREJEQyIsCiJ9LwljICNFMUQ5RDkiLAoifC8JYyAjRTNENkQ3IiwKIjEvCWMgI0UzRDNENCIsCiIyLwljICNFN0Q3RDciLAoiMy8JYyAjRThEQ0RDIiwKIjQvCWMgI0VERTVFNiIsCiI1LwljICNGNUYwRjAiLAoiNi8JYyAjRDFEMUY3IiwKIjcvCWMgIzA1MDVDRiIsCiI4LwljICMxOTE5RDMiLAoiOS8JYyAjRUZFRkZDIiwKIjAvCWMgIzNFM0VEQSIsCiJhLwljICM3MzczRTQiLAoiYi8JYyAjNTU1NURFIiwKImMvCWMgIzhBOEFFOCIsCiJkLwljICMwMjAyQ0YiLAoiZS8JYyAjMzYzNkQ4IiwKImYvCWMgI0U1RTVGQiIsCiJnLwljICNGOEY4RkUiLAoiaC8JYyAjRjBGMEZDIiwKImkvCWMgIzNDM0NEOSIsCiJqLwljICM3QTdBRTUiLAoiay8JYyAjOUI5QkVCIiwKImwvCWMgI0I2QjZGMiIsCiJtLwljICNCQUJBRjEiLAoibi8JYyAjQTFBMUVEIiwKIm8vCWMgIzg1ODVFNyIsCiJwLwljICM0QjRCREQiLAoicS8JYyAjMEUwRUQxIiwKIiAgICAgICAgICAgICAgICAgICAgICAgIC4gKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgICAgICAgICAgICAgICAgICAgICAgICAgIiwKIiAgICAgICAgICAgICAgICAgIC4gKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgICAgICAgICAgICAgICAgICAgIiwKIiAgICAgICAgICAgICAgLiArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICAgICAgICAgICAgICAgIiwKIiAgICAgICAgICAgICsgKyArICsgQCAjICQgJSAmICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiAqICogKiA9IC0gOyA+ICwgKyArICsgKyAgICAgICAgICAgIiwKIiAgICAgICAgJyArICsgKyApICEgfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IHsgXSArICsgKyAnICAgICAgICAgIiwKIiAgICAgICAgKyArICsgXiAvIH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiAoIF8gKyArICsgICAgICAgIiwKIiAgICAgICsgKyArIDogfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IDwgWyArICsgICAgICAgIiwKIiAgICArICsgKyB9IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfCAsICsgKyAgICAgIiwKIiAgICArICsgMSAyIH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiBeICsgKyAuICAgIiwKIiAgKyArICsgMyB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IDQgNSA2IDcgOCA5IDAgYSBiIGMgZCBlIGYgZyBoIGkgaiBrIGwgbSA0IG4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiBvIHAgKyArICAgIiwKIiAgKyArIHEgfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gciBzIHQgdSB2IHcgeCB5IHogQSBCIEMgRCBFIEYgRyBIIEkgSiBLIEwgTSBOIE8gUCByIH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IFEgKyArICAgIiwKIiAgKyArIFIgfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IG4gUyBUIFUgViBXIFggWSBaIGAgIC4uLisuQC4jLiQuJS4mLiouSCA9Li0uOy4+LiwuJy4pLiEufi57Ll0uciB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IF4uKyArIC4gIiwKIisgKyArIC8ufiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiA0ICguXy46LjwuWy59LnwuMS4yLjMuNC41LjYuNy44LjkuMC5hLmIuYy5kLmUuZi5nLmguaS5qLmsubC5tLm4uby5wLn4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IHEuci4rICsgIiwKIisgKyArIHMufiB+IH4gfiB0LnUudi52LnYudi52LnYudi52LnYudi52LnYudi52LnYudi53LnguMS4xLnkuei5BLkIuQy5ELnYudi52LnYudi52LnYudi52LnYudi52LnYuRS5GLkcuRy5ILkkuSi5LLkwudi52LnYudi52LnYudi52LnYudi52LnYudi52LnYudi5NLk4ufiB+IH4gfiB+IH4gfiB+IH4gTy4rICsgIiwKIisgKyBQLn4gfiB+IH4gfiBRLnYudi52LnYudi52LnYudi52LnYudi52LnYudi52LnYudi52LlIuUy5TLlQuQS5VLlYudi52LnYudi52LnYudi52LnYudi52LnYudi52LnYudi5XLlguWS5YLlouYC52LnYudi52LnYudi52LnYudi52LnYudi52LnYudi52LnYudi52LiArfiB+IH4gfiB+IH4gfiB+IH4gLisrICsgIiwKIisgKyArK34gfiB+IH4gfiB1LnYuQCsjKyMrIysjKyMrJCt2LnYuJCslKyYrKis9Ky0rOyt2LnYuPissKycrKSshK34reytdK14rXiteK14rLyt2LnYuKCtfK18rOis6KzwrWyt9K3wrfCt8KzErMiszKzQrNSs2K3Yudi43KyMrIysjKyMrIysjKyMrIysjKyMrOCt2LjkrfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiBhK3YuYit+IH4gfiB+IH4gYyt2LnYuZCtlK2YrZytoKycraSt2LnYuaitBLmsrIStsK20rbitvK3ArcStyK3MrdCt2LnYudSt2K3creCt5K3orQStCK0MrRCtFK0YrRytIK0krSitLK3Yudi5MK34gfiB+IH4gfiB+IH4gfiB+IH4gTSt2LjkrfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gTit2LnYuTyt+IH4gfiB+IH4gUCt2LnYuUStSK0EuUyspKykrVCt2LnYuVStrK2wrbStwK1YrVytXK3ErcitYK1krWit2LnYuYCtHLiBAIEAuQEErK0BAQCNAJEAlQCZAKkA9QC1AO0A+QHYudi4sQH4gfiB+IH4gfiB+IH4gfiB+IH4gTSt2LjkrfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gJ0B2LnYuKUB+IH4gfiB+IG4gIUB2LnYufkB7QGwrIStrKykrXUB2LnYuXkAvQG0rcCtwK1YrVysoQHMrcytzK19AOkB2LnYuYCs8QFtAfUB8QDFAMkAzQDRANUA2QDdAN0A2QDhAOUAwQHYudi5hQGJAfiB+IH4gfiB+IH4gfiB+IH4gTSt2LjkrfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gY0B2LnYuZEB+IH4gfiBlQGZAZ0B2LnYuaEBpQGwrbCshKyErakB2LnYua0BsQG4rbSttK21AbkBxK29AcEBwQHFAckB2LnYuYCsgQHNAdEB1QDJAdkB3QHhAeUB6QEFAQkBBQENAREBFQHYudi5GQEdASEB+IH4gSUBKQEtAfiB+IH4gTEB2Lk1AfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gTkB2LnYuT0B+IH4gfiBQQFFAUkB2LnYuU0BvK1RAbEBsQGwrVUB2LnYuVkBXQFRAWEBwK3ErbkBZQGguX0BaQGBAckB2LnYuYCsgQHNAICMuI3ZAd0ArI0AjIyMkIyUjJiMqIz0jLSM7I3Yudi4+IywjJyMpI34gISN2Lk0rSUB+IH4gfiN7I10jfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gXiN2LnYuLyN+IH4gNiAoI18jOiN2LnYuPCNyK1crbitsQCErWyN2LnYufSNXK1crV0B8I28rMSNZQFkrMiNxQDMjOkB2LnYuYCs0I3RAdUA1IzYjNyNAIyMjJCMmIzgjOSMwI2EjYiNjI3Yudi5kI2UjZiNnI2gjaSN2LnYuaiN+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gSUBMQHYuTi5+IGsjbCNtI24jbyN2LnYuU0BwKyhAcStwK2wrcCNMLnEjciNzI3QjdSN2I3cjeCN5I3ojbUBwQFpAOkB2LnYuQSNzQEIjQyN2QEQjRSMjIyUjRiNHI0gjSSNKI0sjTCNNI3Yudi5OI08jUCNQI1EjUiN2LnYuaiN+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiAyIFMjfiB+IFQjVSNWI1cjWCN2LnYuPCNyK3IrcitxK20rbEBZI1ojYCMgJC4kKyRAJCMkJCQlJCYkKiQ9JGkuckB2LnYuLSRzQDskPiR2QCwkQCMnJCkkOCMhJH4keyRdJF4kLyQoJHYudi52LnYudi52LnYudi52LnYuaiN+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IH4gfiBfJDokPCRbJH0kfCR2LnYuMSRzK3IrcitxK1YrVEAyJDMkNCQ1JDYkNyQ4JDkkMCRhJGIkYy5jJGQkZSR2LnYuZiRzQGckPiRoJDcjaSRqJEYjayRsJG0kbiRvJHAkcSRyJHYudi5zJHQkdSR2JHckeCR2LnYuaiN+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IH4gbiB5JHokQSRCJEMkRCR2LnYuMSRzK3IrcitxK1YrRSRGJEckSCRJJEokSyRMJE0kTiRPJFAkUSRgIFIkUyR2LnYuVCRVJGckPiRoJFYkVyRYJFkkMCNaJGAkICUuJSslQCUjJXYudi4kJSUlJiUqJT0lLSV2LnYuaiN+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHIgOyU+JSwlJyUpJSElfiV2LnYuMSQyI3MrWCtyK3wjeyVdJV4lLyUoJV8lOiU8JVslfSV8JTAkLyUxJTIlMyV2LnYuZiRVJDQlPiRoJFYkVyQlIzUlSCM2JTclOCU5JTAlYSViJXYudi5jJWQlZSVmJU0kZyV2Lk0uaCV+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IGklaiVrJWwlbSVuJUkgbyV2LnYuMSQyI1krcytyK3AlZS5xJT0uciVzJXQlcyVzJXUlLCMsI3YlWyV3JXgleSV2LnYueiVVJDQlPiRBJUIlVyQlIzUlSCNDJUQlOCVFJUYlRyVIJXYudi5JJUolSyVMJU4kTSVOJU8lfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IFAlUSVSJVMlVCVVJVYlVyV2LnYudStfQDIjWSsoQFglWSVaJWAlICYuJi8lcyV9JSwjKyYrJkAmfSUjJiQmJSZ2LnYuYCtzQCYmKiZBJUIlPSYlIzUlISRDJUQlLSY7Jj4mLCYnJnYudi4pJiEmfiZ7Jl0mTCReJi8mKCZ+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiBuIF8mOiY8JlsmfSZ8JjEmMiZ2LnYudStxQHFAWStvKzMmNCY1JjYmNyY4JjkmdSV1JTAmYSZiJmMmLCNkJkIkZSZ2LnYuLSRzQEIjKiZBJWYmZyZYJFkkMCNoJmkmOCU7Jj4mLCZqJnYudi5rJmwmbSZuJm8mcCYwJD0lcSZ+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiByJnMmdCZ1JnYmdyZ4JjsueSZ2LnYudStxQHFAeiZBJkImQyZgJUQmRSZGJkcmSCZJJkomSyZMJk0mTiZPJlAmUSZ2LnYuZiRSJkIjUyZUJlUmViZqJCojVyZ+JFgmWSY5JUYlWiZqJnYudi5gJiAqLiorKkAqIyokKl4mIyplQH4gfiB+IH4gfiB+IH4gfiB+IG4gJSp+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gciAmKioqPSotKjsqPiosKicqKSp2LnYuYCtgQHFAai4hKm4jfio4JHwlYCV7Kl0qXiovKigqTyRfKjoqPCpPJlsqZSZ2LnYuZiRSJkIjNCVUJn0qfCoxKjIqMyo0KjUqNio3KjgqOSonJnYudi4wKmEqYipjKmQqXSZlKl4mLyUlKn4gfiB+IH4gfiB+IH4gfiBmKmcqaCppKn4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gaiprKmwqbSpuKm8qcCpxKmQkcip2LnYuYCt3K3FAcUBzKnQqRSYsIywjdSplKnYqdyp4KkskeSp6KkEqfSU9LkIqQyp2LnYuYCs0I3NAJiY+JGgkRCpFKkYqNSUhJGgmRypIKislSSpKKnYudi5LKkwqTSpOKk8qUCpOJC8lMCZRKn4gfiB+IH4gfiB+IH4gUiowJnAmUypUKn4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gNiBVKlYqVypYKlkqWipgKiA9Lj12LnYuKz1APUA9QD0jPSQ9JT1zJSY9Kj09PSY9dSp7Ki09Oz0+PSw9Jz0pPSE9fj12LnYuez1dPV09Xj0vPSg9Xz06PTw9Wz1rJH09fD0xPTI9Mz00PXYudi45KzU9Nj03PTg9OT0vJjAkMCYwPX4gfiB+IH4gfiBlQGE9JCowJj0lcCZmJX4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gYj1jPWQ9ZT1mPXYudi52LnYudi52LnYudi52LnYudi52Lmc9aD1pPWo9az1bJTAmLCNPJmw9di52LnYudi52LnYudi52LnYudi52LnYudi52LnYudi5tPW49bz04I0gjcD12LnYudi52LnYudi52LnYudi52LnYudi5xPXI9XiZmJWVAfiB+IHM9UypwJjAmMCQwJF4mMCR0PX4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gdT12PXc9eD15PXo9di52LnYudi52LnYudi52LnYudi5BPUI9Qz1EPTAmRT1JJiwjLCNGPUc9SD1MLnYudi52LnYudi52LnYudi52LnYudi52Lkk9Sj1LPUw9TT1OPTMqTz1QPUwudi52LnYudi52LnYudi52LkwuUT1SPTwlXiZTPSgmVD1SKjA9PSVeJlAqTipOKmE9TiolKn4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gVT1WPVc9WD1ZPVk9Wj1gPVkuIC1YLi4tKy08QEcuditxQEAtRSQjLWAgJC0lLXwlMCYmLT0lXiYqLT0tLS07LXwjKEByK1crPi1fQCwtJy0pLSEtfi17LV0tXi0vLSgtXy06LTwtWy19LXwtMS1jKjEtMi0zLTQtUCo1LTwlXiYvJUAqUCpOJEwkTCU2LWVAfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gNy04LTktMC1hLWItYy1kLWQtZS0gLSstZi1nLWgtaS1pLWBAcEBqLWstbC1tLS0ubi1vLXAtcS1yLXMtdC0vQGlAbCt1LVYrVitXK3Ytdi13LXgteS16LUEtQi1DLUQtRS1GLUctSC1JLUotdD1LLUstTC00LVQqTS1TPTwlXiZ1JSMqIypoKk4qbiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gTi1PLVAtUS1SLVMtVC1kLWQtZS1VLVYtZi1nLVctMyNgQHcrQC1YLVktWi1gLSA7LjsuOys7Zi5AOyM7ZytnKyQ7JTsmOycrKjspKz07LTs7Oz47LDsnOyk7ITt+O3s7XTteOy87KDtfOzo7Zyo8Ozw7ZypvJkwlIypOJDwlXiZ1JVs7fTtlQH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfDtPLTE7MjtXPVMtMztkLTQ7WS4uLSBAeCtXLXcrLC01O2guPi0+LShAbyt5IzY7Nzs4Ozk7MDthO2I7YztkO2U7ZTtlO2Y7ZztoO2k7eCNqOzstWi1rO2w7bTtuO287cDtxO3I7czt0O3U7djt3OzA9JyMwPXg7LyZbO3I9XiYwJkwtbiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4geTt6O1YtPEBpLWgtZy1oLTIjWStZK3IrcStwK3ArbStsKyErIStrKykrKjsqOycrJysmOyY7QTtCO0M7RDtFO0Y7RztGO0g7RTtFO0U7STtKO0s7TDtNO047TztQO1E7UjtTO1Q7VTtWO1c7WDtZO1M9WjsvJlM9cCZMJC8lMCYwJlIqbiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gYDsgPi4+Lj4rPkA+Iz4kPiU+Jj4qPj0+LT47PmcuPj50Iyw+LD4nPic+KT4pPiM7IzshPn4+ez5oO10+Xj4vPig+Xz4vPjo+PD5bPn0+fD5KO0w7MT4yPng9Mz40PjMkUDtRO18jNT42Pjc+Xyo4Pls7OT5wJls7TSQ8JT0lMCZ1JVMqbiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gMD5hPmI+Yz5QLWQ+ZT5mPmc+MSt5K2g+aT5SJiBAaj5rPiwtQC1oLj4tdi12LWw+bT5tPm4+LTtnKzEubz5MO3A+cT5KO0w7SztyPnM+cz50PnU+dj52I2Y7dz54PkA7eT56PkE+Qj5DPkMmRD5FPk0kTSRNJEwkPCUwJF4mMCYwJkY+fiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gTi1HPkg+ST5KPko+US0zOzktSz5lLWUtIC1MPkw+PEBHLkcudiszI1pAX0BwQG9Ab0AoQHArbCtrK00+Uy5OPkM7QztOPmU7ZDtCO08+Tz58LlA+fC5RPlI+Uz4jO1Q+VT5WPlc+WD5ZPlo+YD4gLCAsLiwkKjwlcj0vJV4mMCZ1JVIqfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gKyxALCMsST5JPiQsMC0lLGMtYD1gPSYsIC1MPistPEBHLmgtditgQDIjWStzK3MrcityK3ErbSshK2grTT56LiU7KiwlOz0sLSw7LCY7JjsqOz4sdSMsLCcsKSwhLGcufix7LHo7XSxeLC8sKCxyJXIlXyw8JXI9LyU9JTAmdSUwJk8qaCN+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gOiw8LFssfSx8LDEsMixnPlQtYD1ZPSAtIC1MPkw+Zy1nLWgtaS1xQDIjWStzK3IrcityK3IrVEBsQC9AISszLDQsPiwpK2srPTs1LCc+Niw3LHtAbj5zI3ArKEA4LDksMCx4LSktYSxiLDQmcj1jJmMmcj0wJC8lPSVeJjAmdSVeJl0mMS1jLCkjfiB+IH4gSEBTKmQsZSx+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gZixnLGgsaSxqLGssWCBsLEIjbSxlLVkubixYListZi1nLWgtaS1gQHFAWStZK3MrcityK3IrVEBvLGlAbCtWK2xAaUBwLHEscixzLHQsdSx2LHMsdyx4LD4tWCt5LHosQSxCLEMsRCxFLEYsMCQwJEcsLyUvJT0lXiYwJnUlMCY9JVM9NS0wPTA9byZRKkwtWztwJjQtMy1lQH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gSCxJLEosSyxMLE0sTixPLFAsUSxtLGUtVS1ZListZi1nLWgtaS1gQHFAMiNZK3MrcytyK3ArUixvLG0rcCtwK28rMDtTLFQsVSxWLGAgYCBXLFgsWSxaLGAsISogJy4nLC0rJ0AnIyckJyUnJicqJz0lPSVeJl4mMCZzJXUlfSVwJigmfiB+IGkqTC1dJmUqPSVyPWcqeDs9J34gMCsrICsgIiwKIisgKyArK34gfiB+IH4gLSc7Jz4nLCcnJyknISd+J3snXSdeJ2UtJiwgLUw+Zi1nLWgtaS1gQHFAMiNZK1krcytyK1lAbj5sQHArcStwLC8nKCdfJzonPCdbJ2k9fSdbJ3wnMScyJzMnNCc1J2guLidALXcrNic3JzgnOScwJ2Endi52LmInYyd9JXUlfSV3O34gfiB+IH4gfiBkJ0wtLyV1JV4mUz1zPX4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gZSdmJ2cnaCdpJ2onaydsJ20nbidvJ3AnZS1VLVguKy0rLWgtaC1gQHFAcUBZK1krWStZK29AcCtwK3ArVitxJ3Incyd0J3Undid3J3QldCV4J3kneidBJ0InQydEJ20+Pi1YK2ouaC5FJ0YnRydIJ0kndi52LnYuSid1JXUlfSVkLH4gfiB+IH4gfiB+IH4gdD1NJHAmTiplQH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gbiBLJ0wnTSdOJ08nUCdRJ1InUydUJ1UnMismLEw+TD5mLWctaC1pLWBAcUAyI1krcytzK1krcCtzI20rVidXJ1gnWSdaJ2AnICkuKSspQCkjKSQpJSkmKSopPSktKTUsKEA7KXMrWC0+KSwpRydqPScpKSkhKXYufil1JXUlcj1UPX4gfiB+IH4gfiB+IH4gZUAgKigmfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB7KV0pXikvKSgpXyk6KTwpWyl9KXwpMSkmLHkrTD5mLWctaS1pLWBAcUAyI1krcytyKyhAcCttK2wrMDsyKTMpNCk1KTYpNyk4KTkpMClhKWIpYylkKWUpZilgIGcpVytZQHMrVitoKSwpJj1qPSY9fSVpKXYufil1JXUlQCpuIH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IGopaylsKW0pbilvKXApcSlyKXMpdClZLlguTD5mLWctaS12K2BAcUAyI1krcysoQFcrVitzI3tAdSlXLHYpdyl4KXkpeilBKUIpQylEKUUpRilHKUgpSSlEPUopWEBsK3ArbEBLKTEldSUmPXUlfSVMKXYufil1JS8lMS1+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gTSl2LnYuTilPKVApUSlSKVMpVClVKVYpVylYKVkpWilmLWctaS12K2BAcUBgKSAhLiErIUAhIyEkISUhJiEqIT0hLSE7IT4hLCEnISkhISF+IXshXSFeIS8hKCFfITohaEA8IVshfSF8ITEldSUmPXUlfSVpKXYufil1JTUtMSE3K3Yudi52LnYuMiF+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gMyF2LnYudi56PXYudi52LnYuNCE1IXYudi52LnYuNiE3IWctaC1pLWBAOCE5IXYudi52LnYudi52LnYuOyswIU0lYSFiIWMhZCFlIU0lZiFnIXYudi5oIWkhdi52LnYudi52LmohayFsIW0hdSUmPXUlfSVMKXYufikwJlMqbiFiK3Yudi52LmErbyF+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiBqI3Ahdi5xIXIhcyF0IXYudi52LnUhdiF3IXYudi54IWctaC1pLWBAeSF2LnohQSFCIUMhRCFFIUYhdi5HIUghSSFKIWMhYyFjIUshYSd2LkwhTSFOIU8hUCFRIVIhdi52LlMhVCFVIW0hdSUmPXUldSVpKXYuViF4O2VAVyFYIXYuIytZIVohfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi5gISB+Ln4rfkB+di4jfiR+JX4mfip+di49fmctaC1pLWBAcUAtfjt+WStyK3ErVitWKz5+LH52Lid+KX4hfn5+e34mJV1+di5AK15+L34ofl9+TiFKKzp+Vyl2Ljx+W35kLm0hdSUmPXUldSVpKXYufX58fktATS52LjF+Mn5+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi4zfjR+NX42fjd+di44fjl+MH5hfmJ+di5UJGctaC1pLWBAcUBxQDIjWStvQChAKEB1LVdAY352LmR+ZX5mfmd+RSlofml+di44K2p+a35sfm1+bn5vfiM7cH5xfnJ+c350fm0hdSV1JXUldSVpKXYudX52fnd+di54fn4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi55fnp+QX5CfkN+di5EfkV+Rn5Hfkh+di5JfmctaC1pLWBAcUBKfkt+TH5NfkE9Tn5PflB+UX52LlJ+U35UflV+Vn5Xflh+WX52Llp+YH4gey57K3tAeyN7JHs7LCV7dyMyJW0hdSV1JXUldSVpKXYuJnt2LnYuKnt+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi49e34gLXs7ez57di4seyd7KXshe357di5JfmctaC1pLWBAe3tAIXYudi52LkE9XXssfnYudi52Ll57L3soe197Ons8e2MhW3t9e3Yudi52LnYudi52LnYufHsxezJ7M3tsLX0ldSV1JXUldSU0e3Yudi52LnYuJCs1e34gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi49e34gNns3ezh7di45ezB7KS1wJ357di5JfmctaC1pLWF7di52LmJ7Y3tke3ArbkBle2Z7Z3t2Lmh7aXtqe2t7bHtte257b3twe3F7cntzezsrdi52LnYudi52LnR7dXt2e30ldSV1JXUld3t4e3YueXt6e0F7di5Ce0N7fiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi49e34gfiBEe0V7di5Ge0d7MStlLUh7di5Je3graC12K0p7di5Le0x7cytZQFlAVytXQG8sTXt2Lk57dSNmK097Nn5Qe1F7UntTe1R7dyNVe2c7Tz5We1d7WHt2LnYuWXtae3wldyV8JXd7YHsgXXYuTi5+IFMjLl12Lm8hMn5+IH4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi49e34gfiB+ICtddi5AXXkrI10mLH57di5Je0cuaS1oLU5+di4kXXBAcytyK3ErcitxKyVdJl12LlMhPixBLmYreyU0PipdPV0tXTtdQjtCO0I7ZDtkOz5dLF12LnYuJ11EPTAmfSV8JSldZCcgXXYuIV1+IH4gfl17XXYuXV1oJX4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiB+IHAhdi49e34gfiB+IE0pdi5eXS9dWi5aLihddi5Je2gtaS1oLS49di5fXXBAWSsoQFcrcis6XTxddi52LltdPiwpKycrJjsmO31ddi53LnxdQjtPPmQ7Pl1lO0M7MV12LnYuMl0xJSY9XiYpXX4gfiAgXXYuIV1+IH4gfiAzXXd+di40XX4gfiB+IH4gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gfiAyfnAhdi41XUlAfiB+IE0pdi42XTddOF05XShddi4wXWFdaS0zI2Jddi52LmNdZF1lXWZdZ11oXXYuUi52LmhAaV0pKyo7KjsnK2pddi52LmtdbF1tXU8+dT5uXW9dcF12LnFdcl11JUcnbyZkJ34gc10uXXYuIV1+IH4gfiB+IHRddi52LnVddl1OK34gfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gd11hK3Yudi52LnhdbiF+IHlddi52LnpdQV1CXUNddi52LkRdRV1aQEZdR112LnYudi52LnYudi53LkhdSV12LnYuTC5KXSY7JDssK0tddi52LnYudi52LkxdTV1JJ3Yudi5OXU9dUF1yJVFdfiAzXU0udi52LnYuUl1+IH4gfiBJQFNddi52LnYudi54XXZdfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyArK34gfiB+IH4gVF12LnYudi52LjcrVV1+IFZdTC52Li5dV11YXVldWl12LmBdIF4zIzIjLl5LfiteQF5JPSNeJF4lXm0rJl4mXXYuTC4qXiY7eS5BOz1eLV47Xj5eLF4nXilePV0hXn5ee15dXl5eL14oXmgjfiBfXjYrdi52Lk0rNXt+IH4gfiA6Xjkrdi52LnYudi5MQGojfiB+IH4gfiB+IH4gMCsrICsgIiwKIisgKyA8Xn4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gW159XnxeMV4jO1t+W34yXjNeNF41Xm4+VitwK2wraytTKz4sKSspKycreS55LnkuQTsxLkI7Tj50PnI+Nl5LO0Q7N144XjleMF5+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gYV4rICsgIiwKIisgKyArIGJefiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiBjXmReZV5kLmZeOy5nXmheO0ArO2leal5rXlMrUytoK2grZysnKyY7JjtBO0E7MS5PPk4+dT51PnQ+SztsXm1ebl5vXjZ7fiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gcF4rICsgIiwKIisgKyArIHFefiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gcl5zXnRedV52XndeeF55XnpeQV5CXkNeRF5FXnouei4sK3ouJTtQPkI7Tz5OPnQ+Nl4xPkZeR15IXkleSl5+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IEteTF4rICsgIiwKIiAgKyArIE1efiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+ID0nTl5PXlBeUV5SXlNeVF5VXlZeV14jLXcjez5BO3kuQTtCO0I7Tj50PmAtWF5ZXlpeYF4gL3IgfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IC4vKyArICsgIiwKIiAgKyArICsvaCV+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiBuIEAvIy8kLyUvJi8qLz0vLS87Ly0tUiRXJ2YuPi8sLycvKS8hL34vey9dL3IgbiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IF4vKyArICAgIiwKIiAgKyArICsgLy9+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gKC9fLzovPC9bL30vfC8xLzIvMy80LzUvSl5+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiA2LzcvKyArICAgIiwKIiAgICArICsgOC85L34gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gNCA0IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiAwKysgKyAuICAgIiwKIiAgICAnICsgKyAwL3EufiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gYS8rICsgKyAgICAgIiwKIiAgICAgICsgKyArIGIvMiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IGMvZC8rICsgICAgICAgIiwKIiAgICAgICAgKyArICsgZS9mL34gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gZy9RICsgKyArICsgICAgICAgIiwKIiAgICAgICAgICArICsgKyByLlIgaC9+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiB+IH4gfiAyIC8vOC8rICsgKyArICAgICAgICAgIiwKIiAgICAgICAgICAgICsgKyArICsgWyBpL2ovay9sL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9tL20vbS9uL28vcC9xLysgKyArICsgICAgICAgICAgICAgIiwKIiAgICAgICAgICAgICAgLiArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICAgICAgICAgICAgICAgIiwKIiAgICAgICAgICAgICAgICAgIC4gKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgICAgICAgICAgICAgICAgICAgIiwKIiAgICAgICAgICAgICAgICAgICAgICAgICAgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICsgKyArICAgICAgICAgICAgICAgICAgICAgICAgICAgIn07Cg=="
+"""
+Least recently used cache, bounded by the memory used by its values
+Safe to use from several threads. If two threads ask for the same missing
+key, the value is computed once and the second thread waits for it.
 
+Parameters:
+- maxbytes: memory allowed for all values, in bytes
+- sizeof: function returning the memory used by a value, in bytes
+"""
+class memoryCache:
+	def __init__(self, maxbytes, sizeof):
+		self.maxbytes = maxbytes
+		self.sizeof = sizeof
+		self.entries = collections.OrderedDict()	# key -> (value, nbytes), most recently used last
+		self.pending = {}	# keys being computed -> threading.Event
+		self.lock = threading.Lock()
+		self.nbytes = 0
+		self.hits = 0
+		self.misses = 0
+	
+	"""
+	Returns the value for key, calling function(*args) to compute it if it is not in the cache
+	"""
+	def fetch(self, key, function, *args):
+		while True:
+			with self.lock:
+				if (key in self.entries):
+					self.hits += 1
+					self.entries.move_to_end(key)
+					return self.entries[key][0]
+				event = self.pending.get(key)
+				if (event is None):
+					event = threading.Event()
+					self.pending[key] = event
+					self.misses += 1
+					break
+			# Computed in another thread, in the cache once it is done (unless it failed)
+			event.wait()
+		try:
+			value = function(*args)
+			self.put(key, value)
+		finally:
+			with self.lock:
+				del self.pending[key]
+			event.set()
+		return value
+	
+	"""
+	Adds a value to the cache, and removes the least recently used ones if needed
+	Values larger than the cache are not kept
+	"""
+	def put(self, key, value):
+		nbytes = self.sizeof(value)
+		with self.lock:
+			if (key in self.entries):
+				self.nbytes -= self.entries.pop(key)[1]
+			if (nbytes > self.maxbytes):
+				return
+			self.entries[key] = (value, nbytes)
+			self.nbytes += nbytes
+			while (self.nbytes > self.maxbytes):
+				self.nbytes -= self.entries.popitem(last=False)[1][1]
+	
+	def __contains__(self, key):
+		with self.lock:
+			return (key in self.entries)
+	
+	def __len__(self):
+		return len(self.entries)
+	
+	"""
+	Fraction of requests found in the cache
+	"""
+	def hitRate(self):
+		total = self.hits + self.misses
+		return 1.*self.hits/total if (total > 0) else 0.
+	
+	def clear(self):
+		with self.lock:
+			self.entries.clear()
+			self.nbytes = 0
 
 #################################################################
 #
-# Main subroutines
+# Timing and memory of processing stages
 #
 #################################################################
 
-# Prepare to plot...
-app = PyQt5.QtWidgets.QApplication(sys.argv)	
-form = clearMaskGui()
-app.exec_()
+# Fields of a profile record, in the order of CSV columns
+profileFields = ["file", "stage", "start", "duration", "bytes", "peakmemory", "process", "thread"]
+
+# Formats of profile files, see stageProfiler.export
+profileFormats = ["json", "csv", "trace"]
+
+"""
+Stage used when the profiler is off: does nothing
+"""
+class _noStage:
+	nbytes = 0
+	
+	def __enter__(self):
+		return self
+	
+	def __exit__(self, exctype, value, traceback):
+		return False
+
+_nullStage = _noStage()
+
+"""
+One stage being measured, see stageProfiler.stage
+nbytes can be set inside the with block, once the size of the data is known
+"""
+class _profiledStage:
+	def __init__(self, profiler, name, filename, nbytes):
+		self.profiler = profiler
+		self.name = name
+		self.filename = filename
+		self.nbytes = nbytes
+		self.memory = 0		# memory allocated when the stage started
+		self.peak = 0		# highest memory allocated during the stage
+	
+	def __enter__(self):
+		self.measured = self.profiler.memory
+		if (self.measured):
+			self.profiler._openStage(self)
+		self.start = time.time()
+		self.clock = time.perf_counter()
+		return self
+	
+	def __exit__(self, exctype, value, traceback):
+		duration = time.perf_counter() - self.clock
+		peakmemory = 0
+		if (self.measured):
+			self.profiler._closeStage(self)
+			peakmemory = max(0, self.peak - self.memory)
+		self.profiler.add({"file": self.filename, "stage": self.name, "start": self.start, "duration": duration, "bytes": int(self.nbytes), "peakmemory": peakmemory, "process": os.getpid(), "thread": threading.get_ident()})
+		return False
+
+"""
+Records wall time, bytes processed and peak memory of each stage of each file
+
+Stages are measured with
+	with profiler.stage("load", filename) as stage:
+		data = ...
+		stage.nbytes = data.nbytes
+When the profiler is off, stage returns an object that does nothing, so that
+measured code is not slowed down.
+
+Peak memory is the highest memory allocated by python and numpy during the
+stage, above what was allocated when it started, measured with tracemalloc.
+Stages running at the same time in different threads share their peaks.
+
+Worker processes have their own profiler, their records are sent back to
+the main process with their results (see _batchWorker).
+"""
+class stageProfiler:
+	def __init__(self):
+		self.enabled = False
+		self.memory = False
+		self.records = []
+		self.lock = threading.Lock()
+		self.running = []		# stages measuring memory
+		self.tracing = False		# True if tracemalloc was started here
+	
+	"""
+	Starts recording. Measuring memory slows down python code, not numpy
+	"""
+	def enable(self, memory=True):
+		if (memory and (not tracemalloc.is_tracing())):
+			tracemalloc.start()
+			self.tracing = True
+		self.memory = memory and tracemalloc.is_tracing()
+		self.enabled = True
+	
+	"""
+	Stops recording, records are kept
+	"""
+	def disable(self):
+		self.enabled = False
+		self.memory = False
+		if (self.tracing):
+			tracemalloc.stop()
+			self.tracing = False
+	
+	"""
+	Context manager measuring one stage, see the class description
+	"""
+	def stage(self, name, filename=None, nbytes=0):
+		if (not self.enabled):
+			return _nullStage
+		return _profiledStage(self, name, filename, nbytes)
+	
+	"""
+	Peak memory since the last call is given to all running stages
+	"""
+	def _updatePeaks(self):
+		current, peak = tracemalloc.get_traced_memory()
+		for stage in self.running:
+			stage.peak = max(stage.peak, peak)
+		tracemalloc.reset_peak()
+		return current
+	
+	def _openStage(self, stage):
+		with self.lock:
+			stage.memory = self._updatePeaks()
+			stage.peak = stage.memory
+			self.running.append(stage)
+	
+	def _closeStage(self, stage):
+		with self.lock:
+			if (tracemalloc.is_tracing()):
+				self._updatePeaks()
+			self.running.remove(stage)
+	
+	def add(self, record):
+		with self.lock:
+			self.records.append(record)
+	
+	def extend(self, records):
+		with self.lock:
+			self.records.extend(records)
+	
+	"""
+	Returns the records and removes them from the profiler
+	"""
+	def take(self):
+		with self.lock:
+			records = self.records
+			self.records = []
+		return records
+	
+	def clear(self):
+		self.take()
+	
+	"""
+	Totals for each stage, slowest stages first
+	Returns a list of dictionnaries with the stage, number of records, total and
+	maximum duration (in s), bytes processed, and the highest peak memory (in bytes)
+	"""
+	def summary(self):
+		stages = collections.OrderedDict()
+		with self.lock:
+			records = list(self.records)
+		for record in records:
+			total = stages.setdefault(record["stage"], {"stage": record["stage"], "count": 0, "duration": 0., "maxduration": 0., "bytes": 0, "peakmemory": 0})
+			total["count"] += 1
+			total["duration"] += record["duration"]
+			total["maxduration"] = max(total["maxduration"], record["duration"])
+			total["bytes"] += record["bytes"]
+			total["peakmemory"] = max(total["peakmemory"], record["peakmemory"])
+		return sorted(stages.values(), key=lambda total: -total["duration"])
+	
+	"""
+	Prints the totals for each stage, see summary
+	"""
+	def printSummary(self, file=sys.stdout):
+		for total in self.summary():
+			rate = total["bytes"]/total["duration"]/1.e6 if (total["duration"] > 0) else 0.
+			print("%-10s %6d x %10.1f ms (max %8.1f ms) %10.1f MB (%8.1f MB/s)  peak memory %8.1f MB" % (total["stage"], total["count"], total["duration"]*1000., total["maxduration"]*1000., total["bytes"]/1.e6, rate, total["peakmemory"]/1.e6), file=file)
+	
+	"""
+	Saves the records in filename
+	
+	Formats, one of profileFormats (default: from the file name):
+	- json: list of records (*.json)
+	- csv: one line per record, columns in profileFields (*.csv)
+	- trace: Chrome trace, for chrome://tracing or https://ui.perfetto.dev (*.trace or *.trace.json)
+	"""
+	def export(self, filename, format=None):
+		if (format is None):
+			name = filename.lower()
+			if (name.endswith(".csv")):
+				format = "csv"
+			elif (name.endswith(".trace") or name.endswith(".trace.json")):
+				format = "trace"
+			else:
+				format = "json"
+		if (format not in profileFormats):
+			raise ValueError("Unknown profile format %s, should be one of %s" % (format, ", ".join(profileFormats)))
+		with self.lock:
+			records = sorted(self.records, key=lambda record: record["start"])
+		if (format == "csv"):
+			with open(filename, "w", newline="") as f:
+				writer = csv.DictWriter(f, fieldnames=profileFields)
+				writer.writeheader()
+				writer.writerows(records)
+			return
+		if (format == "trace"):
+			origin = records[0]["start"] if (len(records) > 0) else 0.
+			events = []
+			for record in records:
+				events.append({"name": record["stage"], "cat": "maskTiff4Maud", "ph": "X", "ts": (record["start"]-origin)*1.e6, "dur": record["duration"]*1.e6, "pid": record["process"], "tid": record["thread"], "args": {"file": record["file"], "bytes": record["bytes"], "peakmemory": record["peakmemory"]}})
+			records = {"traceEvents": events, "displayTimeUnit": "ms"}
+		with open(filename, "w") as f:
+			json.dump(records, f, indent=1)
+
+# Profiler of this process, off unless enabled
+profiler = stageProfiler()
+
+#################################################################
+#
+# Files with several frames (multi-page tiff, EDF, HDF5...)
+#
+#################################################################
+
+"""
+Iterates over the frames of an image file, reading one frame at a time
+The file is opened once, the number of frames comes with each frame
+Yields (frame index, number of frames, data)
+"""
+def iterFrames(filename, start=0, stop=None):
+	with profiler.stage("load", filename) as stage:
+		image = fabio.open(filename)
+		stage.nbytes = image.data.nbytes if (image.data is not None) else 0
+	try:
+		nframes = max(1, image.nframes)
+		if ((stop is None) or (stop > nframes)):
+			stop = nframes
+		for index in range(start, stop):
+			if (index == 0):
+				data = image.data
+			else:
+				with profiler.stage("load", filename) as stage:
+					data = image.getframe(index).data
+					stage.nbytes = data.nbytes
+			yield index, nframes, data
+	finally:
+		image.close()
+
+"""
+Name of the output file for one frame of a file with several frames
+"""
+def frameOutputName(outfile, index):
+	root, ext = os.path.splitext(outfile)
+	return "%s-%04d%s" % (root, index, ext)
+
+"""
+Writes frames one after the other in a multi-page tiff file
+The file is written under a temporary name and renamed when closed, see writeTiff
+"""
+class stackWriter:
+	def __init__(self, filename):
+		self.filename = filename
+		path, name = os.path.split(filename)
+		self.tmpname = os.path.join(path, ".%s.%d.part" % (name, os.getpid()))
+		# TiffIO appends frames to files opened in rb+ mode
+		open(self.tmpname, "wb").close()
+		self.fd = open(self.tmpname, "rb+")
+		self.tiff = fabio.TiffIO.TiffIO(self.fd)
+		self.nframes = 0
+	
+	def write(self, data):
+		self.tiff.writeImage(data)
+		self.nframes += 1
+	
+	def close(self):
+		self.fd.close()
+		os.replace(self.tmpname, self.filename)
+	
+	"""
+	Closes and removes the temporary file, nothing is written
+	"""
+	def abort(self):
+		self.fd.close()
+		if (os.path.exists(self.tmpname)):
+			os.remove(self.tmpname)
+	
+	def __enter__(self):
+		return self
+	
+	def __exit__(self, exctype, value, traceback):
+		if (exctype is None):
+			self.close()
+		else:
+			self.abort()
+
+"""
+Merges validation results of several frames into results for the whole file
+"""
+def mergeValidation(results):
+	merged = dict(results[0])
+	minima = [r["minimum"] for r in results if r["minimum"] is not None]
+	maxima = [r["maximum"] for r in results if r["maximum"] is not None]
+	merged["minimum"] = min(minima) if (len(minima) > 0) else None
+	merged["maximum"] = max(maxima) if (len(maxima) > 0) else None
+	merged["recommendedshift"] = max([r["recommendedshift"] for r in results])
+	for field in ("nnegative", "nsaturated", "nnan"):
+		merged[field] = sum([r[field] for r in results])
+	merged["nframes"] = len(results)
+	return merged
+
+# Output for files with several frames: one file per frame, or a multi-page tiff
+stackModes = ["split", "multi"]
+
+"""
+Masks all frames of a file, one frame at a time
+
+Only one frame of data and one output frame are in memory at any time.
+Files with a single frame are saved in outfile, whatever the mode.
+
+Parameters:
+- infile: input file
+- outfile: output file, see frameOutputName for the names of frames in split mode
+- omask: orientedMask or maskComposition
+- intensityshift, outputtype: see applyMask
+- saturation: see validateData
+- mode: one of stackModes
+- validateonly: if True, nothing is written
+- tilebytes: if set, images larger than this (in bytes) are masked by blocks of
+  this size when they can be read that way, see maskByBlocks
+
+Returns the validation results of the whole file, see mergeValidation
+"""
+def maskFrames(infile, outfile, omask, intensityshift=0., outputtype="auto", saturation=None, mode="split", validateonly=False, tilebytes=None):
+	if (mode not in stackModes):
+		raise ValueError("Unknown mode %s, should be one of %s" % (mode, ", ".join(stackModes)))
+	if ((tilebytes is not None) and (os.path.getsize(infile) > tilebytes) and readableByBlocks(infile)):
+		return maskByBlocks(infile, outfile, omask, intensityshift, outputtype, saturation, validateonly, tilebytes)
+	writer = None
+	results = []
+	out = None
+	try:
+		for index, nframes, data in iterFrames(infile):
+			if ((index == 0) and (not validateonly) and (nframes > 1) and (mode == "multi")):
+				writer = stackWriter(outfile)
+			with profiler.stage("orient", infile):
+				framemask = omask.forFrame(data)
+			with profiler.stage("validate", infile, data.nbytes):
+				results.append(validateData(data, framemask, intensityshift, saturation))
+			if (validateonly):
+				continue
+			with profiler.stage("mask", infile, data.nbytes):
+				# The data type can change from frame to frame if intensities do not fit in int32
+				dtype = outputDtype(data.dtype, intensityshift, outputtype, data, framemask)
+				if ((out is None) or (out.shape != data.shape) or (out.dtype != dtype)):
+					out = numpy.empty(data.shape, dtype)
+				applyMask(data, framemask, intensityshift, out=out)
+			with profiler.stage("write", infile, out.nbytes):
+				if (writer is not None):
+					writer.write(out)
+				elif (nframes > 1):
+					writeTiff(out, frameOutputName(outfile, index))
+				else:
+					writeTiff(out, outfile)
+	except:
+		if (writer is not None):
+			writer.abort()
+		raise
+	if (writer is not None):
+		writer.close()
+	return mergeValidation(results)
+
+#################################################################
+#
+# Images larger than memory, masked by blocks of rows
+#
+#################################################################
+
+# TIFF tags used to read and write images by blocks
+_tiffTags = {"width": 256, "length": 257, "bits": 258, "compression": 259, "photometric": 262, "stripoffsets": 273, "samples": 277, "rowsperstrip": 278, "stripbytecounts": 279, "planar": 284, "tilewidth": 322, "tilelength": 323, "tileoffsets": 324, "tilebytecounts": 325, "sampleformat": 339}
+
+# TIFF value types: type -> struct format, for the integer types used by these tags
+_tiffTypes = {1: "B", 3: "H", 4: "I", 16: "Q"}
+
+# numpy kind for the TIFF SampleFormat tag
+_tiffSampleFormats = {1: "u", 2: "i", 3: "f"}
+
+# Default memory for one block of data in tiled mode, in bytes
+defaultTileBytes = 256*2**20
+
+"""
+Reads rows of an uncompressed single-frame TIFF file (classic or BigTIFF,
+strips or tiles), without reading the rest of the image
+
+Raises ValueError if the file can not be read this way (other format,
+compression, several samples per pixel or several frames)
+"""
+class tiffBlockReader:
+	def __init__(self, filename):
+		self.filename = filename
+		self.fd = open(filename, "rb")
+		try:
+			self.readHeader()
+		except:
+			self.fd.close()
+			raise
+	
+	def readHeader(self):
+		header = self.fd.read(16)
+		if (header[:2] == b"II"):
+			order = "<"
+		elif (header[:2] == b"MM"):
+			order = ">"
+		else:
+			raise ValueError("%s is not a TIFF file" % self.filename)
+		version = struct.unpack(order+"H", header[2:4])[0]
+		# Formats of the number of entries, of the number of values of an entry, and of offsets
+		if (version == 42):
+			countformat, entrysize, valuesize = "HI", 12, 4
+			offset = struct.unpack(order+"I", header[4:8])[0]
+		elif (version == 43):
+			countformat, entrysize, valuesize = "QQ", 20, 8
+			offset = struct.unpack(order+"Q", header[8:16])[0]
+		else:
+			raise ValueError("%s is not a TIFF file" % self.filename)
+		offsetformat = order + ("I" if (version == 42) else "Q")
+		self.fd.seek(offset)
+		nentries = struct.unpack(order+countformat[0], self.fd.read(struct.calcsize(countformat[0])))[0]
+		entries = self.fd.read(nentries*entrysize)
+		nextifd = struct.unpack(offsetformat, self.fd.read(valuesize))[0]
+		if (nextifd != 0):
+			raise ValueError("%s has several frames" % self.filename)
+		tags = {}
+		for i in range(nentries):
+			entry = entries[i*entrysize:(i+1)*entrysize]
+			tag, type = struct.unpack(order+"HH", entry[:4])
+			if ((tag not in _tiffTags.values()) or (type not in _tiffTypes)):
+				continue
+			count = struct.unpack(order+countformat[1], entry[4:4+valuesize])[0]
+			size = count*struct.calcsize(_tiffTypes[type])
+			value = entry[entrysize-valuesize:]
+			if (size > valuesize):
+				self.fd.seek(struct.unpack(offsetformat, value)[0])
+				value = self.fd.read(size)
+			tags[tag] = struct.unpack("%s%d%s" % (order, count, _tiffTypes[type]), value[:size])
+		tag = lambda name, default=None: tags.get(_tiffTags[name], (default,))
+		if (tag("compression", 1)[0] != 1):
+			raise ValueError("%s is compressed" % self.filename)
+		if (tag("samples", 1)[0] != 1):
+			raise ValueError("%s has several samples per pixel" % self.filename)
+		bits = tag("bits", 1)[0]
+		sampleformat = tag("sampleformat", 1)[0]
+		if ((bits not in (8, 16, 32, 64)) or (sampleformat not in _tiffSampleFormats)):
+			raise ValueError("%s has an unsupported data type" % self.filename)
+		self.dtype = numpy.dtype("%s%s%d" % (order, _tiffSampleFormats[sampleformat], bits//8))
+		self.shape = (tag("length")[0], tag("width")[0])
+		if (None in self.shape):
+			raise ValueError("%s has no image size" % self.filename)
+		# Strips are read as tiles with the width of the image
+		if (_tiffTags["tileoffsets"] in tags):
+			self.tileshape = (tag("tilelength")[0], tag("tilewidth")[0])
+			self.offsets = tag("tileoffsets")
+		else:
+			self.tileshape = (min(tag("rowsperstrip", self.shape[0])[0], self.shape[0]), self.shape[1])
+			self.offsets = tag("stripoffsets")
+		self.tilesacross = -(-self.shape[1] // self.tileshape[1])
+		ntiles = self.tilesacross * -(-self.shape[0] // self.tileshape[0])
+		if ((None in self.tileshape) or (None in self.offsets) or (len(self.offsets) < ntiles)):
+			raise ValueError("%s has no data offsets" % self.filename)
+		self.rowbytes = self.shape[1]*self.dtype.itemsize
+		# Fast path: strips written one after the other, rows are read at once
+		stripbytes = self.tileshape[0]*self.rowbytes
+		self.contiguous = (self.tilesacross == 1) and all(self.offsets[i] == self.offsets[0] + i*stripbytes for i in range(ntiles))
+	
+	@property
+	def nbytes(self):
+		return self.shape[0]*self.rowbytes
+	
+	"""
+	Reads rows start to stop in out (an array of shape (stop-start, columns), created if None)
+	"""
+	def read(self, start, stop, out=None):
+		if (out is None):
+			out = numpy.empty((stop-start, self.shape[1]), self.dtype)
+		if (self.contiguous):
+			self.fd.seek(self.offsets[0] + start*self.rowbytes)
+			self.fd.readinto(memoryview(out).cast("B"))
+			return out
+		tilerows, tilecols = self.tileshape
+		itemsize = self.dtype.itemsize
+		buffer = numpy.empty((tilerows, tilecols), self.dtype)
+		for band in range(start // tilerows, -(-stop // tilerows)):
+			row0 = max(start, band*tilerows)
+			row1 = min(stop, (band+1)*tilerows)
+			rows = buffer[:row1-row0]
+			for across in range(self.tilesacross):
+				self.fd.seek(self.offsets[band*self.tilesacross + across] + (row0 - band*tilerows)*tilecols*itemsize)
+				self.fd.readinto(memoryview(rows).cast("B"))
+				col0 = across*tilecols
+				col1 = min(self.shape[1], col0+tilecols)
+				out[row0-start:row1-start, col0:col1] = rows[:, :col1-col0]
+		return out
+	
+	def close(self):
+		self.fd.close()
+	
+	def __enter__(self):
+		return self
+	
+	def __exit__(self, exctype, value, traceback):
+		self.close()
+
+"""
+True if the file can be read by blocks of rows, see tiffBlockReader
+"""
+def readableByBlocks(filename):
+	try:
+		tiffBlockReader(filename).close()
+	except (ValueError, OSError, struct.error):
+		return False
+	return True
+
+"""
+Writes an uncompressed TIFF file by blocks of rows, as they are computed
+Rows go in strips, written one after the other, and the image file directory
+at the end. BigTIFF is used for images of 4 GB and more, unless bigtiff is
+True or False. The file is written under a temporary name and renamed when
+closed, see writeTiff
+"""
+class tiffBlockWriter:
+	def __init__(self, filename, shape, dtype, bigtiff=None):
+		self.filename = filename
+		self.shape = shape
+		self.dtype = numpy.dtype(dtype).newbyteorder("<")
+		if (self.dtype.kind not in _tiffSampleFormats.values()):
+			raise ValueError("Data of type %s can not be saved in TIFF" % self.dtype)
+		self.rowbytes = shape[1]*self.dtype.itemsize
+		self.rowsperstrip = max(1, min(shape[0], 2**18 // self.rowbytes))
+		self.nstrips = -(-shape[0] // self.rowsperstrip)
+		if (bigtiff is None):
+			bigtiff = (shape[0]*self.rowbytes + 16*self.nstrips + 1024 >= 2**32)
+		self.bigtiff = bigtiff
+		path, name = os.path.split(filename)
+		self.tmpname = os.path.join(path, ".%s.%d.part" % (name, os.getpid()))
+		self.fd = open(self.tmpname, "wb")
+		# Header, the image file directory comes after the data
+		ifdoffset = self.dataOffset() + shape[0]*self.rowbytes
+		ifdoffset += ifdoffset % 2
+		if (self.bigtiff):
+			self.fd.write(struct.pack("<2sHHHQ", b"II", 43, 8, 0, ifdoffset))
+		else:
+			self.fd.write(struct.pack("<2sHI", b"II", 42, ifdoffset))
+		self.ifdoffset = ifdoffset
+		self.row = 0
+	
+	def dataOffset(self):
+		return 16 if self.bigtiff else 8
+	
+	def write(self, block):
+		if ((block.ndim != 2) or (block.shape[1] != self.shape[1]) or (self.row + block.shape[0] > self.shape[0])):
+			raise ValueError("Block of shape %s does not fit in an image of shape %s at row %d" % (str(block.shape), str(self.shape), self.row))
+		self.fd.write(numpy.ascontiguousarray(block, self.dtype))
+		self.row += block.shape[0]
+	
+	def close(self):
+		if (self.row != self.shape[0]):
+			self.abort()
+			raise ValueError("Only %d rows out of %d were written in %s" % (self.row, self.shape[0], self.filename))
+		if (self.fd.tell() < self.ifdoffset):
+			self.fd.write(b"\0")
+		stripbytes = self.rowsperstrip*self.rowbytes
+		offsets = [self.dataOffset() + i*stripbytes for i in range(self.nstrips)]
+		counts = [min(stripbytes, self.shape[0]*self.rowbytes - offset + self.dataOffset()) for offset in offsets]
+		longtype = 16 if self.bigtiff else 4
+		entries = [(256, 4, [self.shape[1]]), (257, 4, [self.shape[0]]), (258, 3, [8*self.dtype.itemsize]), (259, 3, [1]), (262, 3, [1]), (273, longtype, offsets), (277, 3, [1]), (278, 4, [self.rowsperstrip]), (279, longtype, counts), (284, 3, [1]), (339, 3, [[k for k, v in _tiffSampleFormats.items() if v == self.dtype.kind][0]])]
+		countformat, entrysize, valuesize = ("QQ", 20, 8) if self.bigtiff else ("HI", 12, 4)
+		# Values that do not fit in their entry go after the directory
+		extra = self.ifdoffset + struct.calcsize("<"+countformat[0]) + len(entries)*entrysize + valuesize
+		directory = struct.pack("<"+countformat[0], len(entries))
+		values = b""
+		for tag, type, data in entries:
+			packed = struct.pack("<%d%s" % (len(data), _tiffTypes[type]), *data)
+			directory += struct.pack("<HH"+countformat[1], tag, type, len(data))
+			if (len(packed) <= valuesize):
+				directory += packed.ljust(valuesize, b"\0")
+			else:
+				directory += struct.pack("<"+("Q" if self.bigtiff else "I"), extra + len(values))
+				values += packed
+		directory += b"\0"*valuesize
+		self.fd.write(directory + values)
+		self.fd.close()
+		os.replace(self.tmpname, self.filename)
+	
+	"""
+	Closes and removes the temporary file, nothing is written
+	"""
+	def abort(self):
+		self.fd.close()
+		if (os.path.exists(self.tmpname)):
+			os.remove(self.tmpname)
+	
+	def __enter__(self):
+		return self
+	
+	def __exit__(self, exctype, value, traceback):
+		if (exctype is None):
+			self.close()
+		else:
+			self.abort()
+
+"""
+Masks an image by blocks of rows, so that it never has to be in memory at once
+
+Blocks of the input are read from the file, validated, masked with the
+matching rows of the mask and written to the output as they are done. The
+result is the same as with maskFrames. The mask is kept in memory with one
+bit per pixel, and unpacked one block at a time.
+
+Parameters:
+- infile: input file, uncompressed TIFF with a single frame (see tiffBlockReader)
+- outfile: output file, uncompressed TIFF
+- omask: orientedMask or maskComposition
+- intensityshift, outputtype: see applyMask
+- saturation: see validateData
+- validateonly: if True, nothing is written
+- tilebytes: memory for one block, in bytes (input, output and mask together)
+
+Returns the validation results of the whole image, see validateData
+"""
+def maskByBlocks(infile, outfile, omask, intensityshift=0., outputtype="auto", saturation=None, validateonly=False, tilebytes=defaultTileBytes):
+	above, nonpositive = None, False
+	if (isinstance(omask, maskComposition)):
+		packed = omask.packed()
+		above, nonpositive = omask.above, omask.nonpositive
+	elif (isinstance(omask, packedOrientedMask)):
+		packed = omask.packed
+	else:
+		packed = packedMask(omask.mask)
+	with tiffBlockReader(infile) as reader:
+		if (reader.shape != packed.shape):
+			raise ValueError("Mask shape %s does not match data shape %s" % (str(packed.shape), str(reader.shape)))
+		nrows, ncols = reader.shape
+		dtype = outputDtype(reader.dtype, intensityshift, outputtype)
+		if ((outputtype == "auto") and (dtype != outputDtype(reader.dtype, intensityshift, outputtype, numpy.zeros(1, reader.dtype)))):
+			# Same choice as for the whole image in memory: needs the range of un-masked pixels, read first
+			info = numpy.iinfo(reader.dtype)
+			low, high = info.max, info.min
+			nread = max(1, tilebytes // (reader.rowbytes + ncols))
+			for start in range(0, nrows, nread):
+				stop = min(nrows, start + nread)
+				block = reader.read(start, stop)
+				mask = packed.rows(start, stop)
+				if (above is not None):
+					mask |= (block > above)
+				if (nonpositive):
+					mask |= (block <= 0)
+				numpy.logical_not(mask, out=mask)
+				low = min(low, numpy.minimum.reduce(block, axis=None, where=mask, initial=info.max))
+				high = max(high, numpy.maximum.reduce(block, axis=None, where=mask, initial=info.min))
+			# All pixels masked: only -1 to save, as in memory
+			dtype = outputDtype(reader.dtype, intensityshift, outputtype, numpy.array([low, high] if (low <= high) else [0], reader.dtype))
+		# Input, output, mask and un-masked pixels, and indices of masked pixels
+		pixelbytes = reader.dtype.itemsize + (0 if validateonly else dtype.itemsize) + 2 + 8.*packed.count/(nrows*ncols)
+		nblock = max(1, min(nrows, int(tilebytes // (ncols*pixelbytes))))
+		data = numpy.empty((nblock, ncols), reader.dtype)
+		out = None if validateonly else numpy.empty((nblock, ncols), dtype)
+		writer = None if validateonly else tiffBlockWriter(outfile, reader.shape, dtype)
+		results = []
+		try:
+			for start in range(0, nrows, nblock):
+				stop = min(nrows, start+nblock)
+				block = data[:stop-start]
+				with profiler.stage("load", infile, block.nbytes):
+					reader.read(start, stop, block)
+				with profiler.stage("orient", infile):
+					mask = packed.rows(start, stop)
+					if (above is not None):
+						mask |= (block > above)
+					if (nonpositive):
+						mask |= (block <= 0)
+					blockmask = orientedMask(mask.view(numpy.uint8))
+				with profiler.stage("validate", infile, block.nbytes):
+					results.append(validateData(block, blockmask, intensityshift, saturation))
+				if (validateonly):
+					continue
+				with profiler.stage("mask", infile, block.nbytes):
+					applyMask(block, blockmask, intensityshift, out=out[:stop-start])
+				with profiler.stage("write", infile, out[:stop-start].nbytes):
+					writer.write(out[:stop-start])
+		except:
+			if (writer is not None):
+				writer.abort()
+			raise
+		if (writer is not None):
+			writer.close()
+	merged = mergeValidation(results)
+	merged["nframes"] = 1
+	merged["nmasked"] = sum([r["nmasked"] for r in results])
+	merged["nunmasked"] = sum([r["nunmasked"] for r in results])
+	return merged
+
+#################################################################
+#
+# Bad pixel masks, from statistics over many frames
+#
+#################################################################
+
+"""
+Running statistics of each pixel over frames added one at a time
+
+Mean and variance are updated with Welford's algorithm, which is stable for
+many frames. Only the statistics are kept, so that memory does not depend on
+the number of frames: mean and sum of squared deviations in float32 (updates
+are computed in float64), minimum and maximum in the data type. Frames are
+processed by blocks of rows, to keep temporary arrays small.
+
+Attributes:
+- count: number of frames
+- mean, m2: mean and sum of squared deviations of each pixel
+- minimum, maximum: extreme values of each pixel
+- nan: True for pixels that were NaN in at least one frame (None for integer data)
+"""
+class pixelStatistics:
+	def __init__(self):
+		self.count = 0
+		self.shape = None
+	
+	"""
+	Adds one frame
+	"""
+	def add(self, data):
+		if (self.shape is None):
+			self.shape = data.shape
+			self.mean = numpy.zeros(data.shape, dtype=numpy.float32)
+			self.m2 = numpy.zeros(data.shape, dtype=numpy.float32)
+			self.minimum = data.copy()
+			self.maximum = data.copy()
+			self.nan = numpy.zeros(data.shape, dtype=bool) if (numpy.issubdtype(data.dtype, numpy.floating)) else None
+		elif (data.shape != self.shape):
+			raise ValueError("Frame shape %s does not match previous frames %s" % (str(data.shape), str(self.shape)))
+		self.count += 1
+		for row in range(0, data.shape[0], _validationRows):
+			rows = slice(row, row+_validationRows)
+			block = data[rows]
+			mean = self.mean[rows].astype(numpy.float64)
+			delta = block - mean
+			mean += delta / self.count
+			delta *= (block - mean)
+			self.mean[rows] = mean
+			self.m2[rows] += delta
+			numpy.minimum(self.minimum[rows], block, out=self.minimum[rows], casting="unsafe")
+			numpy.maximum(self.maximum[rows], block, out=self.maximum[rows], casting="unsafe")
+			if (self.nan is not None):
+				self.nan[rows] |= numpy.isnan(block)
+	
+	"""
+	Variance of each pixel over frames
+	"""
+	def variance(self):
+		if (self.count < 2):
+			return numpy.zeros(self.shape, dtype=numpy.float32)
+		return self.m2 / (self.count - 1)
+
+"""
+Median of each pixel and its size x size neighbours, and median absolute
+deviation from this median, computed by blocks of rows
+Edges are padded by repeating the last rows and columns
+"""
+def localMedian(image, size=3):
+	half = size // 2
+	median = numpy.empty(image.shape, dtype=image.dtype)
+	deviation = numpy.empty(image.shape, dtype=image.dtype)
+	# About 4 million values in temporary arrays for each block
+	rows = max(1, (1 << 22) // (size*size*image.shape[1]))
+	for row in range(0, image.shape[0], rows):
+		nrows = min(rows, image.shape[0]-row)
+		first = max(0, row-half)
+		last = min(image.shape[0], row+nrows+half)
+		padded = numpy.pad(image[first:last], ((half-(row-first), half-(last-row-nrows)), (half, half)), mode="edge")
+		stack = numpy.empty((size*size, nrows, image.shape[1]), dtype=image.dtype)
+		for i in range(size):
+			for j in range(size):
+				stack[i*size+j] = padded[i:i+nrows, j:j+image.shape[1]]
+		blockmedian = median[row:row+nrows]
+		numpy.median(stack, axis=0, out=blockmedian)
+		numpy.abs(numpy.subtract(stack, blockmedian, out=stack), out=stack)
+		numpy.median(stack, axis=0, out=deviation[row:row+nrows], overwrite_input=True)
+	return median, deviation
+
+"""
+Difference between each pixel and the median of its size x size neighbours,
+relative to their spread. The spread is estimated from the median absolute
+deviation, so that intensity gradients, on the edges of diffraction rings for
+instance, are not taken for bad pixels. It is at least its typical value over
+the detector, as it is close to zero in flat regions and often underestimated
+with few neighbours.
+"""
+def localDeviation(image, size=5):
+	median, scale = localMedian(image, size)
+	scale *= 1.4826
+	valid = numpy.isfinite(scale)
+	floor = float(numpy.median(scale[valid])) if (numpy.any(valid)) else 0.
+	del valid
+	numpy.maximum(scale, max(floor, 1.e-6), out=scale)
+	deviation = numpy.subtract(image, median, out=median)
+	deviation /= scale
+	return deviation
+
+# Types of bad pixels, in the order of badPixels results
+badPixelTypes = ["dead", "saturated", "stuck", "outlier", "noisy", "nan"]
+
+# Minimum number of frames to find stuck and noisy pixels
+_stuckFrames = 10
+
+"""
+Finds bad pixels from statistics over many frames
+
+- dead: always at or below zero
+- saturated: always at or above saturation
+- stuck: constant in all frames while one of their neighbours changes (at least 10 frames)
+- outlier: mean intensity differs from the median of the size x size neighbours by more
+  than nsigma times their spread (hot or cold pixels), see localDeviation
+- noisy: standard deviation over frames above the median of the neighbours by more than
+  nsigma times their spread (at least 10 frames)
+- nan: NaN in at least one frame
+
+Parameters:
+- statistics: pixelStatistics
+- saturation: intensity of saturated pixels. Default is the largest value for
+  integer data, none for floating point data
+- nsigma: threshold for outliers
+- size: size of the neighbourhood
+
+Returns a boolean mask, True at bad pixels, and a dictionnary with the number of
+pixels of each type (a pixel can be of several types)
+"""
+def badPixels(statistics, saturation=None, nsigma=8., size=5):
+	if (statistics.count == 0):
+		raise ValueError("No frame to compute statistics")
+	counts = collections.OrderedDict()
+	dead = (statistics.maximum <= 0)
+	counts["dead"] = numpy.count_nonzero(dead)
+	if ((saturation is None) and (not numpy.issubdtype(statistics.minimum.dtype, numpy.floating))):
+		saturation = numpy.iinfo(statistics.minimum.dtype).max
+	mask = dead
+	if (saturation is not None):
+		saturated = (statistics.minimum >= saturation)
+		counts["saturated"] = numpy.count_nonzero(saturated)
+		mask |= saturated
+		del saturated
+	else:
+		counts["saturated"] = 0
+	# Dead and saturated pixels are not counted again as stuck or outliers
+	counts["stuck"] = 0
+	if (statistics.count >= _stuckFrames):
+		changing = (statistics.minimum != statistics.maximum)
+		neighbours = changing.copy()
+		neighbours[1:] |= changing[:-1]
+		neighbours[:-1] |= changing[1:]
+		neighbours[:,1:] |= changing[:,:-1]
+		neighbours[:,:-1] |= changing[:,1:]
+		stuck = neighbours & ~changing & ~mask
+		counts["stuck"] = numpy.count_nonzero(stuck)
+		mask |= stuck
+		del changing, neighbours, stuck
+	deviation = localDeviation(statistics.mean, size)
+	outlier = (numpy.abs(deviation, out=deviation) > nsigma) & ~mask
+	counts["outlier"] = numpy.count_nonzero(outlier)
+	mask |= outlier
+	del deviation, outlier
+	counts["noisy"] = 0
+	if (statistics.count >= _stuckFrames):
+		deviation = localDeviation(numpy.sqrt(statistics.variance()), size)
+		noisy = (deviation > nsigma) & ~mask
+		counts["noisy"] = numpy.count_nonzero(noisy)
+		mask |= noisy
+		del deviation, noisy
+	counts["nan"] = 0
+	if (statistics.nan is not None):
+		counts["nan"] = numpy.count_nonzero(statistics.nan)
+		mask |= statistics.nan
+	return mask, dict((name, int(counts[name])) for name in badPixelTypes)
+
+"""
+Builds a bad pixel mask from all frames of a list of files, and saves it
+
+Frames are read one at a time, so that memory is a few times that of one frame,
+whatever the number of frames. The mask is saved as a tiff with 1 at bad pixels,
+as Dioptas masks, and can be loaded in the GUI or combined with other masks.
+It is in the orientation of the data: use it without rotation or flip.
+
+Parameters:
+- files: list of input files
+- maskfile: output mask file
+- saturation, nsigma, size: see badPixels
+
+Returns the number of frames and the number of bad pixels of each type
+"""
+def badPixelMask(files, maskfile, saturation=None, nsigma=8., size=5, verbose=True):
+	statistics = pixelStatistics()
+	start = time.time()
+	for filename in files:
+		for index, nframes, data in iterFrames(filename):
+			with profiler.stage("statistics", filename, data.nbytes):
+				statistics.add(data)
+	with profiler.stage("badpixels", maskfile):
+		mask, counts = badPixels(statistics, saturation, nsigma, size)
+	writeTiff(mask.astype(numpy.uint8), maskfile)
+	if (verbose):
+		print("Statistics over %d frames in %.2f s: %d bad pixels (%s) saved in %s" % (statistics.count, time.time()-start, numpy.count_nonzero(mask), ", ".join(["%d %s" % (counts[name], name) for name in badPixelTypes]), maskfile))
+	return statistics.count, counts
+
+#################################################################
+#
+# Incremental processing: a manifest records what was done before
+#
+#################################################################
+
+"""
+Hash of the contents of a file, read by blocks of blocksize bytes
+"""
+def hashFile(filename, blocksize=1048576):
+	h = hashlib.blake2b(digest_size=16)
+	with open(filename, "rb") as f:
+		block = f.read(blocksize)
+		while (len(block) > 0):
+			h.update(block)
+			block = f.read(blocksize)
+	return h.hexdigest()
+
+"""
+Hash of everything, besides the input file, that changes the masked data
+or its validation: the mask contents and the processing options
+"""
+def parametersHash(maskfile, nrotmask=0, flipud=False, fliplr=False, intensityshift=0., outputtype="auto", stackmode="split", saturation=None):
+	maskhash = maskfile.hash() if isinstance(maskfile, maskComposition) else hashFile(maskfile)
+	parameters = [maskhash, nrotmask % 4, bool(flipud), bool(fliplr), float(intensityshift), outputtype, stackmode, saturation]
+	return hashlib.blake2b(json.dumps(parameters).encode(), digest_size=16).hexdigest()
+
+"""
+Size and modification time of a file, or None if it does not exist
+"""
+def fileState(filename):
+	try:
+		info = os.stat(filename)
+	except OSError:
+		return None
+	return [info.st_size, info.st_mtime_ns]
+
+"""
+Files written by maskFrames for outfile, for an input file with nframes frames
+"""
+def outputFiles(outfile, nframes, mode="split"):
+	if ((nframes > 1) and (mode == "split")):
+		return [frameOutputName(outfile, index) for index in range(nframes)]
+	return [outfile]
+
+"""
+Manifest of masked files, saved in JSON
+
+For each input file, it records its size, modification time and hash, the hash
+of the mask and options (see parametersHash), the output files with their size
+and modification time, and the validation results.
+
+A file is up to date if none of these changed. Input files are only hashed when
+their size or modification time changed, so that checking a large dataset only
+needs to look at file sizes and dates.
+
+Each change is also appended to a journal (filename.log) as soon as it is made,
+so that an interrupted or killed run loses nothing. The journal is merged into
+the manifest by save.
+
+Parameters:
+- filename: JSON file for the manifest, created if it does not exist
+"""
+class resultManifest:
+	def __init__(self, filename):
+		self.filename = filename
+		self.journalname = filename + ".log"
+		self.journal = None
+		self.entries = {}
+		if (os.path.exists(filename)):
+			with open(filename) as f:
+				self.entries = json.load(f).get("files", {})
+		if (os.path.exists(self.journalname)):
+			with open(self.journalname) as f:
+				for line in f:
+					try:
+						name, entry = json.loads(line)
+					except ValueError:
+						# Last line of a run that was killed while writing
+						break
+					if (entry is None):
+						self.entries.pop(name, None)
+					else:
+						self.entries[name] = entry
+	
+	"""
+	Appends a change to the journal
+	"""
+	def log(self, name, entry):
+		if (self.journal is None):
+			self.journal = open(self.journalname, "a")
+		self.journal.write(json.dumps([name, entry]) + "\n")
+		self.journal.flush()
+	
+	"""
+	Checks if outfile is up to date for infile and parameters
+	Returns (uptodate, inputhash). If the input changed on disk but its previous
+	contents could still match, inputhash is its previous hash, otherwise None.
+	"""
+	def check(self, infile, outfile, parameters):
+		entry = self.entries.get(os.path.abspath(infile))
+		if ((entry is None) or (entry["parameters"] != parameters) or (entry["output"] != os.path.abspath(outfile))):
+			return False, None
+		for name, state in entry["outputs"].items():
+			if (fileState(name) != state):
+				return False, None
+		if (fileState(infile) == entry["input"]):
+			return True, entry["hash"]
+		return False, entry["hash"]
+	
+	"""
+	Validation results recorded for infile
+	"""
+	def result(self, infile):
+		return dict(self.entries[os.path.abspath(infile)]["result"])
+	
+	"""
+	Records a masked file, with the hash of the input contents it was computed from
+	"""
+	def record(self, infile, outfile, parameters, inputhash, result, mode="split", inputstate=None):
+		outputs = outputFiles(outfile, result["nframes"], mode)
+		name = os.path.abspath(infile)
+		self.entries[name] = {"input": inputstate or fileState(infile), "hash": inputhash, "parameters": parameters, "output": os.path.abspath(outfile), "outputs": dict((os.path.abspath(output), fileState(output)) for output in outputs), "result": result}
+		self.log(name, self.entries[name])
+	
+	def remove(self, infile):
+		name = os.path.abspath(infile)
+		if (name in self.entries):
+			del self.entries[name]
+			self.log(name, None)
+	
+	"""
+	Saves the manifest, atomically, and clears the journal
+	"""
+	def save(self):
+		tmpname = self.filename + ".part"
+		with open(tmpname, "w") as f:
+			json.dump({"version": 1, "files": self.entries}, f)
+		os.replace(tmpname, self.filename)
+		if (self.journal is not None):
+			self.journal.close()
+			self.journal = None
+		if (os.path.exists(self.journalname)):
+			os.remove(self.journalname)
+
+#################################################################
+#
+# Sidecar files: masked pixels, mask options and validation, without image data
+#
+#################################################################
+
+# Encoding of masked pixels in sidecar files
+sidecarEncoding = "rle-uint64-zlib-base64"
+
+"""
+Run-length encoding of a boolean mask, in row-major order
+Returns an array alternating the number of un-masked pixels before each run
+of masked pixels, and the length of the run
+"""
+def maskRuns(mask):
+	flat = numpy.concatenate(([False], mask.ravel(), [False])).view(numpy.int8)
+	changes = numpy.diff(flat)
+	starts = numpy.flatnonzero(changes == 1)
+	ends = numpy.flatnonzero(changes == -1)
+	runs = numpy.empty(2*starts.size, dtype="<u8")
+	runs[0::2] = starts - numpy.concatenate(([0], ends[:-1]))
+	runs[1::2] = ends - starts
+	return runs
+
+"""
+Masked pixels of a boolean mask, for a sidecar file
+"""
+def encodeMask(mask):
+	runs = maskRuns(mask)
+	return {"shape": list(mask.shape), "nmasked": int(runs[1::2].sum()), "nruns": runs.size//2, "encoding": sidecarEncoding, "runs": base64.b64encode(zlib.compress(runs.tobytes(), 6)).decode("ascii")}
+
+"""
+Boolean mask, True at masked pixels, from encodeMask results
+"""
+def decodeMask(encoded):
+	if (encoded["encoding"] != sidecarEncoding):
+		raise ValueError("Unknown encoding %s for masked pixels" % encoded["encoding"])
+	runs = numpy.frombuffer(zlib.decompress(base64.b64decode(encoded["runs"])), dtype="<u8").astype(numpy.int64)
+	mask = numpy.zeros(encoded["shape"][0]*encoded["shape"][1], dtype=bool)
+	# Runs alternate between un-masked and masked pixels, the last un-masked pixels are not listed
+	filled = numpy.repeat(numpy.tile([False, True], runs.size//2), runs)
+	mask[:filled.size] = filled
+	return mask.reshape(encoded["shape"])
+
+"""
+Contents of a sidecar file
+
+The runs of masked pixels, and their number (nmasked of mask), only cover the
+mask files. Pixels masked by thresholds depend on each image: for each file,
+nmasked counts all masked pixels, as in the validation results, and nthresholded
+the pixels masked by thresholds only (both for the first frame).
+
+Parameters:
+- mask: orientedMask of the mask files, without thresholds (see maskComposition.forFrame),
+  or masked pixels already encoded with encodeMask, to reuse them for many files
+- description: mask files, orientations and thresholds, see maskComposition.describe
+- intensityshift, outputtype: see applyMask
+- results: validation results of the files, see batchProcess
+"""
+def maskSidecar(mask, description, intensityshift, outputtype, results):
+	sidecar = {"version": 1, "program": "maskTiff4Maud"}
+	sidecar["mask"] = mask if isinstance(mask, dict) else encodeMask(mask.mask)
+	sidecar["composition"] = description
+	sidecar["intensityshift"] = intensityshift
+	sidecar["outputtype"] = outputtype
+	sidecar["files"] = []
+	for result in results:
+		entry = dict((key, result.get(key)) for key in validationFields)
+		entry["nthresholded"] = None if (result.get("nmasked") is None) else result["nmasked"] - sidecar["mask"]["nmasked"]
+		sidecar["files"].append(entry)
+	return sidecar
+
+"""
+Name of the sidecar file of an output file
+"""
+def sidecarName(outfile):
+	return os.path.splitext(outfile)[0] + ".mask.json"
+
+"""
+Saves a sidecar file, see maskSidecar
+"""
+def writeSidecar(filename, sidecar):
+	tmpname = filename + ".part"
+	with open(tmpname, "w") as f:
+		json.dump(sidecar, f, indent=1)
+	os.replace(tmpname, filename)
+
+def readSidecar(filename):
+	with open(filename) as f:
+		return json.load(f)
+
+"""
+Oriented mask saved in a sidecar file, to check or mask data again without the mask files
+Pixels masked by thresholds (see the composition of the sidecar) are not included
+"""
+def sidecarMask(sidecar):
+	return orientedMask(decodeMask(sidecar["mask"]).view(numpy.uint8))
+
+"""
+Writes sidecar files for batch results, see batchProcess
+
+Parameters:
+- maskfile, nrotmask, flipud, fliplr: mask, as in batchProcess
+- intensityshift, outputtype: see applyMask
+- results: results of batchProcess, files with errors are left out
+- each: if True, one sidecar per output file, see sidecarName
+- shared: if set, one sidecar with all files is saved in this file
+
+Returns the number of files written
+"""
+def writeBatchSidecars(maskfile, nrotmask, flipud, fliplr, intensityshift, outputtype, results, each=False, shared=None):
+	if (not isinstance(maskfile, maskComposition)):
+		maskfile = maskComposition([maskLayer(maskfile, nrotmask, flipud, fliplr)])
+	# All files share the mask files: they are encoded once
+	encoded = encodeMask(maskfile.forFrame(None).mask)
+	description = maskfile.describe()
+	results = [result for result in results if (result["error"] is None)]
+	nwritten = 0
+	if (each):
+		for result in results:
+			if (result["output"] is not None):
+				writeSidecar(sidecarName(result["output"]), maskSidecar(encoded, description, intensityshift, outputtype, [result]))
+				nwritten += 1
+	if (shared is not None):
+		writeSidecar(shared, maskSidecar(encoded, description, intensityshift, outputtype, results))
+		nwritten += 1
+	return nwritten
+
+#################################################################
+#
+# Batch processing, without graphical interface
+#
+#################################################################
+
+# Oriented mask and options, set once in each worker process
+_batchMask = None
+_batchShift = 0.
+_batchSaturation = None
+_batchOutputType = "auto"
+_batchStackMode = "split"
+_batchTileBytes = None
+
+"""
+Loads and orients the mask in a worker process
+maskfile is a mask file or a maskComposition (whose orientations are used instead of nrotmask, flipud and fliplr)
+With tilebytes, the mask is only kept packed, and unpacked if a file is small
+enough to be masked in memory
+"""
+def _batchInit(maskfile, nrotmask, flipud, fliplr, intensityshift, saturation=None, outputtype="auto", stackmode="split", tilebytes=None):
+	global _batchMask, _batchShift, _batchSaturation, _batchOutputType, _batchStackMode, _batchTileBytes
+	with profiler.stage("orient", maskfile if isinstance(maskfile, str) else None):
+		if ((tilebytes is not None) and (not isinstance(maskfile, maskComposition))):
+			maskfile = maskComposition([maskLayer(maskfile, nrotmask, flipud, fliplr)])
+		if (isinstance(maskfile, maskComposition)):
+			_batchMask = maskfile
+			if (tilebytes is None):
+				_batchMask.fixedMask()
+			else:
+				_batchMask.packed()
+		else:
+			_batchMask = getOrientedMask(fabio.open(maskfile).data, nrotmask, flipud, fliplr)
+	_batchShift = intensityshift
+	_batchSaturation = saturation
+	_batchOutputType = outputtype
+	_batchStackMode = stackmode
+	_batchTileBytes = tilebytes
+
+"""
+Initializer of worker processes: Ctrl-C is left to the main process
+If profile is True, stages are measured as in the main process
+"""
+def _batchWorkerInit(profile, *initargs):
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+	if (profile):
+		profiler.enable()
+	_batchInit(*initargs)
+
+"""
+Validates and masks one file in a worker process
+Nothing is written if the output file is None
+
+In incremental mode, job has a third element, the previous hash of the input
+file (or None). The input is hashed first, and is not processed again if its
+contents did not change.
+
+Returns a dictionnary with the input file, the output file, an error
+message (or None) and the validation results. In incremental mode, it also has
+the input hash and state, and skipped is True if nothing was done. If the
+profiler is on, profile has its records, see _collectProfile.
+"""
+def _batchWorker(job):
+	infile, outfile = job[0], job[1]
+	result = {"file": infile, "output": outfile, "error": None}
+	try:
+		if (len(job) > 2):
+			result["inputstate"] = fileState(infile)
+			with profiler.stage("hash", infile) as stage:
+				result["inputhash"] = hashFile(infile)
+				stage.nbytes = result["inputstate"][0]
+			result["skipped"] = (result["inputhash"] == job[2])
+		if (not result.get("skipped", False)):
+			result.update(maskFrames(infile, outfile, _batchMask, _batchShift, _batchOutputType, _batchSaturation, _batchStackMode, validateonly=(outfile is None), tilebytes=_batchTileBytes))
+	except Exception as e:
+		result["error"] = "%s" % e
+	if (profiler.enabled):
+		result["profile"] = profiler.take()
+	return result
+
+"""
+Moves the profile records of a worker result to the profiler of this process
+Returns the result, without its records
+"""
+def _collectProfile(result):
+	records = result.pop("profile", None)
+	if (records):
+		profiler.extend(records)
+	return result
+
+"""
+Name of the masked output file for an input file
+"""
+def batchOutputName(infile, outdir=None, suffix="-masked"):
+	path, name = os.path.split(infile)
+	root, ext = os.path.splitext(name)
+	if (outdir is None):
+		outdir = path
+	return os.path.join(outdir, root + suffix + ".tif")
+
+"""
+Checks that no two input files would be saved in the same output file
+Raises ValueError otherwise
+"""
+def checkOutputNames(files, outdir=None, suffix="-masked"):
+	inputs = {}
+	for infile in files:
+		outfile = os.path.abspath(batchOutputName(infile, outdir, suffix))
+		if (outfile in inputs):
+			raise ValueError("%s and %s would both be saved in %s, use another output directory or rename one of them" % (inputs[outfile], infile, outfile))
+		inputs[outfile] = infile
+
+"""
+Expands a list of file names and glob patterns into a sorted list of files
+Patterns are expanded here so that it also works with shells that do not do it
+Files given twice are only kept once. If suffix is set, files whose names end
+with it are left out with a warning: they are outputs of a previous run.
+"""
+def expandInputFiles(patterns, suffix=None):
+	files = []
+	for pattern in patterns:
+		matches = sorted(glob.glob(pattern))
+		if (len(matches) > 0):
+			files.extend(matches)
+		elif (os.path.isfile(pattern)):
+			files.append(pattern)
+		else:
+			print("Warning: no file matching %s" % pattern, file=sys.stderr)
+	found = set()
+	unique = []
+	outputs = []
+	for name in files:
+		if (os.path.abspath(name) in found):
+			continue
+		found.add(os.path.abspath(name))
+		if (suffix and os.path.splitext(os.path.basename(name))[0].endswith(suffix)):
+			outputs.append(name)
+		else:
+			unique.append(name)
+	if (len(outputs) > 0):
+		print("Warning: %d files ending with %s were left out, they are outputs of a previous run (%s...)" % (len(outputs), suffix, outputs[0]), file=sys.stderr)
+	return unique
+
+"""
+Masks a list of files on a pool of worker processes
+
+Each worker loads and orients the mask once. Only file names and validation
+results are exchanged between processes, so that it scales with the number of cores.
+
+Parameters:
+- maskfile: mask file, from Dioptas for instance, or a maskComposition
+- files: list of input files
+- outdir: output directory (default: same directory as the input)
+- nrotmask, flipud, fliplr: orientation of the mask, as in the GUI
+- intensityshift: shift to add to all intensities
+- nproc: number of worker processes (default: number of cores)
+- suffix: added to input file names to build the output file names
+- saturation: intensity for saturated pixels, see validateData
+- validateonly: if True, validate the files but do not write anything
+- report: file name for a validation report, in CSV or JSON (see writeValidationReport)
+- outputtype: data type of masked files, one of outputTypes
+- stackmode: output for files with several frames, one of stackModes
+- manifest: incremental mode, name of the manifest file (see resultManifest).
+  Files whose contents, mask and options did not change since the last run are skipped.
+- tilebytes: memory for the data of one file, in bytes. Larger files are masked by
+  blocks when they can be, see maskByBlocks (default: files are masked in memory)
+- sidecar: if True, a sidecar file with masked pixels, options and validation
+  results is saved next to each output, see sidecarName and maskSidecar
+- sharedsidecar: if set, a sidecar file with the mask and the results of all files
+  is saved in this file
+
+Returns a list of dictionnaries, one per file, in the same order as files,
+with the output file, an error message (or None) and the validation results
+"""
+def batchProcess(maskfile, files, outdir=None, nrotmask=0, flipud=False, fliplr=False, intensityshift=0., nproc=None, suffix="-masked", verbose=True, saturation=None, validateonly=False, report=None, outputtype="auto", stackmode="split", manifest=None, tilebytes=None, sidecar=False, sharedsidecar=None):
+	if ((not validateonly) and (outdir is not None) and (not os.path.isdir(outdir))):
+		os.makedirs(outdir)
+	if (not validateonly):
+		checkOutputNames(files, outdir, suffix)
+	jobs = [(infile, None if validateonly else batchOutputName(infile, outdir, suffix)) for infile in files]
+	results = [None] * len(jobs)
+	start = time.time()
+	if ((manifest is not None) and (not validateonly)):
+		# Incremental mode: only files that changed are sent to the workers
+		manifest = resultManifest(manifest)
+		parameters = parametersHash(maskfile, nrotmask, flipud, fliplr, intensityshift, outputtype, stackmode, saturation)
+		todo = []
+		changed = []
+		for index, (infile, outfile) in enumerate(jobs):
+			uptodate, inputhash = manifest.check(infile, outfile, parameters)
+			if (uptodate):
+				results[index] = manifest.result(infile)
+			else:
+				todo.append(index)
+				changed.append((infile, outfile, inputhash))
+		jobs = changed
+	else:
+		manifest = None
+		todo = list(range(len(jobs)))
+	nskipped = len(results) - len(todo)
+	if (nproc is None):
+		nproc = os.cpu_count() or 1
+	nproc = max(1, min(nproc, len(jobs)))
+	initargs = (maskfile, nrotmask, flipud, fliplr, intensityshift, saturation, outputtype, stackmode, tilebytes)
+	pool = None
+	try:
+		if (len(jobs) == 0):
+			processed = []
+		elif (nproc == 1):
+			_batchInit(*initargs)
+			processed = map(_batchWorker, jobs)
+		else:
+			chunksize = max(1, len(jobs) // (4*nproc))
+			pool = multiprocessing.Pool(nproc, initializer=_batchWorkerInit, initargs=(profiler.enabled,)+initargs)
+			processed = pool.imap(_batchWorker, jobs, chunksize)
+		for index, result in zip(todo, processed):
+			result = _collectProfile(result)
+			if (manifest is not None):
+				inputstate = result.pop("inputstate", None)
+				inputhash = result.pop("inputhash", None)
+				if (result.pop("skipped", False)):
+					# Same contents, only the date of the input changed
+					result = manifest.result(result["file"])
+					manifest.record(result["file"], result["output"], parameters, inputhash, result, stackmode, inputstate)
+					nskipped += 1
+				elif (result["error"] is None):
+					manifest.record(result["file"], result["output"], parameters, inputhash, result, stackmode, inputstate)
+				else:
+					manifest.remove(result["file"])
+			results[index] = result
+	finally:
+		if (pool is not None):
+			pool.terminate()
+		if (manifest is not None):
+			manifest.save()
+	elapsed = time.time() - start
+	nerrors = 0
+	nnegative = 0
+	recommended = intensityshift
+	for result in results:
+		if (result["error"] is not None):
+			nerrors += 1
+			print("Error with %s: %s" % (result["file"], result["error"]), file=sys.stderr)
+		elif (result["nnegative"] > 0):
+			nnegative += 1
+			recommended = max(recommended, result["recommendedshift"])
+	if (report is not None):
+		writeValidationReport(report, results)
+	if (sidecar or (sharedsidecar is not None)):
+		writeBatchSidecars(maskfile, nrotmask, flipud, fliplr, intensityshift, outputtype, results, sidecar and (not validateonly), sharedsidecar)
+	if (verbose):
+		nprocessed = len(results) - nerrors - nskipped
+		rate = nprocessed / elapsed if (elapsed > 0) else 0.
+		action = "Validated" if validateonly else "Masked"
+		print("%s %d files in %.2f s with %d processes (%.1f files/s), %d errors" % (action, nprocessed, elapsed, nproc, rate, nerrors))
+		if (nskipped > 0):
+			print("%d files did not change since the last run and were not processed again" % nskipped)
+		if (nnegative > 0):
+			print("Warning: %d files have negative intensites in un-masked data. Minimum intensity shift to avoid this: %.1f" % (nnegative, recommended))
+	return results
+
+#################################################################
+#
+# Jobs shared between several processes or machines
+#
+#################################################################
+
+# Options of a job, saved in the job file, with their default values
+jobOptions = {"outdir": None, "suffix": "-masked", "nrotmask": 0, "flipud": False, "fliplr": False, "intensityshift": 0., "outputtype": "auto", "stackmode": "split", "saturation": None}
+
+"""
+Creates a job file, in JSON, with the list of input files, the mask and the options
+Paths are saved as absolute paths, so that all machines sharing the filesystem
+can run the job from any folder.
+
+Parameters:
+- jobfile: name of the job file
+- maskfile: mask file
+- files: list of input files
+- options: see jobOptions
+"""
+def createJob(jobfile, maskfile, files, **options):
+	job = dict(jobOptions)
+	for key, value in options.items():
+		if (key not in jobOptions):
+			raise ValueError("Unknown job option %s" % key)
+		job[key] = value
+	if (job["outdir"] is not None):
+		job["outdir"] = os.path.abspath(job["outdir"])
+	job["mask"] = maskfile.describe() if isinstance(maskfile, maskComposition) else os.path.abspath(maskfile)
+	job["files"] = [os.path.abspath(f) for f in files]
+	checkOutputNames(job["files"], job["outdir"], job["suffix"])
+	job["version"] = 1
+	tmpname = jobfile + ".part"
+	with open(tmpname, "w") as f:
+		json.dump(job, f, indent=1)
+	os.replace(tmpname, jobfile)
+	return job
+
+"""
+Reads a job file
+The mask is a file name or a maskComposition
+"""
+def readJob(jobfile):
+	with open(jobfile) as f:
+		job = json.load(f)
+	for key, value in jobOptions.items():
+		job.setdefault(key, value)
+	if (isinstance(job["mask"], dict)):
+		job["mask"] = maskComposition.fromDescription(job["mask"])
+	return job
+
+"""
+Manifest of shard number shard out of nshards of a job
+Each shard writes its own manifest, so that processes never write in the same file
+"""
+def jobManifestName(jobfile, shard, nshards):
+	return "%s.shard%dof%d.json" % (os.path.splitext(jobfile)[0], shard, nshards)
+
+"""
+Files processed by shard number shard out of nshards (counted from 0)
+"""
+def shardFiles(files, shard, nshards):
+	if ((nshards < 1) or (shard < 0) or (shard >= nshards)):
+		raise ValueError("Invalid shard %d of %d" % (shard, nshards))
+	return files[shard::nshards]
+
+"""
+Records of all shards of a job, whatever their number, as in resultManifest.entries
+If a file was recorded by several shards, records whose outputs are still on disk come first
+"""
+def jobRecords(jobfile):
+	records = {}
+	for name in sorted(glob.glob(glob.escape(os.path.splitext(jobfile)[0]) + ".shard*of*.json")):
+		for key, entry in resultManifest(name).entries.items():
+			if ((key not in records) or all(fileState(output) == state for output, state in entry["outputs"].items())):
+				records[key] = entry
+	return records
+
+"""
+Runs one shard of a job
+
+Files already masked by any shard, with the same mask and options, and whose
+input and outputs did not change, are skipped. A shard that was interrupted
+can be started again and resumes where it stopped.
+
+Parameters:
+- jobfile: job file, see createJob
+- shard, nshards: this process runs shard number shard out of nshards (counted from 0)
+- nproc, verbose, tilebytes: see batchProcess. The memory of each machine is not
+  part of the job.
+
+Returns the results for the files of this shard, see batchProcess
+"""
+def runJob(jobfile, shard=0, nshards=1, nproc=None, verbose=True, tilebytes=None):
+	job = readJob(jobfile)
+	files = shardFiles(job["files"], shard, nshards)
+	# Records of previous runs, with any number of shards, are copied in the manifest of this shard
+	records = jobRecords(jobfile)
+	manifest = resultManifest(jobManifestName(jobfile, shard, nshards))
+	manifest.entries = dict((key, records[key]) for key in files if (key in records))
+	manifest.save()
+	if (verbose):
+		print("Shard %d of %d: %d files out of %d" % (shard+1, nshards, len(files), len(job["files"])))
+	options = dict((key, job[key]) for key in jobOptions)
+	return batchProcess(job["mask"], files, nproc=nproc, verbose=verbose, manifest=manifest.filename, tilebytes=tilebytes, **options)
+
+"""
+Checks one masked file in a worker process: the outputs can be read, have the
+shape of the mask, and all masked pixels are at -1
+Returns a list of problems, empty if everything is fine
+"""
+def _verifyWorker(job):
+	infile, outputs = job
+	problems = []
+	# Thresholds can not be checked without the input data, only mask files are
+	omask = _batchMask.forFrame(None)
+	for output in outputs:
+		try:
+			for index, nframes, data in iterFrames(output):
+				if (data.shape != omask.shape):
+					problems.append("%s: shape %s does not match the mask %s" % (output, data.shape, omask.shape))
+					continue
+				nbad = numpy.count_nonzero(numpy.take(data.ravel(), omask.maskedIndices) != -1)
+				if (nbad > 0):
+					problems.append("%s: %d masked pixels are not at -1" % (output, nbad))
+		except Exception as e:
+			problems.append("%s: can not be read (%s)" % (output, e))
+	return problems
+
+"""
+Final check of a job, once all shards are done
+
+Every input file must have been masked with the mask and options of the job,
+and must not have changed since. Every expected output must exist, be unchanged,
+readable, and have all masked pixels at -1. Files with negative intensities in
+un-masked pixels are listed as warnings.
+
+Parameters:
+- jobfile: job file, see createJob
+- nproc: number of worker processes for reading outputs (default: number of cores)
+- report: file name for a validation report of all files, see writeValidationReport
+
+Returns the list of problems, empty if the job is complete
+"""
+def verifyJob(jobfile, nproc=None, verbose=True, report=None):
+	job = readJob(jobfile)
+	records = jobRecords(jobfile)
+	parameters = parametersHash(job["mask"], job["nrotmask"], job["flipud"], job["fliplr"], job["intensityshift"], job["outputtype"], job["stackmode"], job["saturation"])
+	problems = []
+	checks = []
+	results = []
+	nwarnings = 0
+	for infile in job["files"]:
+		outfile = batchOutputName(infile, job["outdir"], job["suffix"])
+		entry = records.get(infile)
+		if ((entry is None) or (entry["parameters"] != parameters) or (entry["output"] != os.path.abspath(outfile))):
+			problems.append("%s: not masked" % infile)
+			continue
+		if (fileState(infile) != entry["input"]):
+			problems.append("%s: changed since it was masked" % infile)
+			continue
+		changed = [name for name, state in entry["outputs"].items() if (fileState(name) != state)]
+		if (len(changed) > 0):
+			problems.extend(["%s: missing or changed" % name for name in changed])
+			continue
+		if (entry["result"]["nnegative"] > 0):
+			nwarnings += 1
+			if (verbose):
+				print("Warning: %s has %d negative intensities in un-masked pixels" % (infile, entry["result"]["nnegative"]))
+		results.append(entry["result"])
+		checks.append((infile, sorted(entry["outputs"])))
+	if (len(checks) > 0):
+		if (nproc is None):
+			nproc = os.cpu_count() or 1
+		nproc = max(1, min(nproc, len(checks)))
+		initargs = (job["mask"], job["nrotmask"], job["flipud"], job["fliplr"], job["intensityshift"])
+		if (nproc == 1):
+			_batchInit(*initargs)
+			found = map(_verifyWorker, checks)
+		else:
+			pool = multiprocessing.Pool(nproc, initializer=_batchWorkerInit, initargs=(False,)+initargs)
+			found = pool.imap(_verifyWorker, checks, max(1, len(checks) // (4*nproc)))
+		for fileproblems in found:
+			problems.extend(fileproblems)
+		if (nproc > 1):
+			pool.close()
+			pool.join()
+	if (report is not None):
+		writeValidationReport(report, results)
+	if (verbose):
+		for problem in problems:
+			print("Error: %s" % problem, file=sys.stderr)
+		print("Checked %d files: %d problems, %d files with negative intensities" % (len(job["files"]), len(problems), nwarnings))
+	return problems
+
+#################################################################
+#
+# Watching a folder, to mask files as they are written by the detector
+#
+#################################################################
+
+"""
+Watches a folder and masks new files as they appear
+
+The mask is loaded and oriented once in each worker process. New files are
+processed once their size and modification time have not changed for settle
+seconds. At most maxinflight files are sent to the workers at once, the other
+ones wait as file names, so that bursts of files do not fill the memory.
+Results are written atomically, see writeTiff. Files whose output already exists
+are skipped, so that a watcher can be restarted on the same folder.
+
+Parameters:
+- maskfile, nrotmask, flipud, fliplr, intensityshift, saturation, outputtype, stackmode: see batchProcess
+- indir: folder to watch
+- outdir: output folder
+- pattern: only file names matching this pattern are processed
+- suffix: added to input file names to build the output file names
+- nproc: number of worker processes (default: number of cores)
+- settle: time, in seconds, without changes before a file is processed
+- poll: time, in seconds, between two scans of the folder, files are also
+  scanned and sent to the workers as soon as a worker is done
+- maxinflight: maximum number of files sent to workers (default: 2 per worker)
+- retries: number of new attempts for files that could not be processed
+- tilebytes: see batchProcess
+"""
+class folderWatcher:
+	def __init__(self, maskfile, indir, outdir, nrotmask=0, flipud=False, fliplr=False, intensityshift=0., saturation=None, outputtype="auto", stackmode="split", pattern="*.tif", suffix="-masked", nproc=None, settle=0.5, poll=0.2, maxinflight=None, retries=3, tilebytes=None):
+		self.indir = indir
+		self.outdir = outdir
+		self.pattern = pattern
+		self.suffix = suffix
+		self.nproc = max(1, nproc or os.cpu_count() or 1)
+		self.settle = settle
+		self.poll = poll
+		self.maxinflight = maxinflight or 2*self.nproc
+		self.retries = retries
+		self.initargs = (maskfile, nrotmask, flipud, fliplr, intensityshift, saturation, outputtype, stackmode, tilebytes)
+		self.changing = {}		# files not ready yet: name -> (size, mtime, time of last change)
+		self.ready = collections.deque()	# files ready to be processed
+		self.inflight = {}		# files sent to workers: name -> (AsyncResult, mtime)
+		self.finished = threading.Event()	# set by the workers' callbacks when a file is done
+		self.done = set()		# files processed or skipped
+		self.attempts = collections.Counter()
+		self.latencies = collections.deque(maxlen=1000)	# recent delays between file modification and output
+		self.nprocessed = 0
+		self.nerrors = 0
+		self.start = None
+	
+	"""
+	Looks for new or changing files in the folder
+	Files that were removed from the folder are forgotten
+	"""
+	def scan(self):
+		now = time.time()
+		seen = set()
+		with os.scandir(self.indir) as entries:
+			for entry in entries:
+				name = entry.name
+				seen.add(name)
+				if ((name in self.done) or (name in self.inflight) or name.startswith(".") or (not fnmatch.fnmatch(name, self.pattern))):
+					continue
+				try:
+					stat = entry.stat()
+				except OSError:
+					continue
+				previous = self.changing.get(name)
+				if ((previous is None) or (previous[0] != stat.st_size) or (previous[1] != stat.st_mtime)):
+					if ((previous is None) and os.path.exists(batchOutputName(name, self.outdir, self.suffix))):
+						self.done.add(name)
+						continue
+					self.changing[name] = (stat.st_size, stat.st_mtime, now)
+				elif (now - previous[2] >= self.settle):
+					del self.changing[name]
+					self.ready.append((name, stat.st_mtime))
+					self.done.add(name)
+		# Otherwise these grow forever in a folder where files are moved away once masked
+		self.done &= seen
+		for name in [name for name in self.changing if (name not in seen)]:
+			del self.changing[name]
+		for name in [name for name in self.attempts if (name not in seen)]:
+			del self.attempts[name]
+	
+	"""
+	Sends ready files to the workers, without exceeding maxinflight
+	"""
+	def submit(self, pool):
+		while ((len(self.ready) > 0) and (len(self.inflight) < self.maxinflight)):
+			name, mtime = self.ready.popleft()
+			job = (os.path.join(self.indir, name), batchOutputName(name, self.outdir, self.suffix))
+			self.inflight[name] = (pool.apply_async(_batchWorker, (job,), callback=self.workerDone, error_callback=self.workerDone), mtime)
+	
+	"""
+	Called by the pool when a worker is done with a file, wakes up run
+	"""
+	def workerDone(self, result):
+		self.finished.set()
+	
+	"""
+	Collects results from the workers
+	Returns the list of results, see _batchWorker
+	"""
+	def collect(self):
+		results = []
+		for name in [name for name, (async_result, mtime) in self.inflight.items() if async_result.ready()]:
+			async_result, mtime = self.inflight.pop(name)
+			result = _collectProfile(async_result.get())
+			if (result["error"] is None):
+				self.nprocessed += 1
+				self.latencies.append(time.time() - mtime)
+			else:
+				self.attempts[name] += 1
+				if (self.attempts[name] <= self.retries):
+					# Probably not completely written yet, wait for another change
+					self.done.discard(name)
+					continue
+				self.nerrors += 1
+				print("Error with %s: %s" % (result["file"], result["error"]), file=sys.stderr)
+			results.append(result)
+		return results
+	
+	"""
+	Current state: number of processed files and errors, backlog, latency (in seconds)
+	and throughput (in files/s)
+	"""
+	def metrics(self):
+		latencies = numpy.array(self.latencies) if (len(self.latencies) > 0) else numpy.zeros(1)
+		elapsed = time.time() - self.start if (self.start is not None) else 0.
+		return {"processed": self.nprocessed, "errors": self.nerrors, "backlog": len(self.changing) + len(self.ready) + len(self.inflight), "waiting": len(self.changing), "ready": len(self.ready), "inflight": len(self.inflight), "latencymean": float(latencies.mean()), "latencymax": float(latencies.max()), "latencylast": float(latencies[-1]), "throughput": self.nprocessed/elapsed if (elapsed > 0) else 0., "elapsed": elapsed}
+	
+	"""
+	Watches the folder until stop is set, duration seconds have passed, or Ctrl-C
+	
+	Parameters:
+	- duration: maximum time, in seconds (default: no limit)
+	- stop: threading.Event to stop watching
+	- statusinterval: time, in seconds, between two status lines (None for no status)
+	- metricsfile: if set, metrics are saved in this JSON file at each status update
+	"""
+	def run(self, duration=None, stop=None, statusinterval=10., metricsfile=None):
+		if (not os.path.isdir(self.outdir)):
+			os.makedirs(self.outdir)
+		self.start = time.time()
+		laststatus = self.start
+		pool = multiprocessing.Pool(self.nproc, initializer=_batchWorkerInit, initargs=(profiler.enabled,)+self.initargs)
+		try:
+			while (True):
+				self.scan()
+				self.submit(pool)
+				self.collect()
+				now = time.time()
+				if ((statusinterval is not None) and (now - laststatus >= statusinterval)):
+					laststatus = now
+					self.status(metricsfile)
+				if (((stop is not None) and stop.is_set()) or ((duration is not None) and (now - self.start >= duration))):
+					break
+				# Waits for the next poll, or less if a worker is done, so that
+				# files ready to be processed are sent to it right away
+				if (self.finished.wait(self.poll)):
+					self.finished.clear()
+		except KeyboardInterrupt:
+			pass
+		finally:
+			pool.close()
+			# Finish files already sent to workers
+			while (len(self.inflight) > 0):
+				self.collect()
+				time.sleep(0.01)
+			pool.join()
+		if (statusinterval is not None):
+			self.status(metricsfile)
+		return self.metrics()
+	
+	"""
+	Prints the current metrics and saves them in metricsfile if set
+	"""
+	def status(self, metricsfile=None):
+		m = self.metrics()
+		print("%d files masked, %d errors, backlog %d (%d in progress), latency %.2f s (max %.2f s), %.1f files/s" % (m["processed"], m["errors"], m["backlog"], m["inflight"], m["latencymean"], m["latencymax"], m["throughput"]))
+		if (metricsfile is not None):
+			tmpname = metricsfile + ".part"
+			with open(tmpname, "w") as f:
+				json.dump(m, f, indent=1)
+			os.replace(tmpname, metricsfile)
+
+#################################################################
+#
+# Main subroutines
+#
+#################################################################
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Prepares tiff files for MAUD: sets a -1 intensity at all masked pixels.\n\nWithout input files, starts the graphical interface.\nWith input files, masks all of them in batch mode, without graphical interface.", formatter_class=RawTextHelpFormatter)
+	parser.add_argument('files', nargs='*', help="input files or glob patterns, e.g. 'data/*.tif' (batch mode)")
+	parser.add_argument('-m', '--mask', action='append', default=None, help="mask file, from Dioptas for instance (batch mode). Repeat to combine several masks,\neach one with its own options: -m gaps.mask -m beamstop.mask,rotate=1,flipud")
+	parser.add_argument('--combine', default="union", choices=combineModes, help="with several masks, mask pixels masked in any of them (union, default)\nor in all of them (intersection)")
+	parser.add_argument('--mask-above', type=float, default=None, dest='maskabove', help="also mask pixels with intensities above this value (saturated pixels)")
+	parser.add_argument('--mask-nonpositive', action='store_true', dest='masknonpositive', help="also mask pixels with intensities at or below zero (dead pixels)")
+	parser.add_argument('-r', '--rotate', type=int, default=0, dest='nrotmask', help="number of 90° rotations on mask (default: 0)")
+	parser.add_argument('--flipud', action='store_true', help="flip mask vertically")
+	parser.add_argument('--fliplr', action='store_true', help="flip mask horizontally")
+	parser.add_argument('-s', '--shift', type=float, default=0., dest='intensityshift', help="shift to add to all intensities (default: 0)")
+	parser.add_argument('-t', '--type', default="auto", choices=outputTypes, dest='outputtype', help="data type of masked files (default: auto, int32 for integer data\nand integer intensity shifts if the shifted intensities of un-masked pixels\nfit in int32, float32 otherwise)")
+	parser.add_argument('--stack', default="split", choices=stackModes, dest='stackmode', help="output for files with several frames: one file per frame (split, default)\nor a multi-page tiff (multi)")
+	parser.add_argument('-o', '--outdir', default=None, help="output directory (default: same as input files)")
+	parser.add_argument('--suffix', default="-masked", help="suffix for output file names (default: -masked)")
+	parser.add_argument('-j', '--nproc', type=int, default=None, help="number of worker processes (default: number of cores)")
+	parser.add_argument('--report', default=None, help="save a validation report for each file, in CSV (.csv) or JSON (other extensions)")
+	parser.add_argument('--saturation', type=float, default=None, help="intensity of saturated pixels, for the report (default: largest value for integer data)")
+	parser.add_argument('--validate-only', action='store_true', dest='validateonly', help="validate input files, but do not write masked files")
+	parser.add_argument('--auto-orient', action='store_true', dest='autoorient', help="find the orientation of the mask from the first input file and use it")
+	parser.add_argument('-w', '--watch', default=None, metavar='INDIR', help="watch folder INDIR and mask new files as they appear (needs -o)")
+	parser.add_argument('--pattern', default="*.tif", help="in watch mode, only process files matching this pattern (default: *.tif)")
+	parser.add_argument('--settle', type=float, default=0.5, help="in watch mode, time in seconds without changes before a file is processed (default: 0.5)")
+	parser.add_argument('--metrics', default=None, help="in watch mode, save latency and backlog metrics in this JSON file")
+	parser.add_argument('-i', '--incremental', action='store_true', help="only process files whose contents, mask or options changed since the last run")
+	parser.add_argument('--manifest', default=None, help="manifest of previous runs, for --incremental\n(default: maskTiff4Maud-manifest.json in the output directory)")
+	parser.add_argument('--create-job', default=None, dest='createjob', metavar='JOB', help="save input files, mask and options in job file JOB, to run it later with --job")
+	parser.add_argument('--job', default=None, metavar='JOB', help="run job file JOB, or the part of it given by --shard")
+	parser.add_argument('--shard', default="1/1", metavar='I/N', help="with --job, only process part I of N (default: 1/1, all files)")
+	parser.add_argument('--verify', action='store_true', help="with --job, check that all outputs of the job exist and are correctly masked")
+	parser.add_argument('--bad-pixels', default=None, dest='badpixels', metavar='MASK', help="build a mask of bad detector pixels from statistics over all frames of the\ninput files, and save it in MASK (uses --saturation)")
+	parser.add_argument('--nsigma', type=float, default=8., help="with --bad-pixels, threshold for pixels differing from their neighbours (default: 8)")
+	parser.add_argument('--check-orientation', action='store_true', dest='checkorientation', help="stop if the orientation of the mask does not match the first input file")
+	parser.add_argument('--sidecar', action='store_true', help="save a small .mask.json file next to each output, with the masked pixels,\nthe mask options and the validation results")
+	parser.add_argument('--shared-sidecar', default=None, dest='sharedsidecar', metavar='FILE', help="save the masked pixels, mask options and validation results of all files in FILE")
+	parser.add_argument('--tile-budget', type=float, default=None, dest='tilebudget', metavar='MB', help="mask images larger than MB megabytes by blocks of rows of that size, without\nloading them in memory (uncompressed single-frame TIFF only, others are masked in memory)")
+	parser.add_argument('--profile', default=None, metavar='FILE', help="measure time, bytes and peak memory of each stage of each file, and save them in FILE\nwhen done: CSV (.csv), Chrome trace (.trace or .trace.json) or JSON (other extensions)")
+	args = parser.parse_args()
+	tilebytes = None if (args.tilebudget is None) else int(args.tilebudget*2**20)
+	
+	"""
+	Saves the profile and prints totals for each stage, when the program ends
+	"""
+	def saveProfile():
+		profiler.export(args.profile)
+		profiler.printSummary()
+		print("Profile of %d stages saved in %s" % (len(profiler.records), args.profile))
+	
+	if (args.profile is not None):
+		profiler.enable()
+		atexit.register(saveProfile)
+	
+	"""
+	Mask file or composition from the command line options
+	"""
+	def maskArgument():
+		try:
+			return maskFromArguments(args.mask, args.nrotmask, args.flipud, args.fliplr, args.combine, args.maskabove, args.masknonpositive)
+		except ValueError as e:
+			parser.error("%s" % e)
+	
+	if (args.watch is not None):
+		# Watch mode, no need for a display
+		if ((args.mask is None) or (args.outdir is None)):
+			parser.error("a mask file and an output directory are needed in watch mode")
+		if (os.path.abspath(args.outdir) == os.path.abspath(args.watch)):
+			parser.error("output directory must be different from the watched folder")
+		watcher = folderWatcher(maskArgument(), args.watch, args.outdir, nrotmask=args.nrotmask, flipud=args.flipud, fliplr=args.fliplr, intensityshift=args.intensityshift, saturation=args.saturation, outputtype=args.outputtype, stackmode=args.stackmode, pattern=args.pattern, suffix=args.suffix, nproc=args.nproc, settle=args.settle, tilebytes=tilebytes)
+		print("Watching %s, Ctrl-C to stop" % args.watch)
+		watcher.run(metricsfile=args.metrics)
+		sys.exit(0)
+	
+	if (args.job is not None):
+		# Job shared between several processes or machines
+		if (args.verify):
+			problems = verifyJob(args.job, nproc=args.nproc, report=args.report)
+			sys.exit(1 if (len(problems) > 0) else 0)
+		try:
+			shard, nshards = [int(n) for n in args.shard.split("/")]
+			shardFiles([], shard-1, nshards)
+		except ValueError:
+			parser.error("invalid shard %s, should be I/N with 1 <= I <= N" % args.shard)
+		results = runJob(args.job, shard-1, nshards, nproc=args.nproc, tilebytes=tilebytes)
+		nerrors = len([r for r in results if r["error"] is not None])
+		sys.exit(1 if (nerrors > 0) else 0)
+	
+	if (args.badpixels is not None):
+		files = expandInputFiles(args.files)
+		if (len(files) == 0):
+			parser.error("no input file found")
+		badPixelMask(files, args.badpixels, args.saturation, args.nsigma)
+		sys.exit(0)
+	
+	if (len(args.files) > 0):
+		# Batch mode, no need for a display
+		if (args.mask is None):
+			parser.error("a mask file is needed in batch mode")
+		if (args.incremental and args.validateonly):
+			parser.error("--incremental records masked files, it can not be used with --validate-only")
+		files = expandInputFiles(args.files, args.suffix)
+		if (len(files) == 0):
+			parser.error("no input file found")
+		if (not args.validateonly):
+			try:
+				checkOutputNames(files, args.outdir, args.suffix)
+			except ValueError as e:
+				parser.error("%s" % e)
+		if (args.autoorient or args.checkorientation):
+			# With several masks, the first one is used
+			maskdata = fabio.open(args.mask[0].split(",")[0]).data
+			with profiler.stage("autoorient", files[0]):
+				orientation = autoOrientMask(fabio.open(files[0]).data, maskdata)
+			print("Best mask orientation for %s: %d rotations, vertical flip %s, horizontal flip %s (confidence %.2f)" % (files[0], orientation["nrotmask"], orientation["flipud"], orientation["fliplr"], orientation["confidence"]))
+			if (args.autoorient):
+				args.nrotmask, args.flipud, args.fliplr = orientation["nrotmask"], orientation["flipud"], orientation["fliplr"]
+			else:
+				best = orientMask(maskdata, orientation["nrotmask"], orientation["flipud"], orientation["fliplr"])
+				current = orientMask(maskdata, args.nrotmask, args.flipud, args.fliplr)
+				if ((best.shape != current.shape) or (not numpy.array_equal(best, current))):
+					print("Error: mask orientation does not match the data", file=sys.stderr)
+					sys.exit(2)
+		mask = maskArgument()
+		if (args.createjob is not None):
+			createJob(args.createjob, mask, files, outdir=args.outdir, suffix=args.suffix, nrotmask=args.nrotmask, flipud=args.flipud, fliplr=args.fliplr, intensityshift=args.intensityshift, outputtype=args.outputtype, stackmode=args.stackmode, saturation=args.saturation)
+			print("Job with %d files saved in %s" % (len(files), args.createjob))
+			sys.exit(0)
+		manifest = None
+		if (args.incremental):
+			manifest = args.manifest or os.path.join(args.outdir or ".", "maskTiff4Maud-manifest.json")
+		results = batchProcess(mask, files, outdir=args.outdir, nrotmask=args.nrotmask, flipud=args.flipud, fliplr=args.fliplr, intensityshift=args.intensityshift, nproc=args.nproc, suffix=args.suffix, saturation=args.saturation, validateonly=args.validateonly, report=args.report, outputtype=args.outputtype, stackmode=args.stackmode, manifest=manifest, tilebytes=tilebytes, sidecar=args.sidecar, sharedsidecar=args.sharedsidecar)
+		nerrors = len([r for r in results if r["error"] is not None])
+		sys.exit(1 if (nerrors > 0) else 0)
+	
+	# Prepare to plot... Qt and matplotlib are only loaded now
+	# The GUI imports maskTiff4Maud: it must get this module, not a second copy
+	# with its own profiler and caches
+	sys.modules["maskTiff4Maud"] = sys.modules[__name__]
+	import maskTiff4MaudGui
+	maskTiff4MaudGui.startGui(sys.argv)